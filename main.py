@@ -1,13 +1,23 @@
 import os
+import asyncio
 import logging
 import pandas as pd
-import sqlalchemy as sa
+import great_expectations.expectations as gxe
+
+from typing import Dict, Iterator
 
 from src.utils.data_extractor import TaxiDataExtractor
 from src.utils.data_loader import DataLoader
+from src.utils.data_cache import ParquetDataCache
+from src.utils.data_downloader import RangedDownloader
+from src.utils.watermark import WatermarkStore
+from src.utils.staging_table import StagingTableManager
+from src.utils.load_manifest import LoadManifest
+from src.utils.engine_registry import EngineRegistry
 from src.great_expectations_checker.postgres_checker import (
     GreatExpectationsPostgresChecker,
 )
+from src.great_expectations_checker.streaming_validator import StreamingValidator
 from src.config.config import (
     URL,
     CONTEXT_MODE,
@@ -15,54 +25,255 @@ from src.config.config import (
     BATCH_DEFINITION,
     SUITE_NAME,
     SITE_CONFIG,
+    CHUNK_SIZE,
+    TAXI_SCHEMA,
+    INCREMENTAL,
+    LOAD_WORKERS,
+    STAGE_SCHEMA,
+    IDEMPOTENT_PROMOTION,
+    ROW_HASH_COLUMN,
+    PARTITIONED_PROMOTION,
+    PARTITION_COLUMN,
+    SQL_PUSHDOWN,
+    SAMPLING,
+    VALIDATION_PARTITION,
+    STREAMING_VALIDATION,
+    ASYNC_PIPELINE,
+    PIPELINE_QUEUE_SIZE,
 )
 
 logger: logging.Logger = logging.getLogger("class Main")
 
 
-def load_taxi_data(url: str) -> pd.DataFrame:
+def load_taxi_data(
+    url: str, chunksize: int | None = None, watermark: pd.Timestamp | None = None
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
     """
     Load data from the provided URL and return as a pandas DataFrame.
 
     Args:
         url (str): The URL of the taxi data to be loaded.
+        chunksize (int | None, optional): When set, the data is streamed lazily in chunks
+        of this many rows instead of being loaded at once. Defaults to None.
+        watermark (pd.Timestamp | None, optional): Only rows with a `pickup_datetime`
+        after this mark are extracted. Defaults to None.
 
     Returns:
-        pd.DataFrame: The loaded taxi data as a pandas DataFrame.
+        pd.DataFrame | Iterator[pd.DataFrame]: The loaded taxi data as a pandas DataFrame,
+        or an iterator of DataFrame chunks when `chunksize` is set.
     """
     logger.info("Extracting taxi data from URL: %s", url)
-    extractor = TaxiDataExtractor(url)
+    extractor = TaxiDataExtractor(
+        url,
+        cache=ParquetDataCache(),
+        schema=TAXI_SCHEMA,
+        downloader=RangedDownloader(),
+        watermark=watermark,
+    )
+    if chunksize:
+        return extractor.iter_chunks(chunksize=chunksize)
+
     extractor.load_data()
     return extractor.get_data()
 
 
-def load_data_to_sql(df: pd.DataFrame) -> DataLoader:
+def load_data_to_sql(
+    df: pd.DataFrame | Iterator[pd.DataFrame],
+    table_name: str,
+    manifest: LoadManifest | None = None,
+) -> DataLoader:
     """
     Load DataFrame into SQL staging table.
 
     Args:
-        df (pd.DataFrame): The dataframe containing the taxi data to be loaded.
+        df (pd.DataFrame | Iterator[pd.DataFrame]): The dataframe, or iterator of dataframe
+        chunks, containing the taxi data to be loaded.
+        table_name (str): The staging table of the run, created beforehand.
+        manifest (LoadManifest | None, optional): The manifest of the staging table, to
+        resume an interrupted load. Defaults to None.
 
     Returns:
         DataLoader: The data loader object responsible for managing data loading to SQL.
     """
     logger.info("Loading data into staging SQL table...")
-    data_loader = DataLoader(df)
+    data_loader = DataLoader(df, manifest)
     data_loader.write_to_sql(
-        table_name="stg_taxi_data",
-        schema="stage",
+        table_name=table_name,
+        schema=STAGE_SCHEMA,
         if_exists="append",
         index=False,
+        bulk=True,
+        workers=LOAD_WORKERS,
+        hash_column=ROW_HASH_COLUMN if IDEMPOTENT_PROMOTION else None,
     )
+    # Promotion runs on the database server, so the staged data is released here.
+    data_loader.df = None
     return data_loader
 
 
-def run_expectations() -> bool:
+def precheck_chunk(chunk: pd.DataFrame) -> Dict[str, int]:
+    """
+    Runs cheap checks on a chunk while it is being loaded.
+
+    Args:
+        chunk (pd.DataFrame): The extracted rows.
+
+    Returns:
+        Dict[str, int]: The number of missing values of each column.
+
+    Raises:
+        ValueError: If the chunk lacks columns of `TAXI_SCHEMA`.
+    """
+    missing = [column for column in TAXI_SCHEMA if column not in chunk.columns]
+    if missing:
+        raise ValueError(f"Chunk is missing columns: {', '.join(missing)}")
+    return chunk[list(TAXI_SCHEMA)].isna().sum().to_dict()
+
+
+def streaming_expectations() -> list:
+    """
+    Defines the expectations checked on each chunk while the file is extracted.
+
+    They are all critical: a chunk whose columns or dtypes differ from `TAXI_SCHEMA`,
+    or with a null `vendor_id`, aborts the run before the rest of the file is loaded.
+
+    Returns:
+        list: The expectations, see `StreamingValidator`.
+    """
+    return [
+        gxe.ExpectTableColumnsToMatchOrderedList(column_list=list(TAXI_SCHEMA)),
+        *(
+            gxe.ExpectColumnValuesToBeOfType(
+                column=column, type_=pd.api.types.pandas_dtype(dtype).type.__name__
+            )
+            for column, dtype in TAXI_SCHEMA.items()
+        ),
+        gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"),
+    ]
+
+
+async def _extract_chunks(
+    chunks: Iterator[pd.DataFrame], queue: asyncio.Queue, consumers: int
+) -> None:
+    """
+    Pulls chunks from the extractor in a worker thread and queues them.
+
+    Downloading and parsing happen inside the iterator, so they run off the event
+    loop. The bounded queue blocks the extractor while the loaders are busy.
+
+    Args:
+        chunks (Iterator[pd.DataFrame]): The extracted chunks.
+        queue (asyncio.Queue): The queue feeding the loaders.
+        consumers (int): The number of loaders, each receiving an end marker.
+    """
+    position, row_offset = 0, 0
+    while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+        await queue.put((position, row_offset, chunk))
+        position += 1
+        row_offset += len(chunk)
+    for _ in range(consumers):
+        await queue.put(None)
+
+
+async def _load_chunks(
+    queue: asyncio.Queue, data_loader: DataLoader, table_name: str, report: Dict
+) -> None:
+    """
+    Loads and pre-checks queued chunks concurrently until the end marker.
+
+    Args:
+        queue (asyncio.Queue): The queue of `(position, row_offset, chunk)` items.
+        data_loader (DataLoader): The loader writing the chunks.
+        table_name (str): The staging table of the run.
+        report (Dict): Accumulates the `rows` written and the `nulls` per column.
+    """
+    while (item := await queue.get()) is not None:
+        position, row_offset, chunk = item
+        rows, nulls = await asyncio.gather(
+            asyncio.to_thread(
+                data_loader.write_chunk,
+                position,
+                chunk,
+                table_name,
+                row_offset=row_offset,
+                schema=STAGE_SCHEMA,
+                if_exists="append",
+                index=False,
+                bulk=True,
+                hash_column=ROW_HASH_COLUMN if IDEMPOTENT_PROMOTION else None,
+            ),
+            asyncio.to_thread(precheck_chunk, chunk),
+        )
+        report["rows"] += rows
+        for column, count in nulls.items():
+            report["nulls"][column] = report["nulls"].get(column, 0) + count
+
+
+async def load_data_to_sql_async(
+    df: pd.DataFrame | Iterator[pd.DataFrame],
+    table_name: str,
+    manifest: LoadManifest | None = None,
+) -> DataLoader:
+    """
+    Load data into the SQL staging table with overlapped extract, load and pre-check stages.
+
+    One task pulls chunks from the extractor into a bounded queue while `LOAD_WORKERS`
+    tasks write them over pooled connections and pre-check them, so the network, the
+    CPU and the database work at the same time.
+
+    Args:
+        df (pd.DataFrame | Iterator[pd.DataFrame]): The dataframe, or iterator of dataframe
+        chunks, containing the taxi data to be loaded.
+        table_name (str): The staging table of the run, created beforehand.
+        manifest (LoadManifest | None, optional): The manifest of the staging table, to
+        resume an interrupted load. Defaults to None.
+
+    Returns:
+        DataLoader: The data loader object responsible for managing data loading to SQL.
+    """
+    logger.info("Loading data into staging SQL table (async pipeline)...")
+    chunks = iter([df]) if isinstance(df, pd.DataFrame) else df
+    data_loader = DataLoader(chunks, manifest)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    report: Dict = {"rows": 0, "nulls": {}}
+
+    tasks = [
+        asyncio.create_task(_extract_chunks(chunks, queue, LOAD_WORKERS)),
+        *(
+            asyncio.create_task(_load_chunks(queue, data_loader, table_name, report))
+            for _ in range(LOAD_WORKERS)
+        ),
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    data_loader.rows_written = report["rows"]
+    data_loader.df = None
+    logger.info(
+        "%s rows staged, missing values: %s.",
+        report["rows"],
+        {column: count for column, count in report["nulls"].items() if count},
+    )
+    return data_loader
+
+
+def run_expectations(table_name: str) -> bool:
     """
     Run Great Expectations checks and generate data docs.
 
     This function validates the data in the PostgreSQL database using Great Expectations
-    and generates data docs.
+    and generates data docs. With `SQL_PUSHDOWN`, the suite is evaluated by one aggregate
+    query instead of the checkpoint; with `SAMPLING`, on a sample of the table first. With
+    `VALIDATION_PARTITION`, each day or month of `PARTITION_COLUMN` is validated
+    concurrently and reported on its own.
+
+    Args:
+        table_name (str): The staging table of the run to validate.
 
     Returns:
         bool: Whether the expectations were met (True) or failed (False).
@@ -78,48 +289,78 @@ def run_expectations() -> bool:
 
     ge_checker = GreatExpectationsPostgresChecker(CONTEXT_MODE)
     ge_checker.set_data_source("taxi_data_source", connection_string)
-    ge_checker.set_data_asset("postgres_stg_taxi_data", "stg_taxi_data", "stage")
-    ge_checker.set_data_docs_site(SITE_NAME, SITE_CONFIG)
-    ge_checker.set_batch_definition(BATCH_DEFINITION)
-    ge_checker.set_suite(SUITE_NAME)
-
-    ge_checker.create_expectations()
-    result = ge_checker.run_checkpoint(SITE_NAME)
-
-    if result.success:
-        logger.info("✅ Great Expectations validation passed.")
-    else:
-        logger.warning("❌ Great Expectations validation failed.")
-
-    ge_checker.generate_data_docs(SITE_NAME)
+    ge_checker.set_data_asset("postgres_stg_taxi_data", table_name, STAGE_SCHEMA)
+    try:
+        ge_checker.set_data_docs_site(SITE_NAME, SITE_CONFIG)
+        if VALIDATION_PARTITION:
+            ge_checker.set_partitioned_batch_definition(
+                f"{BATCH_DEFINITION}_{VALIDATION_PARTITION}", VALIDATION_PARTITION
+            )
+        else:
+            ge_checker.set_batch_definition(BATCH_DEFINITION)
+        ge_checker.set_suite(SUITE_NAME)
+
+        ge_checker.create_expectations()
+        if VALIDATION_PARTITION:
+            result = ge_checker.run_partitioned(SITE_NAME)
+        elif SAMPLING:
+            result = ge_checker.run_sampled()
+        elif SQL_PUSHDOWN:
+            result = ge_checker.run_pushdown()
+        else:
+            result = ge_checker.run_checkpoint(SITE_NAME)
+
+        if result.success:
+            logger.info("✅ Great Expectations validation passed.")
+        else:
+            logger.warning("❌ Great Expectations validation failed.")
+
+        ge_checker.generate_data_docs(SITE_NAME)
+    finally:
+        ge_checker.drop_data_asset()
 
     return result.success
 
 
-def validate_expectations(data_loader: DataLoader, expectations_passed: bool):
+def validate_expectations(
+    data_loader: DataLoader, expectations_passed: bool, table_name: str
+):
     """
     Validate expectations and move data accordingly.
 
+    With `IDEMPOTENT_PROMOTION`, rows already in production (same row hash) are
+    skipped, so re-running the pipeline for the same file adds no duplicates. With
+    `PARTITIONED_PROMOTION`, new months are published by attaching a monthly
+    partition. A failed run keeps its staging table for inspection until
+    `StagingTableManager.cleanup_orphans` removes it.
+
     Args:
         data_loader (DataLoader): The data loader object responsible for loading data into SQL.
         expectations_passed (bool): Whether the data has passed the validation expectations.
+        table_name (str): The staging table of the run.
 
     Raises:
         ValueError: If expectations failed, a ValueError is raised to stop the pipeline.
     """
     if expectations_passed:
         logger.info("✅ Expectations passed. Moving data to production table...")
-        data_loader.write_to_sql(
-            table_name="taxi_data",
-            schema="production",
-            if_exists="append",
-            index=False,
+        promotion = dict(
+            source_table=table_name,
+            source_schema=STAGE_SCHEMA,
+            target_table="taxi_data",
+            target_schema="production",
+            columns=[*TAXI_SCHEMA, ROW_HASH_COLUMN],
+            conflict_columns=(
+                [ROW_HASH_COLUMN, PARTITION_COLUMN] if IDEMPOTENT_PROMOTION else None
+            ),
         )
-
-        logger.info("🗑️ Dropping staging table: stage.stg_taxi_data...")
-        with data_loader.engine.connect() as connection:
-            connection.execute(sa.text("DROP TABLE IF EXISTS stage.stg_taxi_data;"))
-        logger.info("✅ Staging table dropped successfully.")
+        if PARTITIONED_PROMOTION:
+            data_loader.promote_partitioned(
+                partition_column=PARTITION_COLUMN, **promotion
+            )
+        else:
+            data_loader.promote(**promotion)
+        logger.info("✅ Staging table promoted and dropped successfully.")
 
     else:
         logger.error("❌ Expectations failed! Opening validation report.")
@@ -127,23 +368,69 @@ def validate_expectations(data_loader: DataLoader, expectations_passed: bool):
         raise ValueError("Data validation failed! Please review your expectations.")
 
 
-def main():
+def main(run_id: str | None = None):
     """
     Main execution pipeline.
 
     This function orchestrates the extraction, loading, validation, and migration of taxi data,
-    executing the full data pipeline, and handling any exceptions that may occur.
+    executing the full data pipeline, and handling any exceptions that may occur. With
+    `STREAMING_VALIDATION`, each chunk is also validated as it is extracted, and a hard
+    failure stops the load before the rest of the file is staged.
+
+    Args:
+        run_id (str | None, optional): The id naming the staging table of the run, e.g. the
+        Airflow `run_id`. Defaults to None, which generates one. A retried run keeps its
+        staging table and resumes its load after the last committed chunk.
     """
     try:
-        df = load_taxi_data(URL)
-        data_loader = load_data_to_sql(df)
-        expectations_passed = run_expectations()
-        validate_expectations(data_loader, expectations_passed)
+        staging = StagingTableManager()
+        staging.cleanup_orphans()
+        stage_table = staging.create(run_id or StagingTableManager.new_run_id())
+        manifest = LoadManifest(stage_table)
+
+        watermark_store = WatermarkStore() if INCREMENTAL else None
+        watermark = watermark_store.get() if watermark_store else None
+
+        df = load_taxi_data(URL, CHUNK_SIZE, watermark=watermark)
+        streaming = None
+        if STREAMING_VALIDATION:
+            streaming = StreamingValidator(streaming_expectations())
+            df = streaming.iter_validated(
+                iter([df]) if isinstance(df, pd.DataFrame) else df
+            )
+        if ASYNC_PIPELINE:
+            data_loader = asyncio.run(load_data_to_sql_async(df, stage_table, manifest))
+        else:
+            data_loader = load_data_to_sql(df, stage_table, manifest)
+        del df
+        if streaming:
+            streamed = streaming.result()
+            logger.info(
+                "Streaming validation of %s chunks: %s of %s expectations passed.",
+                streaming.chunks,
+                streamed.statistics["successful_expectations"],
+                streamed.statistics["evaluated_expectations"],
+            )
+        if watermark_store and data_loader.rows_written == 0:
+            logger.info("No rows newer than the watermark %s.", watermark)
+            staging.drop(stage_table)
+            manifest.clear()
+            return
+
+        expectations_passed = run_expectations(stage_table)
+        validate_expectations(data_loader, expectations_passed, stage_table)
+        manifest.clear()
+
+        if watermark_store:
+            watermark_store.refresh()
 
     except Exception as e:
         logger.exception("🚨 Error in pipeline execution: %s", e)
         raise
 
+    finally:
+        logger.info("Connection pool stats: %s", EngineRegistry.stats())
+
 
 if __name__ == "__main__":
     main()
@@ -18,5 +18,10 @@ CREATE TABLE production.taxi_data (
     tolls_amount REAL NOT NULL,
     improvement_surcharge REAL NOT NULL,
     total_amount REAL NOT NULL,
-    congestion_surcharge REAL
+    congestion_surcharge REAL,
+    row_hash UUID
 );
+
+-- The unique index includes pickup_datetime so the same conflict columns work once the
+-- table is partitioned by scripts/partition_production_taxi_data.sql.
+CREATE UNIQUE INDEX taxi_data_row_hash_idx ON production.taxi_data (row_hash, pickup_datetime);
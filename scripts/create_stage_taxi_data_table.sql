@@ -18,5 +18,6 @@ CREATE TABLE stage.stg_taxi_data (
     tolls_amount REAL NOT NULL,
     improvement_surcharge REAL NOT NULL,
     total_amount REAL NOT NULL,
-    congestion_surcharge REAL
+    congestion_surcharge REAL,
+    row_hash UUID
 );
@@ -0,0 +1,42 @@
+-- Converts production.taxi_data into a table range-partitioned by month on
+-- pickup_datetime, as required before setting PARTITIONED_PROMOTION.
+-- Each month already loaded gets its partition (e.g. production.taxi_data_2019_01);
+-- later months are created and attached by DataLoader.promote_partitioned.
+-- Every row is copied in one transaction: run it while no pipeline is loading.
+
+BEGIN;
+
+ALTER TABLE production.taxi_data RENAME TO taxi_data_heap;
+ALTER INDEX production.taxi_data_row_hash_idx RENAME TO taxi_data_heap_row_hash_idx;
+
+CREATE TABLE production.taxi_data (
+    LIKE production.taxi_data_heap INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+) PARTITION BY RANGE (pickup_datetime);
+
+-- A unique index on a partitioned table must include the partition key.
+CREATE UNIQUE INDEX taxi_data_row_hash_idx ON production.taxi_data (row_hash, pickup_datetime);
+
+DO $$
+DECLARE
+    month TIMESTAMP;
+BEGIN
+    FOR month IN
+        SELECT DISTINCT date_trunc('month', pickup_datetime)
+        FROM production.taxi_data_heap
+        ORDER BY 1
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE production.%I PARTITION OF production.taxi_data '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'taxi_data_' || to_char(month, 'YYYY_MM'),
+            month,
+            month + INTERVAL '1 month'
+        );
+    END LOOP;
+END $$;
+
+INSERT INTO production.taxi_data SELECT * FROM production.taxi_data_heap;
+
+DROP TABLE production.taxi_data_heap;
+
+COMMIT;
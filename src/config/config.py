@@ -7,8 +7,83 @@ DATA_SOURCE: str = "pandas"
 DATA_ASSET_NAME: str = "Taxi Asset"
 SITE_NAME: str = "taxi_site"
 BASE_DIRECTORY: str = "uncommitted/data_docs/local_site/"
+DOCS_BACKGROUND_BUILD: bool = False
 BATCH_DEFINITION: str = "taxi_batch_definition"
 SUITE_NAME: str = "taxi_suite_checks"
+SQL_PUSHDOWN: bool = False
+GX_CONFIG_DIR: str = "gx/"
+FAST_PATH_WORKERS: int = 4
+FAST_PATH_PARALLEL_ROWS: int = 2_000_000
+STREAMING_VALIDATION: bool = False
+SAMPLING: bool = False
+SAMPLE_METHOD: str = "BERNOULLI"
+SAMPLE_PERCENT: float = 1.0
+SAMPLE_CONFIDENCE: float = 0.95
+SAMPLE_SEED: int | None = None
+SAMPLE_BLOCK_ROWS: int = 8_192
+RESULT_FORMAT: str = "SUMMARY"
+UNEXPECTED_SAMPLE_CAP: int = 20
+UNEXPECTED_PAGE_SIZE: int = 1_000
+VALIDATION_PARTITION: str | None = None
+VALIDATION_WORKERS: int = 4
+CHUNK_SIZE: int | None = 50_000
+MAX_DOWNLOAD_WORKERS: int = 4
+MAX_PARSE_WORKERS: int = 2
+MAX_BYTES_IN_FLIGHT: int = 2 * 1024**3
+DOWNLOAD_DIR: str = "downloads/"
+DOWNLOAD_PART_SIZE: int = 64 * 1024**2
+DOWNLOAD_WORKERS: int = 4
+DOWNLOAD_RETRIES: int = 3
+DOWNLOAD_MAX_BYTES: int = 10 * 1024**3
+DOWNLOAD_MAX_AGE_SECONDS: int = 7 * 24 * 60 * 60
+BULK_CHUNK_SIZE: int = 100_000
+LOAD_WORKERS: int = 4
+LOAD_RETRIES: int = 3
+STAGE_SCHEMA: str = "stage"
+STAGE_TABLE_PREFIX: str = "stg_taxi_data"
+STAGE_DDL_FILE: str = "scripts/create_stage_taxi_data_table.sql"
+STAGE_MAX_AGE_SECONDS: int = 24 * 60 * 60
+LOAD_MANIFEST_TABLE: str = "load_manifest"
+IDEMPOTENT_PROMOTION: bool = True
+ROW_HASH_COLUMN: str = "row_hash"
+PARTITIONED_PROMOTION: bool = False
+PARTITION_COLUMN: str = "pickup_datetime"
+ASYNC_PIPELINE: bool = False
+PIPELINE_QUEUE_SIZE: int = 4
+POOL_SIZE: int = 5
+POOL_MAX_OVERFLOW: int = 10
+POOL_TIMEOUT: int = 30
+POOL_RECYCLE: int = 30 * 60
+POOL_PRE_PING: bool = True
+INCREMENTAL: bool = False
+WATERMARK_FILE: str = "cache/watermark.json"
+CACHE_DIR: str = "cache/"
+CACHE_MAX_BYTES: int = 5 * 1024**3
+CACHE_MAX_AGE_SECONDS: int = 7 * 24 * 60 * 60
+
+DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+
+# Column dtypes matching `scripts/create_stage_taxi_data_table.sql`.
+TAXI_SCHEMA: Dict[str, str] = {
+    "vendor_id": "Int8",
+    "pickup_datetime": "datetime64[ns]",
+    "dropoff_datetime": "datetime64[ns]",
+    "passenger_count": "Int8",
+    "trip_distance": "float32",
+    "rate_code_id": "Int8",
+    "store_and_fwd_flag": "category",
+    "pickup_location_id": "Int16",
+    "dropoff_location_id": "Int16",
+    "payment_type": "Int8",
+    "fare_amount": "float32",
+    "extra": "float32",
+    "mta_tax": "float32",
+    "tip_amount": "float32",
+    "tolls_amount": "float32",
+    "improvement_surcharge": "float32",
+    "total_amount": "float32",
+    "congestion_surcharge": "float32",
+}
 
 SITE_CONFIG: Dict[str, str] = {
     "class_name": "SiteBuilder",
@@ -2,6 +2,21 @@ import logging
 import great_expectations as gx
 
 from typing import Dict
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.exceptions import DataContextError
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+
+from src.config.config import VALIDATION_WORKERS
+
+from .context_cache import ContextCache
+from .docs_manager import DataDocsManager
+from .fingerprint import expectations_fingerprint, model_fingerprint
+from .results import bound_results, bounded_result_format, widest_result_format
 
 logger: logging.Logger = logging.getLogger("class GreatExpectationsChecker")
 
@@ -13,22 +28,36 @@ class GreatExpectationsChecker:
         """
         Initializes the Great Expectations context for validation.
 
+        The context is shared with every other checker of the same mode, see
+        `ContextCache`.
+
         Args:
             context_mode (str): The mode for initializing the Great Expectations context.
             Possible values might include 'local', 'cloud', etc.
         """
-        self.context = gx.get_context(mode=context_mode)
+        self.context_mode = context_mode
+        self.context = ContextCache.get_context(context_mode)
+        self.docs = DataDocsManager(self.context)
         self.suite = None
         self.batch_definition = None
+        self.validation_definition_name = "validation definition"
+        self.checkpoint_name = "checkpoint"
 
     def set_data_docs_site(self, site_name: str, site_config: Dict[str, str]) -> None:
         """
         Sets or updates a data docs site configuration in the context.
 
+        A site already configured the same way is left as it is, so the project config
+        is not rewritten.
+
         Args:
             site_name (str): The name of the data docs site to be set or updated.
             site_config (Dict[str, str]): A dictionary containing the configuration for the data docs site.
         """
+        sites = self.context.variables.data_docs_sites or {}
+        if sites.get(site_name) == site_config:
+            return
+
         try:
             self.context.add_data_docs_site(
                 site_name=site_name, site_config=site_config
@@ -37,14 +66,22 @@ class GreatExpectationsChecker:
             self.context.update_data_docs_site(
                 site_name=site_name, site_config=site_config
             )
+        self._persisted()
 
     def set_suite(self, suite_name: str) -> None:
         """
         Retrieves or creates an expectation suite by the provided name.
 
+        A suite already retrieved by a checker of the same mode is reused.
+
         Args:
             suite_name (str): The name of the expectation suite to be retrieved or created.
         """
+        cached = ContextCache.get(self.context_mode, ("suite", suite_name))
+        if cached is not None:
+            self.suite = cached
+            return
+
         try:
             self.suite = self.context.suites.get(
                 suite_name
@@ -55,70 +92,265 @@ class GreatExpectationsChecker:
             self.suite = self.context.suites.add(
                 gx.core.expectation_suite.ExpectationSuite(name=suite_name)
             )
+        ContextCache.put(self.context_mode, ("suite", suite_name), self.suite)
+        self._persisted()
+
+    def _set_expectations(self, expectations: list) -> None:
+        """
+        Replaces the expectations of the suite and persists it, if they changed.
+
+        Expectations are compared by fingerprint, so a run with unchanged
+        expectations neither rewrites the suite nor renders its data docs page.
+
+        Args:
+            expectations (list): The expectations of the suite, in order.
+        """
+        if expectations_fingerprint(expectations) == expectations_fingerprint(
+            self.suite.expectations
+        ):
+            logger.info(f"Expectation suite {self.suite.name} is unchanged.")
+            return
+
+        self.suite.expectations.clear()
+        self.suite.expectations.extend(expectations)
+        self._update_suite()
+
+    def _stored_if_unchanged(self, store, candidate):
+        """
+        Returns the stored object with the same fingerprint as `candidate`, if any.
+
+        Args:
+            store: The store of the context, e.g. `context.checkpoints`.
+            candidate (ValidationDefinition | Checkpoint): The object as it would be saved.
+
+        Returns:
+            ValidationDefinition | Checkpoint | None: The stored object, or None if it
+            is missing or differs.
+        """
+        try:
+            stored = store.get(candidate.name)
+        except DataContextError:
+            return None
+        if model_fingerprint(stored) == model_fingerprint(candidate):
+            return stored
+        return None
+
+    def _persisted(self) -> None:
+        """Keeps the shared context cached after this checker wrote to its stores."""
+        ContextCache.mark_clean(self.context_mode)
+
+    def _add_batch_definition(self, name: str, add):
+        """
+        Returns the batch definition of the data asset, adding it if it is missing.
+
+        A data asset reused from the context cache already has its batch definition.
+
+        Args:
+            name (str): The name of the batch definition.
+            add (Callable): The method of the data asset adding the batch definition.
+
+        Returns:
+            gx.core.batch_definition.BatchDefinition: The batch definition.
+        """
+        if name in [
+            definition.name for definition in self.data_asset.batch_definitions
+        ]:
+            return self.data_asset.get_batch_definition(name)
+        batch_definition = add(name)
+        self._persisted()
+        return batch_definition
 
     def create_validation_definition(self):
         """
         Creates a validation definition for the current batch and suite.
 
+        The stored definition is reused without being saved again if it is unchanged.
+
         Returns:
             gx.core.validation_definition.ValidationDefinition: The created or updated validation definition object.
         """
-        return self.context.validation_definitions.add_or_update(
-            gx.core.validation_definition.ValidationDefinition(
-                name="validation definition",
-                data=self.batch_definition,
-                suite=self.suite,
-            )
+        candidate = gx.core.validation_definition.ValidationDefinition(
+            name=self.validation_definition_name,
+            data=self.batch_definition,
+            suite=self.suite,
         )
+        validation_definition = self._stored_if_unchanged(
+            self.context.validation_definitions, candidate
+        )
+        if validation_definition is None:
+            validation_definition = self.context.validation_definitions.add_or_update(
+                candidate
+            )
+            self._persisted()
+        return validation_definition
 
-    def create_checkpoint(self, validation_definition, site_name: str):
+    def create_checkpoint(
+        self, validation_definition, site_name: str, result_format=None
+    ):
         """
         Creates a checkpoint that will validate data using the provided validation definition.
 
+        The checkpoint does not build data docs itself: its results are rendered by
+        `generate_data_docs`, together with the other pages changed in the run.
+        The stored checkpoint is reused without being saved again if it is unchanged.
+        Its result format is bounded (see `bounded_result_format`) and detailed enough
+        for the expectations with their own `result_format`.
+
         Args:
             validation_definition (gx.core.validation_definition.ValidationDefinition): The validation definition to use.
             site_name (str): The name of the data docs site associated with the checkpoint.
+            result_format (str | Dict | None, optional): The result format of the run.
+            Defaults to None, `RESULT_FORMAT`.
 
         Returns:
             gx.checkpoint.checkpoint.Checkpoint: The created or updated checkpoint object.
         """
-        actions = [
-            gx.checkpoint.actions.UpdateDataDocsAction(
-                name="update_my_site", site_names=[site_name]
-            )
-        ]
-        return self.context.checkpoints.add_or_update(
-            gx.checkpoint.checkpoint.Checkpoint(
-                name="checkpoint",
-                validation_definitions=[validation_definition],
-                actions=actions,
-                result_format="COMPLETE",
-            )
+        candidate = gx.checkpoint.checkpoint.Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=[validation_definition],
+            actions=[],
+            result_format=widest_result_format(
+                bounded_result_format(result_format),
+                [expectation.configuration for expectation in self.suite.expectations],
+            ),
         )
+        checkpoint = self._stored_if_unchanged(self.context.checkpoints, candidate)
+        if checkpoint is None:
+            checkpoint = self.context.checkpoints.add_or_update(candidate)
+            self._persisted()
+        return checkpoint
 
-    def run_checkpoint(self, site_name: str):
+    def run_checkpoint(self, site_name: str, result_format=None):
         """
         Runs a checkpoint for validation using the provided site name.
 
         Args:
             site_name (str): The name of the data docs site to associate with the checkpoint.
+            result_format (str | Dict | None, optional): The result format of the run.
+            Defaults to None, `RESULT_FORMAT`.
 
         Returns:
             gx.checkpoint.checkpoint.CheckpointResult: The result of the checkpoint run.
         """
         validation_definition = self.create_validation_definition()
-        checkpoint = self.create_checkpoint(validation_definition, site_name)
-        return checkpoint.run()
+        checkpoint = self.create_checkpoint(
+            validation_definition, site_name, result_format
+        )
+        result = checkpoint.run()
+        return self._checkpoint_done(result, result_format)
+
+    def run_partitioned(
+        self, site_name: str, workers: int = VALIDATION_WORKERS, result_format=None
+    ):
+        """
+        Validates each partition of the batch definition concurrently.
+
+        The batch definition lists its partitions, e.g. one per day of a daily batch
+        definition, and the validation definition runs on each of them in a thread
+        pool, since each run mostly waits on its own queries. The runs share one run
+        id and are merged into a single checkpoint result holding one suite result,
+        and one data docs page, per partition.
+
+        Args:
+            site_name (str): The name of the data docs site to associate with the checkpoint.
+            workers (int, optional): The number of partitions validated at once; 1
+            validates them one after the other. Defaults to `VALIDATION_WORKERS`.
+            result_format (str | Dict | None, optional): The result format of the run.
+            Defaults to None, `RESULT_FORMAT`.
+
+        Returns:
+            gx.checkpoint.checkpoint.CheckpointResult: The merged result; it succeeds
+            only if every partition does.
+
+        Raises:
+            ValueError: If the batch definition has no partitions.
+        """
+        validation_definition = self.create_validation_definition()
+        checkpoint = self.create_checkpoint(
+            validation_definition, site_name, result_format
+        )
+        partitions = self.batch_definition.get_batch_identifiers_list()
+        if not partitions:
+            raise ValueError(
+                f"Batch definition {self.batch_definition.name} has no partitions."
+            )
+        run_id = RunIdentifier(
+            run_name="partitioned", run_time=datetime.now(timezone.utc)
+        )
+
+        def validate(partition: Dict):
+            return validation_definition.run(
+                checkpoint_id=checkpoint.id,
+                batch_parameters=partition,
+                result_format=checkpoint.result_format,
+                run_id=run_id,
+            )
+
+        threads = max(1, min(workers, len(partitions)))
+        if threads == 1:
+            # Runs in this thread, as dialects holding one connection, e.g. SQLite, need.
+            results = list(map(validate, partitions))
+        else:
+            with ThreadPoolExecutor(threads) as pool:
+                results = list(pool.map(validate, partitions))
+
+        run_results = {}
+        for partition, suite_result in zip(partitions, results):
+            identifier = ValidationResultIdentifier(
+                expectation_suite_identifier=ExpectationSuiteIdentifier(
+                    self.suite.name
+                ),
+                run_id=run_id,
+                batch_identifier=suite_result.batch_id,
+            )
+            run_results[identifier] = suite_result
+            if suite_result.success:
+                logger.info(f"Partition {partition} passed.")
+            else:
+                logger.warning(f"Partition {partition} failed.")
+        logger.info(f"Validated {len(partitions)} partitions in {threads} threads.")
+        result = gx.checkpoint.checkpoint.CheckpointResult(
+            run_id=run_id, run_results=run_results, checkpoint_config=checkpoint
+        )
+        return self._checkpoint_done(result, result_format)
+
+    def _checkpoint_done(self, result, result_format=None):
+        """
+        Trims the results of a checkpoint run and queues them for data docs.
+
+        Each expectation result is trimmed to its own result format, or to that of the
+        run, and saved again if it was.
+
+        Args:
+            result (gx.checkpoint.checkpoint.CheckpointResult): The result of the run.
+            result_format (str | Dict | None, optional): The result format of the run.
+            Defaults to None, `RESULT_FORMAT`.
+
+        Returns:
+            gx.checkpoint.checkpoint.CheckpointResult: The result.
+        """
+        for identifier, suite_result in result.run_results.items():
+            if bound_results(suite_result.results, result_format):
+                self.context.validation_results_store.set(identifier, suite_result)
+        self.docs.validated(result)
+        return result
 
     def generate_data_docs(self, site_name: str):
         """
         Generates and builds the data documentation for the provided site name.
 
+        Only the pages of the suites and validation results changed by this checker
+        are rendered, in a single build; see `DataDocsManager`.
+
         Args:
             site_name (str): The name of the data docs site to generate.
+
+        Returns:
+            Future | None: The build, when it runs in the background.
         """
-        self.context.build_data_docs(site_names=site_name)
+        return self.docs.build(site_names=[site_name])
 
     def open_report(self):
-        """Opens the generated data docs report in a web browser."""
+        """Opens the generated data docs report in a web browser, once it is built."""
+        DataDocsManager.wait()
         self.context.open_data_docs()
@@ -0,0 +1,186 @@
+import numpy as np
+
+from typing import Any, Dict
+from multiprocessing.shared_memory import SharedMemory
+
+# A check is (kind, column, params); `kind` is one of the keys of `_RULES`.
+Check = tuple[str, str, Any]
+# The non-null count, unexpected count, minimum and maximum of a check.
+Counts = tuple[int, int, float | None, float | None]
+
+
+def null_mask(values: np.ndarray) -> np.ndarray:
+    """
+    Returns the null mask of an encoded column.
+
+    Numeric columns are encoded as floats with NaN for nulls, the others as
+    `pd.factorize` codes with -1 for nulls, or as their null mask when only
+    nulls are checked.
+
+    Args:
+        values (np.ndarray): The encoded column.
+
+    Returns:
+        np.ndarray: True where the value is null.
+    """
+    if values.dtype.kind == "f":
+        return np.isnan(values)
+    if values.dtype.kind == "b":
+        return values
+    return values < 0
+
+
+def _not_null(values: np.ndarray, nulls: np.ndarray, params: Any) -> np.ndarray:
+    """Flags the null values."""
+    return nulls
+
+
+def _between(values: np.ndarray, nulls: np.ndarray, params: Any) -> np.ndarray:
+    """Flags the non-null values outside of `(min_value, max_value, strict_min, strict_max)`."""
+    min_value, max_value, strict_min, strict_max = params
+    unexpected = np.zeros(len(values), dtype=bool)
+    with np.errstate(invalid="ignore"):
+        if min_value is not None:
+            unexpected |= values <= min_value if strict_min else values < min_value
+        if max_value is not None:
+            unexpected |= values >= max_value if strict_max else values > max_value
+    return unexpected & ~nulls
+
+
+def _in_codes(values: np.ndarray, nulls: np.ndarray, params: Any) -> np.ndarray:
+    """Flags the non-null codes whose unique value is not allowed by the `params` mask."""
+    if not len(params):
+        return np.zeros(len(values), dtype=bool)
+    return ~params[np.where(nulls, 0, values)] & ~nulls
+
+
+def _extrema(values: np.ndarray, nulls: np.ndarray, params: Any) -> np.ndarray:
+    """Flags nothing: the check only collects the minimum and maximum."""
+    return np.zeros(len(values), dtype=bool)
+
+
+_RULES = {
+    "not_null": _not_null,
+    "between": _between,
+    "in_set": _in_codes,
+    "extrema": _extrema,
+}
+
+
+def unexpected_mask(check: Check, values: np.ndarray) -> np.ndarray:
+    """
+    Returns the unexpected values of a check over an encoded column.
+
+    Args:
+        check (Check): The check.
+        values (np.ndarray): The encoded column, or a slice of it.
+
+    Returns:
+        np.ndarray: True where the value is unexpected.
+    """
+    kind, _, params = check
+    return _RULES[kind](values, null_mask(values), params)
+
+
+def count_range(
+    columns: Dict[str, np.ndarray], checks: list[Check], start: int, stop: int
+) -> list[Counts]:
+    """
+    Counts the non-null and unexpected values of every check over a row range.
+
+    The minimum and maximum are only collected by "extrema" checks. The counts of
+    consecutive ranges combine into those of the whole frame, see `merge_counts`.
+
+    Args:
+        columns (Dict[str, np.ndarray]): The encoded columns.
+        checks (list[Check]): The checks.
+        start (int): The first row.
+        stop (int): The row after the last one.
+
+    Returns:
+        list[Counts]: The counts, one tuple per check.
+    """
+    counts = []
+    for check in checks:
+        values = columns[check[1]][start:stop]
+        nonnull = len(values) - int(np.count_nonzero(null_mask(values)))
+        unexpected = int(np.count_nonzero(unexpected_mask(check, values)))
+        minimum = maximum = None
+        if check[0] == "extrema" and nonnull:
+            minimum, maximum = float(np.nanmin(values)), float(np.nanmax(values))
+        counts.append((nonnull, unexpected, minimum, maximum))
+    return counts
+
+
+def merge_counts(left: Counts, right: Counts) -> Counts:
+    """
+    Combines the counts of two row ranges of a check.
+
+    Args:
+        left (Counts): The counts of one range.
+        right (Counts): The counts of the other range.
+
+    Returns:
+        Counts: The counts of both ranges.
+    """
+    return (
+        left[0] + right[0],
+        left[1] + right[1],
+        combine(min, left[2], right[2]),
+        combine(max, left[3], right[3]),
+    )
+
+
+def combine(function, left: Any, right: Any) -> Any:
+    """Applies `min` or `max` to two values, either of which may be None."""
+    if left is None or right is None:
+        return right if left is None else left
+    return function(left, right)
+
+
+def share(columns: Dict[str, np.ndarray]) -> tuple[list[SharedMemory], Dict]:
+    """
+    Copies encoded columns into shared memory blocks.
+
+    Args:
+        columns (Dict[str, np.ndarray]): The encoded columns.
+
+    Returns:
+        tuple[list[SharedMemory], Dict]: The blocks, to be unlinked by the caller, and
+        the picklable layout `count_shared` attaches to.
+    """
+    blocks, layout = [], {}
+    for name, values in columns.items():
+        block = SharedMemory(create=True, size=max(values.nbytes, 1))
+        blocks.append(block)
+        np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+        layout[name] = (block.name, values.dtype.str, len(values))
+    return blocks, layout
+
+
+def count_shared(
+    layout: Dict, checks: list[Check], start: int, stop: int
+) -> list[Counts]:
+    """
+    Counts a row range of columns in shared memory, run inside a worker process.
+
+    Args:
+        layout (Dict): The layout returned by `share`.
+        checks (list[Check]): The checks.
+        start (int): The first row.
+        stop (int): The row after the last one.
+
+    Returns:
+        list[Counts]: The counts, see `count_range`.
+    """
+    blocks = [SharedMemory(name=name) for name, _, _ in layout.values()]
+    columns: Dict[str, np.ndarray] = {}
+    try:
+        for block, (column, (_, dtype, length)) in zip(blocks, layout.items()):
+            columns[column] = np.ndarray((length,), dtype=dtype, buffer=block.buf)
+        return count_range(columns, checks, start, stop)
+    finally:
+        # The views must be released before their blocks can be closed.
+        columns.clear()
+        for block in blocks:
+            block.close()
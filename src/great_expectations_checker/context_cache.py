@@ -0,0 +1,144 @@
+import logging
+import threading
+import great_expectations as gx
+
+from pathlib import Path
+from typing import Any, Dict, Hashable
+
+from src.config.config import GX_CONFIG_DIR
+
+logger: logging.Logger = logging.getLogger("class ContextCache")
+
+
+class CachedContext:
+    """An initialized data context with the objects configured on it."""
+
+    def __init__(self, context, fingerprint: tuple) -> None:
+        """
+        Initializes the cache entry.
+
+        Args:
+            context (AbstractDataContext): The data context.
+            fingerprint (tuple): The fingerprint of the config files the context was loaded from.
+        """
+        self.context = context
+        self.fingerprint = fingerprint
+        self.objects: Dict[Hashable, Any] = {}
+
+
+class ContextCache:
+    """
+    Process-wide cache of Great Expectations data contexts.
+
+    Every checker of a mode shares one context, together with the data sources,
+    assets and suites already configured on it, so a long-lived worker initializes
+    them once instead of once per task. The cache of a mode is dropped when the
+    config files under `GX_CONFIG_DIR` are changed by anything but the checkers.
+    """
+
+    _entries: Dict[str, CachedContext] = {}
+    _lock = threading.RLock()
+    config_dir: Path = Path(GX_CONFIG_DIR)
+
+    @classmethod
+    def fingerprint(cls) -> tuple:
+        """
+        Returns the modification time and size of every config file.
+
+        The `uncommitted/` directory (validation results, data docs) is not config
+        and is left out.
+
+        Returns:
+            tuple: The sorted `(path, mtime_ns, size)` of the files, empty if the
+            directory does not exist.
+        """
+        if not cls.config_dir.is_dir():
+            return ()
+        files = []
+        for path in cls.config_dir.rglob("*"):
+            relative = path.relative_to(cls.config_dir)
+            if relative.parts[0] == "uncommitted" or not path.is_file():
+                continue
+            stat = path.stat()
+            files.append((str(relative), stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(files))
+
+    @classmethod
+    def get_context(cls, mode: str):
+        """
+        Returns the cached context of a mode, creating it on first use.
+
+        Args:
+            mode (str): The mode passed to `gx.get_context`.
+
+        Returns:
+            AbstractDataContext: The shared data context.
+        """
+        with cls._lock:
+            entry = cls._entries.get(mode)
+            fingerprint = cls.fingerprint()
+            if entry is not None and entry.fingerprint != fingerprint:
+                logger.info("Great Expectations config changed on disk, reloading.")
+                entry = None
+            if entry is None:
+                entry = CachedContext(gx.get_context(mode=mode), fingerprint)
+                cls._entries[mode] = entry
+            return entry.context
+
+    @classmethod
+    def get(cls, mode: str, key: Hashable) -> Any | None:
+        """
+        Returns an object configured on the cached context of a mode.
+
+        Args:
+            mode (str): The context mode.
+            key (Hashable): The key the object was stored under, e.g.
+            `("data_source", name, connection_string)`.
+
+        Returns:
+            Any | None: The object, or None if it is not cached.
+        """
+        with cls._lock:
+            entry = cls._entries.get(mode)
+            return entry.objects.get(key) if entry is not None else None
+
+    @classmethod
+    def put(cls, mode: str, key: Hashable, value: Any) -> Any:
+        """
+        Caches an object configured on the cached context of a mode.
+
+        Args:
+            mode (str): The context mode.
+            key (Hashable): The key of the object.
+            value (Any): The object.
+
+        Returns:
+            Any: The object.
+        """
+        with cls._lock:
+            entry = cls._entries.get(mode)
+            if entry is not None:
+                entry.objects[key] = value
+            return value
+
+    @classmethod
+    def mark_clean(cls, mode: str) -> None:
+        """
+        Accepts the current config files as the state of the cached context.
+
+        Checkers call it after writing to the stores themselves, so their own
+        writes do not invalidate the cache.
+
+        Args:
+            mode (str): The context mode.
+        """
+        with cls._lock:
+            entry = cls._entries.get(mode)
+            if entry is not None:
+                entry.fingerprint = cls.fingerprint()
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drops every cached context."""
+        with cls._lock:
+            cls._entries.clear()
@@ -0,0 +1,136 @@
+import logging
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+)
+
+from src.config.config import DOCS_BACKGROUND_BUILD
+
+logger: logging.Logger = logging.getLogger("class DataDocsManager")
+
+
+class DataDocsManager:
+    """
+    Collects the data docs pages a run changes and renders them in a single build.
+
+    Suites and validation results are only recorded when they change; `build`
+    then renders just their pages plus the index, instead of rebuilding every site
+    after each step.
+    """
+
+    _executor: ThreadPoolExecutor | None = None
+    _pending: set[Future] = set()
+    _lock = threading.Lock()
+
+    def __init__(self, context, background: bool = DOCS_BACKGROUND_BUILD) -> None:
+        """
+        Initializes the manager.
+
+        Args:
+            context (AbstractDataContext): The data context whose sites are built.
+            background (bool, optional): Build in a background thread, so validation
+            does not wait for the HTML rendering. Defaults to `DOCS_BACKGROUND_BUILD`.
+        """
+        self.context = context
+        self.background = background
+        self.resource_identifiers: list = []
+
+    def suite_changed(self, suite_name: str) -> None:
+        """
+        Records an expectation suite whose page must be rendered again.
+
+        Args:
+            suite_name (str): The name of the suite.
+        """
+        identifier = ExpectationSuiteIdentifier(name=suite_name)
+        if identifier not in self.resource_identifiers:
+            self.resource_identifiers.append(identifier)
+
+    def validated(self, checkpoint_result) -> None:
+        """
+        Records the validation results of a checkpoint run.
+
+        Args:
+            checkpoint_result (gx.checkpoint.checkpoint.CheckpointResult): The result of the run.
+        """
+        self.resource_identifiers.extend(checkpoint_result.run_results)
+
+    def validation_stored(self, identifier) -> None:
+        """
+        Records a validation result saved outside of a checkpoint.
+
+        Args:
+            identifier (ValidationResultIdentifier): The key of the stored result.
+        """
+        self.resource_identifiers.append(identifier)
+
+    def build(self, site_names: list[str] | None = None) -> Future | None:
+        """
+        Renders the recorded pages and the index of the sites in one build.
+
+        Args:
+            site_names (list[str] | None, optional): The sites to build. Defaults to None,
+            which builds every site of the context.
+
+        Returns:
+            Future | None: The background build, or None if the build already finished
+            or there was nothing to render.
+        """
+        if not self.resource_identifiers:
+            logger.info("Data docs are up to date.")
+            return None
+
+        resource_identifiers, self.resource_identifiers = self.resource_identifiers, []
+        if not self.background:
+            self._build(site_names, resource_identifiers)
+            return None
+
+        with DataDocsManager._lock:
+            if DataDocsManager._executor is None:
+                DataDocsManager._executor = ThreadPoolExecutor(
+                    1, thread_name_prefix="data-docs"
+                )
+            future = DataDocsManager._executor.submit(
+                self._build, site_names, resource_identifiers
+            )
+            DataDocsManager._pending.add(future)
+        future.add_done_callback(DataDocsManager._done)
+        return future
+
+    def _build(self, site_names: list[str] | None, resource_identifiers: list) -> None:
+        """
+        Renders the given pages and the index of the sites.
+
+        Args:
+            site_names (list[str] | None): The sites to build.
+            resource_identifiers (list): The suites and validation results to render.
+        """
+        try:
+            self.context.build_data_docs(
+                site_names=site_names, resource_identifiers=resource_identifiers
+            )
+        except Exception as e:
+            logger.error(f"Data docs build failed: {e}")
+            raise
+        logger.info(f"Rendered {len(resource_identifiers)} data docs pages.")
+
+    @staticmethod
+    def _done(future: Future) -> None:
+        """
+        Forgets a finished background build.
+
+        Args:
+            future (Future): The build.
+        """
+        with DataDocsManager._lock:
+            DataDocsManager._pending.discard(future)
+
+    @classmethod
+    def wait(cls) -> None:
+        """Blocks until every background build has finished."""
+        with cls._lock:
+            pending = list(cls._pending)
+        for future in pending:
+            future.exception()
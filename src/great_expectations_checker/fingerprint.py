@@ -0,0 +1,57 @@
+import json
+import hashlib
+
+from typing import Any, Iterable
+
+
+def fingerprint(config: Any) -> str:
+    """
+    Returns the canonical hash of a JSON-serializable configuration.
+
+    Keys are sorted and whitespace is fixed, so equal configurations always hash
+    the same regardless of how they were built.
+
+    Args:
+        config (Any): The configuration.
+
+    Returns:
+        str: The SHA-256 hex digest.
+    """
+    canonical = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def expectations_fingerprint(expectations: Iterable) -> str:
+    """
+    Returns the fingerprint of a list of expectations.
+
+    The ids assigned by the suite store are left out, so freshly built
+    expectations match their saved counterparts.
+
+    Args:
+        expectations (Iterable): The expectations, in suite order.
+
+    Returns:
+        str: The SHA-256 hex digest.
+    """
+    configurations = []
+    for expectation in expectations:
+        configuration = expectation.configuration.to_json_dict()
+        configuration.pop("id", None)
+        configurations.append(configuration)
+    return fingerprint(configurations)
+
+
+def model_fingerprint(model) -> str:
+    """
+    Returns the fingerprint of a validation definition or checkpoint.
+
+    Args:
+        model (ValidationDefinition | Checkpoint): The object, saved or not.
+
+    Returns:
+        str: The SHA-256 hex digest of its configuration without its own id.
+    """
+    config = json.loads(model.json())
+    config.pop("id", None)
+    return fingerprint(config)
@@ -1,11 +1,443 @@
 import logging
+import numpy as np
 import pandas as pd
 import great_expectations.expectations as gxe
 
+from typing import Any, Dict
+from functools import reduce
+from itertools import zip_longest
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from great_expectations.core import (
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+
+from src.config.config import (
+    FAST_PATH_WORKERS,
+    FAST_PATH_PARALLEL_ROWS,
+    SAMPLE_BLOCK_ROWS,
+    SAMPLE_CONFIDENCE,
+    SAMPLE_METHOD,
+    SAMPLE_PERCENT,
+    SAMPLE_SEED,
+    UNEXPECTED_PAGE_SIZE,
+)
 from .base_checker import GreatExpectationsChecker
+from .context_cache import ContextCache
+from .column_metrics import (
+    Check,
+    Counts,
+    count_range,
+    count_shared,
+    merge_counts,
+    share,
+    unexpected_mask,
+)
+from .results import (
+    PARTIAL_UNEXPECTED_COUNT,
+    PartialMetrics,
+    bound_results,
+    bounded_result_format,
+    decide_sampled,
+    map_result,
+    mostly_success,
+    suite_result,
+    widest_result_format,
+    within_bounds,
+)
 
 logger: logging.Logger = logging.getLogger("class GreatExpectationsPandasChecker")
 
+# Rows scanned at a time when sampling the unexpected values of a failed check.
+_SAMPLE_ROWS: int = 65_536
+
+
+class VectorizedValidator:
+    """
+    Validates the expectations of a suite on a DataFrame in one vectorized pass.
+
+    Each column is encoded once into a NumPy array (floats for numeric columns,
+    `pd.factorize` codes otherwise) and every supported expectation is reduced to
+    a non-null and an unexpected count over it, instead of the per-expectation
+    metric resolution of the GX engine. Frames of `parallel_rows` rows or more are
+    split into row ranges counted by worker processes over the same arrays in
+    shared memory. Table-level expectations are answered from the frame's metadata.
+    The intermediate `PartialMetrics` merge across chunks, see `StreamingValidator`.
+    """
+
+    MAP_EXPECTATIONS = (
+        "expect_column_values_to_not_be_null",
+        "expect_column_values_to_be_between",
+        "expect_column_values_to_be_in_set",
+    )
+    AGGREGATE_EXPECTATIONS = (
+        "expect_column_min_to_be_between",
+        "expect_column_max_to_be_between",
+    )
+    TABLE_EXPECTATIONS = (
+        "expect_table_columns_to_match_ordered_list",
+        "expect_table_row_count_to_be_between",
+        "expect_column_values_to_be_of_type",
+    )
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        workers: int = FAST_PATH_WORKERS,
+        parallel_rows: int = FAST_PATH_PARALLEL_ROWS,
+    ) -> None:
+        """
+        Initializes the validator.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to validate.
+            workers (int, optional): The number of worker processes. Defaults to `FAST_PATH_WORKERS`.
+            parallel_rows (int, optional): The number of rows from which the counts run
+            in parallel. Defaults to `FAST_PATH_PARALLEL_ROWS`.
+        """
+        self.df = df
+        self.workers = workers
+        self.parallel_rows = parallel_rows
+        self._encoded: Dict[str, np.ndarray] = {}
+        self._uniques: Dict[str, pd.Index] = {}
+
+    def supports(self, expectation) -> bool:
+        """
+        Checks whether an expectation can be evaluated by the validator.
+
+        Args:
+            expectation (gxe.Expectation): The expectation.
+
+        Returns:
+            bool: False for other expectation types, conditional expectations, unknown
+            or duplicated columns and arguments only the GX engine interprets.
+        """
+        kind = expectation.configuration.type
+        kwargs = expectation.configuration.kwargs
+        if kind not in (
+            self.MAP_EXPECTATIONS
+            + self.AGGREGATE_EXPECTATIONS
+            + self.TABLE_EXPECTATIONS
+        ):
+            return False
+        if kwargs.get("row_condition"):
+            return False
+        if kind == "expect_table_columns_to_match_ordered_list":
+            return kwargs.get("column_list") is not None
+        if kind == "expect_table_row_count_to_be_between":
+            return True
+
+        column = kwargs.get("column")
+        if column not in self.df.columns or not self.df.columns.is_unique:
+            return False
+        series = self.df[column]
+        if kind in ("expect_column_values_to_be_between", *self.AGGREGATE_EXPECTATIONS):
+            bounds = [kwargs.get("min_value"), kwargs.get("max_value")]
+            return (
+                _is_numeric(series)
+                and any(bound is not None for bound in bounds)
+                and all(bound is None or _is_number(bound) for bound in bounds)
+            )
+        if kind == "expect_column_values_to_be_in_set":
+            return kwargs.get("value_set") is not None
+        if kind == "expect_column_values_to_be_of_type":
+            # GX validates object and string columns value by value unless "object"
+            # is expected, categoricals by their dtype like the other columns.
+            by_value = series.dtype.type.__name__ == "object_" or isinstance(
+                series.dtype, pd.StringDtype
+            )
+            return not by_value or kwargs.get("type_") in (
+                "object",
+                "object_",
+                "O",
+                None,
+            )
+        return True
+
+    def validate(self, expectations: list) -> list[ExpectationValidationResult]:
+        """
+        Validates the expectations, all supported.
+
+        Args:
+            expectations (list): The expectations.
+
+        Returns:
+            list[ExpectationValidationResult]: One result per expectation, in order.
+        """
+        return [
+            finalize(expectation, metrics)
+            for expectation, metrics in zip(expectations, self.metrics(expectations))
+        ]
+
+    def metrics(self, expectations: list) -> list[PartialMetrics]:
+        """
+        Computes the mergeable metrics of the expectations, all supported.
+
+        Args:
+            expectations (list): The expectations.
+
+        Returns:
+            list[PartialMetrics]: One set of metrics per expectation, in order.
+        """
+        checks = {
+            position: self._check(expectation)
+            for position, expectation in enumerate(expectations)
+            if expectation.configuration.type
+            in self.MAP_EXPECTATIONS + self.AGGREGATE_EXPECTATIONS
+        }
+        counts = dict(zip(checks, self._count(list(checks.values()))))
+
+        rows = len(self.df)
+        metrics = []
+        for position, expectation in enumerate(expectations):
+            kind = expectation.configuration.type
+            column = expectation.configuration.kwargs.get("column")
+            if position in checks:
+                nonnull, unexpected, minimum, maximum = counts[position]
+                positions = self._sample(checks[position]) if unexpected else []
+                metrics.append(
+                    PartialMetrics(
+                        rows,
+                        nonnull,
+                        unexpected,
+                        minimum,
+                        maximum,
+                        observed=[self.df[column].dtype],
+                        partial_unexpected_list=self.df[column]
+                        .iloc[positions]
+                        .tolist(),
+                        partial_unexpected_index_list=self.df.index[positions].tolist(),
+                    )
+                )
+            elif kind == "expect_table_columns_to_match_ordered_list":
+                metrics.append(PartialMetrics(rows, observed=[list(self.df.columns)]))
+            elif kind == "expect_column_values_to_be_of_type":
+                metrics.append(PartialMetrics(rows, observed=[self.df[column].dtype]))
+            else:
+                metrics.append(PartialMetrics(rows))
+        return metrics
+
+    def unexpected(self, expectation) -> np.ndarray:
+        """
+        Returns the unexpected rows of a supported column map expectation.
+
+        Args:
+            expectation (gxe.Expectation): The expectation.
+
+        Returns:
+            np.ndarray: True where the row is unexpected.
+        """
+        check = self._check(expectation)
+        return unexpected_mask(check, self._encoded[check[1]])
+
+    def _check(self, expectation) -> Check:
+        """
+        Encodes the column of a column map expectation and returns its check.
+
+        Args:
+            expectation (gxe.Expectation): The expectation.
+
+        Returns:
+            Check: The check, over the key of the encoded column.
+        """
+        kind = expectation.configuration.type
+        kwargs = expectation.configuration.kwargs
+        column = kwargs["column"]
+        if kind == "expect_column_values_to_be_between":
+            params = (
+                kwargs.get("min_value"),
+                kwargs.get("max_value"),
+                bool(kwargs.get("strict_min")),
+                bool(kwargs.get("strict_max")),
+            )
+            return "between", self._encode(column, "values"), params
+        if kind == "expect_column_values_to_be_in_set":
+            key = self._encode(column, "codes")
+            return "in_set", key, self._allowed(column, list(kwargs["value_set"]))
+        if kind in self.AGGREGATE_EXPECTATIONS:
+            return "extrema", self._encode(column, "values"), None
+        encoding = "values" if _is_numeric(self.df[column]) else "nulls"
+        return "not_null", self._encode(column, encoding), None
+
+    def _encode(self, column: str, encoding: str) -> str:
+        """
+        Encodes a column once per encoding.
+
+        Args:
+            column (str): The column.
+            encoding (str): "values" for numeric columns, "codes" for the
+            `pd.factorize` codes, or "nulls" for the null mask.
+
+        Returns:
+            str: The key of the encoded column.
+        """
+        key = f"{encoding}:{column}"
+        if key not in self._encoded:
+            series = self.df[column]
+            if encoding == "values":
+                dtype = series.dtype if series.dtype.kind == "f" else "float64"
+                self._encoded[key] = series.to_numpy(dtype, na_value=np.nan)
+            elif encoding == "codes":
+                self._encoded[key], uniques = pd.factorize(series)
+                self._uniques[column] = pd.Index(uniques)
+            else:
+                self._encoded[key] = series.isna().to_numpy()
+        return key
+
+    def _allowed(self, column: str, value_set: list) -> np.ndarray:
+        """Returns which of the distinct values of a factorized column are in `value_set`."""
+        return np.asarray(self._uniques[column].isin(value_set), dtype=bool)
+
+    def _count(self, checks: list[Check]) -> list[Counts]:
+        """
+        Counts the non-null and unexpected values of the checks in one pass.
+
+        Args:
+            checks (list[Check]): The checks.
+
+        Returns:
+            list[Counts]: The counts, one tuple per check.
+        """
+        columns = {key: self._encoded[key] for _, key, _ in checks}
+        rows = len(self.df)
+        if not checks or self.workers <= 1 or rows < self.parallel_rows:
+            return count_range(columns, checks, 0, rows)
+
+        bounds = np.linspace(0, rows, self.workers + 1, dtype=int).tolist()
+        blocks, layout = share(columns)
+        try:
+            with ProcessPoolExecutor(self.workers) as pool:
+                partials = list(
+                    pool.map(
+                        count_shared,
+                        [layout] * self.workers,
+                        [checks] * self.workers,
+                        bounds[:-1],
+                        bounds[1:],
+                    )
+                )
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        logger.info(f"Counted {rows} rows in {self.workers} processes.")
+        return [reduce(merge_counts, ranges) for ranges in zip(*partials)]
+
+    def _sample(self, check: Check) -> list[int]:
+        """
+        Returns the positions of the first unexpected values of a check.
+
+        Args:
+            check (Check): The check.
+
+        Returns:
+            list[int]: Up to `PARTIAL_UNEXPECTED_COUNT` row positions.
+        """
+        values = self._encoded[check[1]]
+        positions: list[int] = []
+        for start in range(0, len(values), _SAMPLE_ROWS):
+            chunk = values[start : start + _SAMPLE_ROWS]
+            positions.extend(
+                (np.flatnonzero(unexpected_mask(check, chunk)) + start).tolist()
+            )
+            if len(positions) >= PARTIAL_UNEXPECTED_COUNT:
+                break
+        return positions[:PARTIAL_UNEXPECTED_COUNT]
+
+
+def finalize(expectation, metrics: PartialMetrics) -> ExpectationValidationResult:
+    """
+    Turns the metrics of an expectation into its result, shaped like those of GX.
+
+    Args:
+        expectation (gxe.Expectation): The expectation, supported by `VectorizedValidator`.
+        metrics (PartialMetrics): Its metrics, possibly merged over several chunks.
+
+    Returns:
+        ExpectationValidationResult: The result.
+    """
+    kind = expectation.configuration.type
+    kwargs = expectation.configuration.kwargs
+    if kind in VectorizedValidator.MAP_EXPECTATIONS:
+        nulls_are_unexpected = kind == "expect_column_values_to_not_be_null"
+        domain = (
+            metrics.element_count if nulls_are_unexpected else metrics.nonnull_count
+        )
+        success = mostly_success(metrics.unexpected_count, domain, kwargs)
+        result = map_result(
+            metrics.element_count,
+            metrics.nonnull_count,
+            metrics.unexpected_count,
+            metrics.partial_unexpected_list,
+            nulls_are_unexpected=nulls_are_unexpected,
+            partial_unexpected_index_list=metrics.partial_unexpected_index_list,
+        )
+    elif kind in VectorizedValidator.AGGREGATE_EXPECTATIONS:
+        value = (
+            metrics.minimum
+            if kind == "expect_column_min_to_be_between"
+            else metrics.maximum
+        )
+        # GX reports the extreme as a scalar of the column's dtype.
+        observed = None if value is None else metrics.observed[0].type(value)
+        success, result = within_bounds(observed, kwargs), {"observed_value": observed}
+    elif kind == "expect_table_row_count_to_be_between":
+        success = within_bounds(metrics.element_count, kwargs)
+        result = {"observed_value": metrics.element_count}
+    elif not metrics.observed:
+        success, result = False, {"observed_value": None}
+    elif kind == "expect_column_values_to_be_of_type":
+        validations = [
+            expectation._validate_pandas(
+                actual_column_type=dtype, expected_type=kwargs.get("type_")
+            )
+            for dtype in metrics.observed
+        ]
+        validation = next((v for v in validations if not v["success"]), validations[0])
+        success, result = validation["success"], validation["result"]
+    else:
+        expected = list(kwargs["column_list"])
+        observed = next(
+            (columns for columns in metrics.observed if columns != expected),
+            metrics.observed[0],
+        )
+        success, result = observed == expected, {"observed_value": observed}
+        if not success:
+            result["details"] = {
+                "mismatched": [
+                    {
+                        "Expected Column Position": position,
+                        "Expected": wanted,
+                        "Found": found,
+                    }
+                    for position, (wanted, found) in enumerate(
+                        zip_longest(expected, observed)
+                    )
+                    if wanted != found
+                ]
+            }
+    return ExpectationValidationResult(
+        success=success, expectation_config=expectation.configuration, result=result
+    )
+
+
+def _is_numeric(series: pd.Series) -> bool:
+    """Checks whether a column holds numbers, booleans excluded."""
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(
+        series
+    )
+
+
+def _is_number(value: Any) -> bool:
+    """Checks whether a bound is a number, booleans excluded."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
 
 class GreatExpectationsPandasChecker(GreatExpectationsChecker):
     """Handles Great Expectations validation for Pandas DataFrames."""
@@ -26,19 +458,39 @@ class GreatExpectationsPandasChecker(GreatExpectationsChecker):
         """
         Sets up a Pandas data source in the Great Expectations context.
 
+        A data source already set up by a checker of the same mode is reused.
+
         Args:
             data_source (str): The name of the data source to add or update.
         """
+        key = ("data_source", data_source)
+        cached = ContextCache.get(self.context_mode, key)
+        if cached is not None:
+            self.data_source = cached
+            return
+
         self.data_source = self.context.data_sources.add_or_update_pandas(data_source)
+        ContextCache.put(self.context_mode, key, self.data_source)
+        self._persisted()
 
     def set_data_asset(self, data_asset_name: str) -> None:
         """
         Sets up a Pandas data asset in the Great Expectations context.
 
+        A data asset already set up by a checker of the same mode is reused.
+
         Args:
             data_asset_name (str): The name of the data asset to add for the DataFrame.
         """
+        key = ("data_asset", self.data_source.name, data_asset_name)
+        cached = ContextCache.get(self.context_mode, key)
+        if cached is not None:
+            self.data_asset = cached
+            return
+
         self.data_asset = self.data_source.add_dataframe_asset(name=data_asset_name)
+        ContextCache.put(self.context_mode, key, self.data_asset)
+        self._persisted()
 
     def set_batch_definition(self, batch_definition) -> None:
         """
@@ -47,14 +499,260 @@ class GreatExpectationsPandasChecker(GreatExpectationsChecker):
         Args:
             batch_definition: The batch definition that specifies how the batch is to be loaded.
         """
-        self.batch_definition = self.data_asset.add_batch_definition_whole_dataframe(
-            batch_definition
+        self.batch_definition = self._add_batch_definition(
+            batch_definition, self.data_asset.add_batch_definition_whole_dataframe
+        )
+
+    def run_fast_path(self, result_format=None) -> ExpectationSuiteValidationResult:
+        """
+        Validates the suite on the DataFrame with `VectorizedValidator`.
+
+        The expectations the validator supports are evaluated in a single vectorized
+        pass; the others are validated by the GX engine on the batch. The result is
+        saved to the validation results store and queued for data docs like a
+        checkpoint result.
+
+        Args:
+            result_format (str | Dict | None, optional): The result format of the run,
+            see `bounded_result_format`. Defaults to None, `RESULT_FORMAT`.
+
+        Returns:
+            ExpectationSuiteValidationResult: The result of the whole suite.
+        """
+        results = self._validate_all(self.suite.expectations, result_format)
+        return self._save(results, "vectorized", result_format)
+
+    def run_sampled(
+        self,
+        percent: float = SAMPLE_PERCENT,
+        method: str = SAMPLE_METHOD,
+        confidence: float = SAMPLE_CONFIDENCE,
+        seed: int | None = SAMPLE_SEED,
+        result_format=None,
+    ) -> ExpectationSuiteValidationResult:
+        """
+        Validates the suite on a sample of the DataFrame, scanning it all only if needed.
+
+        The Pandas counterpart of `GreatExpectationsPostgresChecker.run_sampled`: the
+        column map expectations decided on the sample (see `decide_sampled`) are not
+        validated again, the others go through `run_fast_path`'s full validation.
+
+        Args:
+            percent (float, optional): The share of the rows to sample, in percent.
+            Defaults to `SAMPLE_PERCENT`.
+            method (str, optional): "BERNOULLI" or "SYSTEM", see `_sample`. The
+            intervals only hold for "BERNOULLI", see `wilson_interval`. Defaults to
+            `SAMPLE_METHOD`.
+            confidence (float, optional): The confidence level of the intervals.
+            Defaults to `SAMPLE_CONFIDENCE`.
+            seed (int | None, optional): Makes the sample repeatable. Defaults to `SAMPLE_SEED`.
+            result_format (str | Dict | None, optional): The result format of the run,
+            see `bounded_result_format`. Defaults to None, `RESULT_FORMAT`.
+
+        Returns:
+            ExpectationSuiteValidationResult: The result of the whole suite.
+        """
+        if method.upper() != "BERNOULLI":
+            logger.warning(
+                f"{method} samples whole blocks: the sampling intervals are too narrow."
+            )
+        validator = VectorizedValidator(self._sample(percent, method, seed))
+        sampled = [
+            e
+            for e in self.suite.expectations
+            if validator.supports(e)
+            and e.configuration.type in VectorizedValidator.MAP_EXPECTATIONS
+        ]
+        sampling = {"method": method, "percent": percent}
+
+        results: Dict[int, ExpectationValidationResult] = {}
+        escalated: Dict[int, Dict[str, Any]] = {}
+        for expectation, result in zip(sampled, validator.validate(sampled)):
+            decided, details = decide_sampled(result, confidence, sampling)
+            if decided is None:
+                escalated[id(expectation)] = details
+            else:
+                results[id(expectation)] = decided
+
+        remaining = [e for e in self.suite.expectations if id(e) not in results]
+        logger.info(
+            f"{len(results)} expectations decided on a {percent}% {method} sample, "
+            f"{len(escalated)} escalated to a full scan."
+        )
+        for key, result in self._validate_all(remaining, result_format).items():
+            if key in escalated:
+                result.result["details"] = {"escalated": True, **escalated[key]}
+            results[key] = result
+        return self._save(
+            results,
+            "sampled",
+            result_format,
+            sampling={
+                **sampling,
+                "confidence": confidence,
+                "escalated": len(escalated),
+            },
+        )
+
+    def _sample(self, percent: float, method: str, seed: int | None) -> pd.DataFrame:
+        """
+        Samples the DataFrame like `TABLESAMPLE`.
+
+        "BERNOULLI" keeps each row with a probability of `percent`; "SYSTEM" keeps
+        whole blocks of `SAMPLE_BLOCK_ROWS` consecutive rows, the way Postgres keeps
+        whole pages, which is cheaper to copy but less random on ordered data, and
+        not what the sampling intervals assume.
+
+        Args:
+            percent (float): The share of the rows to sample, in percent.
+            method (str): "SYSTEM" or "BERNOULLI".
+            seed (int | None): Makes the sample repeatable.
+
+        Returns:
+            pd.DataFrame: The sampled rows.
+        """
+        rng = np.random.default_rng(seed)
+        if method.upper() == "BERNOULLI":
+            keep = rng.random(len(self.df)) < percent / 100
+        else:
+            blocks = -(-len(self.df) // SAMPLE_BLOCK_ROWS)
+            keep = np.repeat(rng.random(blocks) < percent / 100, SAMPLE_BLOCK_ROWS)
+            keep = keep[: len(self.df)]
+        return self.df[keep]
+
+    def _validate_all(
+        self, expectations: list, result_format=None
+    ) -> Dict[int, ExpectationValidationResult]:
+        """
+        Validates expectations on the whole DataFrame.
+
+        Args:
+            expectations (list): The expectations.
+            result_format (str | Dict | None, optional): The result format of the run,
+            passed bounded to the GX engine. Defaults to None, `RESULT_FORMAT`.
+
+        Returns:
+            Dict[int, ExpectationValidationResult]: The results, by `id` of expectation.
+        """
+        validator = VectorizedValidator(self.df)
+        fast = [e for e in expectations if validator.supports(e)]
+        fallback = [e for e in expectations if not validator.supports(e)]
+
+        results: Dict[int, ExpectationValidationResult] = {}
+        results.update(zip(map(id, fast), validator.validate(fast)))
+        if fallback:
+            logger.info(f"{len(fallback)} expectations validated by the GX engine.")
+            batch = self.batch_definition.get_batch(
+                batch_parameters={"dataframe": self.df}
+            )
+            run_format = widest_result_format(
+                bounded_result_format(result_format),
+                [expectation.configuration for expectation in fallback],
+            )
+            for expectation in fallback:
+                results[id(expectation)] = batch.validate(
+                    expectation, result_format=run_format
+                )
+        return results
+
+    def _save(
+        self,
+        results: Dict[int, ExpectationValidationResult],
+        run_name: str,
+        result_format=None,
+        **meta,
+    ) -> ExpectationSuiteValidationResult:
+        """
+        Assembles the suite result, saves it and queues it for data docs.
+
+        Args:
+            results (Dict[int, ExpectationValidationResult]): The results, by `id` of expectation.
+            run_name (str): The name of the run.
+            result_format (str | Dict | None, optional): The result format of the run,
+            the results are trimmed to. Defaults to None, `RESULT_FORMAT`.
+            **meta: Extra metadata of the result.
+
+        Returns:
+            ExpectationSuiteValidationResult: The result of the whole suite.
+        """
+        ordered = [results[id(expectation)] for expectation in self.suite.expectations]
+        bound_results(ordered, result_format)
+        run_id = RunIdentifier(run_name=run_name, run_time=datetime.now(timezone.utc))
+        validation_result = suite_result(
+            ordered,
+            self.suite.name,
+            meta={
+                "run_id": run_id.to_json_dict(),
+                "validation_time": run_id.run_time.isoformat(),
+                "active_batch_definition": {
+                    "datasource_name": self.data_source.name,
+                    "data_asset_name": self.data_asset.name,
+                    "batch_definition_name": self.batch_definition.name,
+                },
+                **meta,
+            },
         )
 
+        identifier = ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(self.suite.name),
+            run_id=run_id,
+            batch_identifier=self.data_asset.name,
+        )
+        self.context.validation_results_store.set(identifier, validation_result)
+        self.docs.validation_stored(identifier)
+        return validation_result
+
+    def unexpected_rows(
+        self,
+        expectation,
+        key: str | None = None,
+        after: Any = None,
+        limit: int = UNEXPECTED_PAGE_SIZE,
+    ) -> tuple[pd.DataFrame, Any]:
+        """
+        Returns a page of the rows failing a column map expectation, ordered by `key`.
+
+        Results only sample a few unexpected values; the failing rows are fetched
+        here on demand, one page after the other, each starting after the last key
+        of the previous one.
+
+        Args:
+            expectation (gxe.Expectation): The expectation, supported by `VectorizedValidator`.
+            key (str | None, optional): A unique column to page by. Defaults to None,
+            the index.
+            after (Any, optional): The last key of the previous page. Defaults to None,
+            the first page.
+            limit (int, optional): The number of rows per page. Defaults to `UNEXPECTED_PAGE_SIZE`.
+
+        Returns:
+            tuple[pd.DataFrame, Any]: The rows, and the key to pass as `after` for the
+            next page, or None if this page is the last one.
+
+        Raises:
+            ValueError: If the expectation is not a supported column map expectation.
+        """
+        validator = VectorizedValidator(self.df)
+        if (
+            expectation.configuration.type not in VectorizedValidator.MAP_EXPECTATIONS
+            or not validator.supports(expectation)
+        ):
+            raise ValueError(
+                f"Cannot page the unexpected rows of {expectation.configuration.type}."
+            )
+
+        unexpected = validator.unexpected(expectation)
+        keys = self.df.index if key is None else self.df[key]
+        if after is not None:
+            unexpected = unexpected & np.asarray(keys > after)
+        rows = self.df[unexpected]
+        rows = rows.sort_index() if key is None else rows.sort_values(key)
+        page = rows.iloc[:limit]
+        if len(rows) <= limit:
+            return page, None
+        return page, page.index[-1] if key is None else page[key].iloc[-1]
+
     def create_expectations(self):
         """Defines and updates expectations for the Pandas DataFrame."""
-        self.suite.expectations.clear()
-
         expectations = [
             gxe.ExpectTableColumnsToMatchOrderedList(
                 column_list=[
@@ -101,12 +799,11 @@ class GreatExpectationsPandasChecker(GreatExpectationsChecker):
             ]
         )
 
-        self.suite.expectations.extend(expectations)
-
-        self._update_suite()
+        self._set_expectations(expectations)
 
     def _update_suite(self):
-        """Persists the updated expectation suite in the Great Expectations context and rebuilds data docs."""
+        """Persists the updated expectation suite in the Great Expectations context and queues its data docs page."""
         self.context.suites.add_or_update(self.suite)
         self.context.suites.save(self.suite)
-        self.context.build_data_docs()
+        self._persisted()
+        self.docs.suite_changed(self.suite.name)
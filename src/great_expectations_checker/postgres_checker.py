@@ -1,11 +1,338 @@
 import logging
+import importlib
+import sqlalchemy as sa
 import great_expectations.expectations as gxe
 
+from typing import Any, Dict, Mapping
+from datetime import datetime, timezone
+from great_expectations.core import (
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.exceptions import DataContextError
+
+from src.utils.engine_registry import EngineRegistry
+from src.config.config import (
+    PARTITION_COLUMN,
+    SAMPLE_CONFIDENCE,
+    SAMPLE_METHOD,
+    SAMPLE_PERCENT,
+    SAMPLE_SEED,
+    UNEXPECTED_PAGE_SIZE,
+)
 from .base_checker import GreatExpectationsChecker
+from .context_cache import ContextCache
+from .results import (
+    bound_results,
+    bounded_result_format,
+    decide_sampled,
+    map_result,
+    mostly_success,
+    suite_result,
+    widest_result_format,
+    within_bounds,
+)
 
 logger: logging.Logger = logging.getLogger("class GreatExpectationsPostgresChecker")
 
 
+class SqlPushdownCompiler:
+    """
+    Compiles the column-level expectations of a suite into one aggregate query.
+
+    The query scans the table once and returns a single row holding the row
+    count, null counts, violation counts and min/max values of every expectation;
+    `evaluate` turns it into results shaped like those of the GX engine. Type
+    checks are answered from the reflected table, without any scan.
+    """
+
+    MAP_EXPECTATIONS = (
+        "expect_column_values_to_not_be_null",
+        "expect_column_values_to_be_between",
+        "expect_column_values_to_be_in_set",
+    )
+    AGGREGATE_EXPECTATIONS = (
+        "expect_column_min_to_be_between",
+        "expect_column_max_to_be_between",
+        "expect_column_values_to_be_of_type",
+        "expect_table_row_count_to_be_between",
+    )
+    # The physical row id of each dialect, which breaks ties between equal keys.
+    ROW_IDS = {"postgresql": "ctid", "sqlite": "rowid"}
+    ROW_ID_LABEL = "_row_id"
+
+    def __init__(self, table: sa.Table, dialect: str) -> None:
+        """
+        Initializes the compiler.
+
+        Args:
+            table (sa.Table): The reflected table to validate.
+            dialect (str): The SQLAlchemy dialect name, used to resolve type names.
+        """
+        self.table = table
+        self.dialect = dialect
+
+    def supports(self, expectation) -> bool:
+        """
+        Checks whether an expectation can be evaluated by the aggregate query.
+
+        Args:
+            expectation (gxe.Expectation): The expectation.
+
+        Returns:
+            bool: False for other expectation types, conditional expectations and
+            unknown columns, which are left to the GX engine.
+        """
+        configuration = expectation.configuration
+        if (
+            configuration.type
+            not in self.MAP_EXPECTATIONS + self.AGGREGATE_EXPECTATIONS
+        ):
+            return False
+        if configuration.kwargs.get("row_condition"):
+            return False
+        if configuration.type == "expect_table_row_count_to_be_between":
+            return True
+        return configuration.kwargs.get("column") in self.table.c
+
+    def sample(
+        self, method: str, percent: float, seed: int | None = None
+    ) -> sa.sql.FromClause:
+        """
+        Returns the table sampled with `TABLESAMPLE`.
+
+        Args:
+            method (str): "SYSTEM", which samples whole pages, or "BERNOULLI", which
+            samples rows and is slower but unbiased on clustered data.
+            percent (float): The share of the table to sample, in percent.
+            seed (int | None, optional): Makes the sample repeatable. Defaults to None.
+
+        Returns:
+            sa.sql.FromClause: The sampled table, to pass to `compile`.
+        """
+        sampling = getattr(sa.func, method.lower())(percent)
+        return self.table.tablesample(
+            sampling, name="sample", seed=None if seed is None else sa.literal(seed)
+        )
+
+    def compile(
+        self, expectations: list, source: sa.sql.FromClause | None = None
+    ) -> sa.sql.Select:
+        """
+        Builds the aggregate query of the supported expectations.
+
+        Args:
+            expectations (list): The expectations, all supported.
+            source (sa.sql.FromClause | None, optional): The rows to aggregate, e.g. a
+            `sample` of the table. Defaults to None, the whole table.
+
+        Returns:
+            sa.sql.Select: The query, returning one row.
+        """
+        source = self.table if source is None else source
+        aggregates = [sa.func.count().label("row_count")]
+        for position, expectation in enumerate(expectations):
+            kind = expectation.configuration.type
+            kwargs = expectation.configuration.kwargs
+            if kind in self.MAP_EXPECTATIONS:
+                column = source.c[kwargs["column"]]
+                aggregates.append(sa.func.count(column).label(f"nonnull_{position}"))
+                condition = self._unexpected(kind, column, kwargs)
+                if condition is not None:
+                    aggregates.append(
+                        sa.func.sum(sa.case((condition, 1), else_=0)).label(
+                            f"unexpected_{position}"
+                        )
+                    )
+            elif kind == "expect_column_min_to_be_between":
+                column = source.c[kwargs["column"]]
+                aggregates.append(sa.func.min(column).label(f"observed_{position}"))
+            elif kind == "expect_column_max_to_be_between":
+                column = source.c[kwargs["column"]]
+                aggregates.append(sa.func.max(column).label(f"observed_{position}"))
+        return sa.select(*aggregates).select_from(source)
+
+    def unexpected_rows(
+        self,
+        expectation,
+        key: str,
+        after: Any = None,
+        limit: int = UNEXPECTED_PAGE_SIZE,
+    ) -> sa.sql.Select:
+        """
+        Builds the query of a page of the rows failing a column map expectation.
+
+        The page starts after the last row of the previous one instead of at an
+        offset, so each page is a range scan of `key` however deep it lies. Rows are
+        ordered by `key` and then by their physical row id (see `ROW_IDS`), selected
+        as `ROW_ID_LABEL`: keys that repeat, like the row hash, are neither skipped
+        nor returned twice across a page boundary. One row more than `limit` is
+        selected to tell whether another page follows.
+
+        Args:
+            expectation (gxe.Expectation): The expectation, supported.
+            key (str): The column to page by, ideally indexed.
+            after (tuple[Any, Any] | None, optional): The key and row id of the last
+            row of the previous page. Defaults to None, the first page.
+            limit (int, optional): The number of rows per page. Defaults to `UNEXPECTED_PAGE_SIZE`.
+
+        Returns:
+            sa.sql.Select: The query.
+
+        Raises:
+            ValueError: If the expectation is not a supported column map expectation,
+            if `key` is not a column of the table, or if the dialect has no row id.
+        """
+        kind = expectation.configuration.type
+        kwargs = expectation.configuration.kwargs
+        if kind not in self.MAP_EXPECTATIONS or not self.supports(expectation):
+            raise ValueError(f"Cannot page the unexpected rows of {kind}.")
+        if key not in self.table.c:
+            raise ValueError(f"Unknown key column: {key}")
+        if self.dialect not in self.ROW_IDS:
+            raise ValueError(f"No row id to page by in {self.dialect}.")
+
+        column = self.table.c[kwargs["column"]]
+        row_id = sa.literal_column(self.ROW_IDS[self.dialect])
+        condition = self._unexpected(kind, column, kwargs)
+        if condition is None:
+            condition = column.is_(None)
+        if after is not None:
+            condition = sa.and_(
+                condition, sa.tuple_(self.table.c[key], row_id) > sa.tuple_(*after)
+            )
+        return (
+            sa.select(self.table, row_id.label(self.ROW_ID_LABEL))
+            .where(condition)
+            .order_by(self.table.c[key], row_id)
+            .limit(limit + 1)
+        )
+
+    @staticmethod
+    def _unexpected(kind: str, column, kwargs: Dict[str, Any]):
+        """
+        Returns the condition matching the unexpected non-null values of a column.
+
+        Null values make the condition NULL, so they are never counted.
+
+        Args:
+            kind (str): The expectation type.
+            column (sa.Column): The column.
+            kwargs (Dict[str, Any]): The expectation arguments.
+
+        Returns:
+            sa.sql.ColumnElement | None: The condition, None for the not-null
+            expectation, whose unexpected values are the nulls themselves.
+        """
+        if kind == "expect_column_values_to_be_in_set":
+            return sa.not_(column.in_(list(kwargs["value_set"])))
+        if kind == "expect_column_values_to_be_between":
+            conditions = []
+            if kwargs.get("min_value") is not None:
+                below = (
+                    column <= kwargs["min_value"]
+                    if kwargs.get("strict_min")
+                    else column < kwargs["min_value"]
+                )
+                conditions.append(below)
+            if kwargs.get("max_value") is not None:
+                above = (
+                    column >= kwargs["max_value"]
+                    if kwargs.get("strict_max")
+                    else column > kwargs["max_value"]
+                )
+                conditions.append(above)
+            return sa.or_(*conditions) if conditions else sa.false()
+        return None
+
+    def evaluate(
+        self, expectations: list, row: Mapping[str, Any]
+    ) -> list[ExpectationValidationResult]:
+        """
+        Turns the row of the aggregate query into expectation results.
+
+        Args:
+            expectations (list): The expectations the query was compiled from.
+            row (Mapping[str, Any]): The row returned by the query.
+
+        Returns:
+            list[ExpectationValidationResult]: One result per expectation, in order.
+        """
+        row_count = row["row_count"]
+        results = []
+        for position, expectation in enumerate(expectations):
+            kind = expectation.configuration.type
+            kwargs = expectation.configuration.kwargs
+            if kind == "expect_column_values_to_not_be_null":
+                unexpected = row_count - row[f"nonnull_{position}"]
+                success = mostly_success(unexpected, row_count, kwargs)
+                result = map_result(
+                    row_count, row_count, unexpected, nulls_are_unexpected=True
+                )
+            elif kind in self.MAP_EXPECTATIONS:
+                nonnull = row[f"nonnull_{position}"]
+                unexpected = row[f"unexpected_{position}"] or 0
+                success = mostly_success(unexpected, nonnull, kwargs)
+                result = map_result(row_count, nonnull, unexpected)
+            elif kind == "expect_column_values_to_be_of_type":
+                column_type = self.table.c[kwargs["column"]].type
+                success = self._type_matches(column_type, kwargs.get("type_"))
+                result = {"observed_value": type(column_type).__name__}
+            else:
+                observed = (
+                    row_count
+                    if kind == "expect_table_row_count_to_be_between"
+                    else row[f"observed_{position}"]
+                )
+                success = within_bounds(observed, kwargs)
+                result = {"observed_value": observed}
+
+            results.append(
+                ExpectationValidationResult(
+                    success=success,
+                    expectation_config=expectation.configuration,
+                    result=result,
+                )
+            )
+        return results
+
+    def _type_matches(self, column_type, type_name: str | None) -> bool:
+        """
+        Checks a column type against a type name, like the GX SQL engine.
+
+        The name is resolved in the dialect's type module and in `sqlalchemy.types`,
+        so "Integer" also matches `SMALLINT` and `BIGINT` columns.
+
+        Args:
+            column_type (sa.types.TypeEngine): The reflected type of the column.
+            type_name (str | None): The expected type; None matches anything.
+
+        Returns:
+            bool: Whether the column has the expected type.
+        """
+        if type_name is None:
+            return True
+        modules = [sa.types]
+        try:
+            modules.append(
+                importlib.import_module(f"sqlalchemy.dialects.{self.dialect}")
+            )
+        except ImportError:
+            pass
+        types = tuple(
+            candidate
+            for module in modules
+            if isinstance(candidate := getattr(module, type_name, None), type)
+        )
+        return bool(types) and isinstance(column_type, types)
+
+
 class GreatExpectationsPostgresChecker(GreatExpectationsChecker):
     """Handles Great Expectations validation for PostgreSQL databases."""
 
@@ -22,12 +349,62 @@ class GreatExpectationsPostgresChecker(GreatExpectationsChecker):
         """
         Sets up the PostgreSQL data source in the Great Expectations context.
 
+        The data source is configured with the pool settings of `EngineRegistry` and
+        runs its queries on the registry's shared engine, so validation borrows
+        connections from the same pool as `DataLoader`. A data source already set up by
+        a checker of the same mode is reused without testing the connection again, and
+        one stored with the same settings is reused without being saved again.
+
         Args:
             data_source (str): The name of the data source to add or update.
             connection_string (str): The connection string for connecting to the PostgreSQL database.
         """
-        self.data_source = self.context.data_sources.add_or_update_postgres(
-            name=data_source, connection_string=connection_string
+        key = ("data_source", data_source, connection_string)
+        cached = ContextCache.get(self.context_mode, key)
+        if cached is not None:
+            self.data_source = cached
+            return
+
+        try:
+            stored = self.context.data_sources.get(data_source)
+        except KeyError:
+            stored = None
+        if (
+            stored is not None
+            and str(stored.connection_string) == connection_string
+            and stored.kwargs == EngineRegistry.pool_options()
+        ):
+            self.data_source = stored
+        else:
+            self.data_source = self.context.data_sources.add_or_update_postgres(
+                name=data_source,
+                connection_string=connection_string,
+                kwargs=EngineRegistry.pool_options(),
+            )
+            self._persisted()
+        self._share_engine(EngineRegistry.get_engine(connection_string))
+        ContextCache.put(self.context_mode, key, self.data_source)
+
+    def _share_engine(self, engine) -> None:
+        """
+        Makes the data source use an existing engine instead of creating its own.
+
+        GX has no public way to hand a data source an engine, so this sets the engine
+        caches of its `SQLDatasource`. They are private, which is why
+        great-expectations is pinned to the minor version `test_share_engine` checks.
+
+        Args:
+            engine (sa.engine.Engine): The shared engine.
+        """
+        self.data_source._engine = engine
+        self.data_source._cached_connection_string = self.data_source.connection_string
+        self.data_source._execution_engine = SqlAlchemyExecutionEngine(
+            engine=engine, data_context=self.context
+        )
+        self.data_source._cached_execution_engine_kwargs = self.data_source.dict(
+            exclude=self.data_source._get_exec_engine_excludes(),
+            config_provider=self.data_source._config_provider,
+            exclude_unset=False,
         )
 
     def set_data_asset(
@@ -36,14 +413,43 @@ class GreatExpectationsPostgresChecker(GreatExpectationsChecker):
         """
         Sets up a PostgreSQL data asset (table) in the Great Expectations context.
 
+        GX looks batches up by asset name, so each staging table gets an asset of its
+        own, named after it, with its own validation definition and checkpoint. No
+        asset shared with another run is changed, so overlapping runs in one process
+        each validate their own table. `drop_data_asset` removes them after the run.
+
         Args:
             data_asset_name (str): The name of the data asset to add for the PostgreSQL table.
             table_name (str): The name of the table in the PostgreSQL database.
             schema_name (str): The schema name in which the table resides.
         """
-        self.data_asset = self.data_source.add_table_asset(
-            name=data_asset_name, table_name=table_name, schema_name=schema_name
-        )
+        name = f"{data_asset_name}_{table_name}"
+        if name in self.data_source.get_asset_names():
+            self.data_asset = self.data_source.get_asset(name)
+        else:
+            self.data_asset = self.data_source.add_table_asset(
+                name=name, table_name=table_name, schema_name=schema_name
+            )
+            self._persisted()
+        self.validation_definition_name = f"{name} validation definition"
+        self.checkpoint_name = f"{name} checkpoint"
+
+    def drop_data_asset(self) -> None:
+        """
+        Removes the data asset of the run, with its validation definition and checkpoint.
+
+        The results already validated, and their data docs, are kept.
+        """
+        for store, name in (
+            (self.context.checkpoints, self.checkpoint_name),
+            (self.context.validation_definitions, self.validation_definition_name),
+        ):
+            try:
+                store.delete(name)
+            except DataContextError:
+                pass
+        self.data_source.delete_asset(self.data_asset.name)
+        self._persisted()
 
     def set_batch_definition(self, batch_definition) -> None:
         """
@@ -52,25 +458,302 @@ class GreatExpectationsPostgresChecker(GreatExpectationsChecker):
         Args:
             batch_definition: The batch definition that specifies how the batch is to be loaded.
         """
-        self.batch_definition = self.data_asset.add_batch_definition_whole_table(
-            batch_definition
+        self.batch_definition = self._add_batch_definition(
+            batch_definition, self.data_asset.add_batch_definition_whole_table
+        )
+
+    def set_partitioned_batch_definition(
+        self, batch_definition: str, frequency: str, column: str = PARTITION_COLUMN
+    ) -> None:
+        """
+        Defines a batch per day or month of a datetime column of the PostgreSQL table.
+
+        Each partition is then validated on its own by `run_partitioned`.
+
+        Args:
+            batch_definition (str): The name of the batch definition.
+            frequency (str): "daily" or "monthly".
+            column (str, optional): The datetime column to partition on. Defaults to
+            `PARTITION_COLUMN`.
+
+        Raises:
+            ValueError: If the frequency is not supported.
+        """
+        add = {
+            "daily": self.data_asset.add_batch_definition_daily,
+            "monthly": self.data_asset.add_batch_definition_monthly,
+        }.get(frequency)
+        if add is None:
+            raise ValueError(f"Unsupported partition frequency: {frequency}")
+        self.batch_definition = self._add_batch_definition(
+            batch_definition, lambda name: add(name, column)
+        )
+
+    def run_pushdown(self, result_format=None) -> ExpectationSuiteValidationResult:
+        """
+        Validates the suite with a single aggregate query over the table.
+
+        The expectations `SqlPushdownCompiler` supports are evaluated in one scan of
+        the data asset's table instead of one metric query each; the others are
+        validated by the GX engine on the batch. The result is saved to the
+        validation results store and queued for data docs like a checkpoint result.
+
+        Args:
+            result_format (str | Dict | None, optional): The result format of the run,
+            see `bounded_result_format`. Defaults to None, `RESULT_FORMAT`.
+
+        Returns:
+            ExpectationSuiteValidationResult: The result of the whole suite.
+        """
+        engine, table = self._reflect_table()
+        compiler = SqlPushdownCompiler(table, engine.dialect.name)
+        results = self._validate_all(
+            engine, compiler, self.suite.expectations, result_format
+        )
+        return self._save(results, "sql_pushdown", table, result_format)
+
+    def run_sampled(
+        self,
+        percent: float = SAMPLE_PERCENT,
+        method: str = SAMPLE_METHOD,
+        confidence: float = SAMPLE_CONFIDENCE,
+        seed: int | None = SAMPLE_SEED,
+        result_format=None,
+    ) -> ExpectationSuiteValidationResult:
+        """
+        Validates the suite on a `TABLESAMPLE` of the table, scanning it all only if needed.
+
+        The column map expectations are first evaluated by one aggregate query over
+        the sample. Each one whose confidence interval on the unexpected rate lies
+        clear of its `mostly` threshold is decided there (see `decide_sampled`); the
+        others, too close to call, are escalated to the full query of `run_pushdown`
+        together with the expectations that cannot be sampled.
+
+        Args:
+            percent (float, optional): The share of the table to sample, in percent.
+            Defaults to `SAMPLE_PERCENT`.
+            method (str, optional): "BERNOULLI" or "SYSTEM". The intervals only hold
+            for "BERNOULLI", see `wilson_interval`. Defaults to `SAMPLE_METHOD`.
+            confidence (float, optional): The confidence level of the intervals.
+            Defaults to `SAMPLE_CONFIDENCE`.
+            seed (int | None, optional): Makes the sample repeatable. Defaults to `SAMPLE_SEED`.
+            result_format (str | Dict | None, optional): The result format of the run,
+            see `bounded_result_format`. Defaults to None, `RESULT_FORMAT`.
+
+        Returns:
+            ExpectationSuiteValidationResult: The result of the whole suite.
+        """
+        if method.upper() != "BERNOULLI":
+            logger.warning(
+                f"{method} samples whole pages: the sampling intervals are too narrow."
+            )
+        engine, table = self._reflect_table()
+        compiler = SqlPushdownCompiler(table, engine.dialect.name)
+        sampled = [
+            e
+            for e in self.suite.expectations
+            if compiler.supports(e)
+            and e.configuration.type in SqlPushdownCompiler.MAP_EXPECTATIONS
+        ]
+        sampling = {"method": method, "percent": percent}
+
+        results: Dict[int, ExpectationValidationResult] = {}
+        escalated: Dict[int, Dict[str, Any]] = {}
+        if sampled:
+            query = compiler.compile(sampled, compiler.sample(method, percent, seed))
+            with engine.connect() as connection:
+                row = connection.execute(query).mappings().one()
+            for expectation, result in zip(sampled, compiler.evaluate(sampled, row)):
+                decided, details = decide_sampled(result, confidence, sampling)
+                if decided is None:
+                    escalated[id(expectation)] = details
+                else:
+                    results[id(expectation)] = decided
+
+        remaining = [e for e in self.suite.expectations if id(e) not in results]
+        logger.info(
+            f"{len(results)} expectations decided on a {percent}% {method} sample, "
+            f"{len(escalated)} escalated to a full scan."
+        )
+        for key, result in self._validate_all(
+            engine, compiler, remaining, result_format
+        ).items():
+            if key in escalated:
+                result.result["details"] = {"escalated": True, **escalated[key]}
+            results[key] = result
+        return self._save(
+            results,
+            "sql_sampled",
+            table,
+            result_format,
+            sampling={
+                **sampling,
+                "confidence": confidence,
+                "escalated": len(escalated),
+            },
+        )
+
+    def unexpected_rows(
+        self,
+        expectation,
+        key: str,
+        after: Any = None,
+        limit: int = UNEXPECTED_PAGE_SIZE,
+    ) -> tuple[list[Dict[str, Any]], Any]:
+        """
+        Fetches a page of the rows failing a column map expectation, ordered by `key`.
+
+        Results only sample a few unexpected values; the failing rows are fetched
+        here on demand, see `SqlPushdownCompiler.unexpected_rows`.
+
+        Args:
+            expectation (gxe.Expectation): The expectation, supported by `SqlPushdownCompiler`.
+            key (str): The column to page by, ideally indexed. It need not be unique.
+            after (tuple[Any, Any] | None, optional): The cursor returned with the
+            previous page. Defaults to None, the first page.
+            limit (int, optional): The number of rows per page. Defaults to `UNEXPECTED_PAGE_SIZE`.
+
+        Returns:
+            tuple[list[Dict[str, Any]], tuple[Any, Any] | None]: The rows, and the
+            cursor to pass as `after` for the next page, or None if this page is the
+            last one.
+        """
+        engine, table = self._reflect_table()
+        query = SqlPushdownCompiler(table, engine.dialect.name).unexpected_rows(
+            expectation, key, after, limit
+        )
+        with engine.connect() as connection:
+            rows = [dict(row) for row in connection.execute(query).mappings()]
+        cursors = [
+            (row[key], row.pop(SqlPushdownCompiler.ROW_ID_LABEL)) for row in rows
+        ]
+        if len(rows) <= limit:
+            return rows, None
+        return rows[:limit], cursors[limit - 1]
+
+    def _reflect_table(self) -> tuple[sa.engine.Engine, sa.Table]:
+        """
+        Reflects the table of the data asset.
+
+        Returns:
+            tuple[sa.engine.Engine, sa.Table]: The engine of the data source and the table.
+        """
+        engine = self.data_source.get_engine()
+        schema_name = self.data_asset.schema_name
+        table = sa.Table(
+            self.data_asset.table_name,
+            sa.MetaData(),
+            schema=schema_name if isinstance(schema_name, str) else None,
+            autoload_with=engine,
+        )
+        return engine, table
+
+    def _validate_all(
+        self,
+        engine,
+        compiler: SqlPushdownCompiler,
+        expectations: list,
+        result_format=None,
+    ) -> Dict[int, ExpectationValidationResult]:
+        """
+        Validates expectations on the whole table.
+
+        Args:
+            engine (sa.engine.Engine): The engine of the data source.
+            compiler (SqlPushdownCompiler): The compiler of the table.
+            expectations (list): The expectations.
+            result_format (str | Dict | None, optional): The result format of the run,
+            passed bounded to the GX engine. Defaults to None, `RESULT_FORMAT`.
+
+        Returns:
+            Dict[int, ExpectationValidationResult]: The results, by `id` of expectation.
+        """
+        pushed = [e for e in expectations if compiler.supports(e)]
+        fallback = [e for e in expectations if not compiler.supports(e)]
+
+        results: Dict[int, ExpectationValidationResult] = {}
+        if pushed:
+            with engine.connect() as connection:
+                row = connection.execute(compiler.compile(pushed)).mappings().one()
+            results.update(zip(map(id, pushed), compiler.evaluate(pushed, row)))
+        if fallback:
+            logger.info(f"{len(fallback)} expectations validated by the GX engine.")
+            batch = self.batch_definition.get_batch()
+            run_format = widest_result_format(
+                bounded_result_format(result_format),
+                [expectation.configuration for expectation in fallback],
+            )
+            for expectation in fallback:
+                results[id(expectation)] = batch.validate(
+                    expectation, result_format=run_format
+                )
+        return results
+
+    def _save(
+        self,
+        results: Dict[int, ExpectationValidationResult],
+        run_name: str,
+        table: sa.Table,
+        result_format=None,
+        **meta,
+    ) -> ExpectationSuiteValidationResult:
+        """
+        Assembles the suite result, saves it and queues it for data docs.
+
+        Args:
+            results (Dict[int, ExpectationValidationResult]): The results, by `id` of expectation.
+            run_name (str): The name of the run.
+            table (sa.Table): The validated table.
+            result_format (str | Dict | None, optional): The result format of the run,
+            the results are trimmed to. Defaults to None, `RESULT_FORMAT`.
+            **meta: Extra metadata of the result.
+
+        Returns:
+            ExpectationSuiteValidationResult: The result of the whole suite.
+        """
+        ordered = [results[id(expectation)] for expectation in self.suite.expectations]
+        bound_results(ordered, result_format)
+        run_id = RunIdentifier(run_name=run_name, run_time=datetime.now(timezone.utc))
+        validation_result = suite_result(
+            ordered,
+            self.suite.name,
+            meta={
+                "run_id": run_id.to_json_dict(),
+                "validation_time": run_id.run_time.isoformat(),
+                "batch_spec": {
+                    "table_name": table.name,
+                    "schema_name": table.schema,
+                },
+                "active_batch_definition": {
+                    "datasource_name": self.data_source.name,
+                    "data_asset_name": self.data_asset.name,
+                    "batch_definition_name": self.batch_definition.name,
+                },
+                **meta,
+            },
         )
 
+        identifier = ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(self.suite.name),
+            run_id=run_id,
+            batch_identifier=self.data_asset.name,
+        )
+        self.context.validation_results_store.set(identifier, validation_result)
+        self.docs.validation_stored(identifier)
+        return validation_result
+
     def create_expectations(self):
         """Defines and updates expectations for the PostgreSQL dataset."""
-        self.suite.expectations.clear()
-
         expectations = [
             gxe.ExpectColumnValuesToBeOfType(column="vendor_id", type_="Integer"),
             # gxe.ExpectColumnValuesToBeUnique(column="vendor_id"),
         ]
 
-        self.suite.expectations.extend(expectations)
-
-        self._update_suite()
+        self._set_expectations(expectations)
 
     def _update_suite(self):
-        """Persists the updated expectation suite in the Great Expectations context and rebuilds data docs."""
+        """Persists the updated expectation suite in the Great Expectations context and queues its data docs page."""
         self.context.suites.add_or_update(self.suite)
         self.suite.save()
-        self.context.build_data_docs()
+        self._persisted()
+        self.docs.suite_changed(self.suite.name)
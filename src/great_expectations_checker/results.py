@@ -0,0 +1,484 @@
+import math
+import great_expectations as gx
+
+from typing import Any, Dict
+from statistics import NormalDist
+from collections import Counter
+from great_expectations.core import (
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+
+from src.config.config import RESULT_FORMAT, UNEXPECTED_SAMPLE_CAP
+from .column_metrics import combine
+
+PARTIAL_UNEXPECTED_COUNT: int = UNEXPECTED_SAMPLE_CAP
+# The result formats of GX, from the least to the most detailed.
+RESULT_FORMATS: tuple = ("BOOLEAN_ONLY", "BASIC", "SUMMARY", "COMPLETE")
+# Result keys listing every unexpected value or row, never kept by a bounded format.
+_UNBOUNDED_KEYS: tuple = (
+    "unexpected_list",
+    "unexpected_index_list",
+    "unexpected_index_query",
+    "unexpected_rows",
+)
+# Result keys reported from the "SUMMARY" format on.
+_SUMMARY_KEYS: tuple = ("partial_unexpected_counts", "partial_unexpected_index_list")
+
+
+class PartialMetrics:
+    """
+    Mergeable metrics of one expectation over part of the rows.
+
+    Counts add up, extremes combine and observed values such as column lists or
+    dtypes accumulate, so the metrics of consecutive chunks merge into those of
+    the whole data.
+    """
+
+    def __init__(
+        self,
+        element_count: int = 0,
+        nonnull_count: int = 0,
+        unexpected_count: int = 0,
+        minimum: Any = None,
+        maximum: Any = None,
+        observed: list | None = None,
+        partial_unexpected_list: list | None = None,
+        partial_unexpected_index_list: list | None = None,
+    ) -> None:
+        """
+        Initializes the metrics.
+
+        Args:
+            element_count (int, optional): The number of rows. Defaults to 0.
+            nonnull_count (int, optional): The number of non-null values. Defaults to 0.
+            unexpected_count (int, optional): The number of unexpected values. Defaults to 0.
+            minimum (Any, optional): The smallest non-null value. Defaults to None.
+            maximum (Any, optional): The largest non-null value. Defaults to None.
+            observed (list | None, optional): The distinct observed values, e.g. the
+            column lists or dtypes. Defaults to None.
+            partial_unexpected_list (list | None, optional): The first unexpected
+            values. Defaults to None.
+            partial_unexpected_index_list (list | None, optional): Their index labels.
+            Defaults to None.
+        """
+        self.element_count = element_count
+        self.nonnull_count = nonnull_count
+        self.unexpected_count = unexpected_count
+        self.minimum = minimum
+        self.maximum = maximum
+        self.observed = list(observed or [])
+        self.partial_unexpected_list = list(partial_unexpected_list or [])
+        self.partial_unexpected_index_list = list(partial_unexpected_index_list or [])
+
+    def merge(self, other: "PartialMetrics") -> "PartialMetrics":
+        """
+        Combines these metrics with those of the following rows.
+
+        Args:
+            other (PartialMetrics): The metrics of the following rows.
+
+        Returns:
+            PartialMetrics: The metrics of both.
+        """
+        return PartialMetrics(
+            element_count=self.element_count + other.element_count,
+            nonnull_count=self.nonnull_count + other.nonnull_count,
+            unexpected_count=self.unexpected_count + other.unexpected_count,
+            minimum=combine(min, self.minimum, other.minimum),
+            maximum=combine(max, self.maximum, other.maximum),
+            observed=self.observed
+            + [value for value in other.observed if value not in self.observed],
+            partial_unexpected_list=(
+                self.partial_unexpected_list + other.partial_unexpected_list
+            )[:PARTIAL_UNEXPECTED_COUNT],
+            partial_unexpected_index_list=(
+                self.partial_unexpected_index_list + other.partial_unexpected_index_list
+            )[:PARTIAL_UNEXPECTED_COUNT],
+        )
+
+
+def percent(count: int, total: int) -> float | None:
+    """
+    Returns `count` as a percentage of `total`.
+
+    Args:
+        count (int): The part.
+        total (int): The whole.
+
+    Returns:
+        float | None: The percentage, or None if `total` is 0.
+    """
+    return count / total * 100 if total else None
+
+
+def mostly_success(unexpected: int, domain: int, kwargs: Dict[str, Any]) -> bool:
+    """
+    Checks the share of expected values against the `mostly` argument, like GX.
+
+    Args:
+        unexpected (int): The number of unexpected values.
+        domain (int): The number of evaluated values.
+        kwargs (Dict[str, Any]): The expectation arguments; `mostly` defaults to 1.
+
+    Returns:
+        bool: Whether the expectation is met; an empty domain always is.
+    """
+    if not domain:
+        return True
+    return (domain - unexpected) / domain >= kwargs.get("mostly", 1)
+
+
+def within_bounds(observed: Any, kwargs: Dict[str, Any]) -> bool:
+    """
+    Checks an observed value against the `min_value`/`max_value` bounds, like GX.
+
+    Args:
+        observed (Any): The observed value, e.g. a row count or a column minimum.
+        kwargs (Dict[str, Any]): The expectation arguments, with the optional
+        `strict_min`/`strict_max` flags.
+
+    Returns:
+        bool: Whether the value is within the bounds; None never is.
+    """
+    if observed is None:
+        return False
+    min_value, max_value = kwargs.get("min_value"), kwargs.get("max_value")
+    if min_value is not None:
+        if observed < min_value or (kwargs.get("strict_min") and observed == min_value):
+            return False
+    if max_value is not None:
+        if observed > max_value or (kwargs.get("strict_max") and observed == max_value):
+            return False
+    return True
+
+
+def partial_unexpected_counts(values: list) -> list[Dict[str, Any]]:
+    """
+    Counts the sampled unexpected values, most frequent first, like GX.
+
+    Args:
+        values (list): The sampled unexpected values.
+
+    Returns:
+        list[Dict[str, Any]]: The value and count of each distinct value.
+    """
+    counts = Counter(values).items()
+    try:
+        ordered = sorted(counts, key=lambda item: (-item[1], item[0]))
+    except TypeError:
+        ordered = sorted(counts, key=lambda item: -item[1])
+    return [{"value": value, "count": count} for value, count in ordered]
+
+
+def map_result(
+    element_count: int,
+    nonnull_count: int,
+    unexpected_count: int,
+    partial_unexpected_list: list | None = None,
+    nulls_are_unexpected: bool = False,
+    partial_unexpected_index_list: list | None = None,
+) -> Dict[str, Any]:
+    """
+    Returns the `result` of a column map expectation, with the fields GX reports.
+
+    Args:
+        element_count (int): The number of rows.
+        nonnull_count (int): The number of non-null values of the column.
+        unexpected_count (int): The number of unexpected values.
+        partial_unexpected_list (list | None, optional): Up to `PARTIAL_UNEXPECTED_COUNT`
+        unexpected values. Defaults to None, an empty list.
+        nulls_are_unexpected (bool, optional): True for the not-null expectation, whose
+        domain is every row rather than the non-null values. Defaults to False.
+        partial_unexpected_index_list (list | None, optional): The index labels of the
+        sampled values; their counts are added along with them. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The result.
+    """
+    partial_unexpected_list = list(partial_unexpected_list or [])
+    if nulls_are_unexpected:
+        result = {
+            "element_count": element_count,
+            "unexpected_count": unexpected_count,
+            "unexpected_percent": percent(unexpected_count, element_count),
+            "partial_unexpected_list": partial_unexpected_list,
+        }
+    else:
+        missing_count = element_count - nonnull_count
+        result = {
+            "element_count": element_count,
+            "unexpected_count": unexpected_count,
+            "unexpected_percent": percent(unexpected_count, nonnull_count),
+            "partial_unexpected_list": partial_unexpected_list,
+            "missing_count": missing_count,
+            "missing_percent": percent(missing_count, element_count),
+            "unexpected_percent_total": percent(unexpected_count, element_count),
+            "unexpected_percent_nonmissing": percent(unexpected_count, nonnull_count),
+        }
+    if partial_unexpected_index_list is not None:
+        result["partial_unexpected_counts"] = partial_unexpected_counts(
+            partial_unexpected_list
+        )
+        result["partial_unexpected_index_list"] = list(partial_unexpected_index_list)
+    return result
+
+
+def wilson_interval(
+    unexpected: int, domain: int, confidence: float
+) -> tuple[float, float]:
+    """
+    Returns the Wilson score interval of an unexpected-value rate measured on a sample.
+
+    Unlike the normal approximation, the interval stays within [0, 1] and is
+    meaningful for rates close to 0, which is where most expectations sit. It
+    assumes every value was sampled independently, as `BERNOULLI` samples rows.
+    A `SYSTEM` sample keeps whole pages or blocks, whose values tend to be alike,
+    so on such a sample the interval is too narrow.
+
+    Args:
+        unexpected (int): The number of unexpected values in the sample.
+        domain (int): The number of evaluated values in the sample.
+        confidence (float): The confidence level, e.g. 0.95.
+
+    Returns:
+        tuple[float, float]: The lower and upper bounds; (0, 1) for an empty sample.
+    """
+    if not domain:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    rate = unexpected / domain
+    denominator = 1 + z**2 / domain
+    center = (rate + z**2 / (2 * domain)) / denominator
+    margin = (
+        z * math.sqrt(rate * (1 - rate) / domain + z**2 / (4 * domain**2))
+    ) / denominator
+    # The bounds are exact at the edges, where rounding would leave them off 0 or 1.
+    low = 0.0 if unexpected == 0 else max(0.0, center - margin)
+    high = 1.0 if unexpected == domain else min(1.0, center + margin)
+    return low, high
+
+
+def decide_sampled(
+    sample_result: ExpectationValidationResult,
+    confidence: float,
+    sampling: Dict[str, Any],
+) -> tuple[ExpectationValidationResult | None, Dict[str, Any]]:
+    """
+    Decides a column map expectation from its result on a sample.
+
+    The expectation fails when its unexpected rate may exceed `1 - mostly`. It is
+    decided when the whole confidence interval of the rate lies on one side of that
+    threshold; otherwise the estimate is too close to call and the expectation must
+    be validated on all the rows. Without `mostly`, a sample can prove a failure but
+    never a success. The decision is only as sound as `wilson_interval`, i.e. for a
+    `BERNOULLI` sample.
+
+    Args:
+        sample_result (ExpectationValidationResult): The result on the sample.
+        confidence (float): The confidence level of the interval.
+        sampling (Dict[str, Any]): How the sample was drawn, added to the details.
+
+    Returns:
+        tuple[ExpectationValidationResult | None, Dict[str, Any]]: The decided result,
+        or None if a full validation is needed, and the sampling details.
+    """
+    result = sample_result.result
+    domain = result["element_count"] - result.get("missing_count", 0)
+    low, high = wilson_interval(result["unexpected_count"], domain, confidence)
+    threshold = 1 - sample_result.expectation_config.kwargs.get("mostly", 1)
+    details = {
+        **sampling,
+        "confidence": confidence,
+        "unexpected_rate_interval": [low, high],
+    }
+    if low <= threshold < high:
+        return None, details
+    return (
+        ExpectationValidationResult(
+            success=high <= threshold,
+            expectation_config=sample_result.expectation_config,
+            result={**result, "details": {"sampled": True, **details}},
+        ),
+        details,
+    )
+
+
+def bounded_result_format(result_format: str | Dict | None = None) -> Dict[str, Any]:
+    """
+    Returns a result format whose unexpected samples are capped.
+
+    "COMPLETE" lists every unexpected value and index, which can mean millions of
+    rows held in memory and written into the validation results; it is bounded to
+    "SUMMARY", and the failing rows are fetched page by page with the checkers'
+    `unexpected_rows` instead. Unexpected rows and index queries are never included,
+    and `partial_unexpected_count` is capped at `UNEXPECTED_SAMPLE_CAP`.
+
+    Args:
+        result_format (str | Dict | None, optional): A GX result format, as a level
+        name or a dictionary. Defaults to None, `RESULT_FORMAT`.
+
+    Returns:
+        Dict[str, Any]: The bounded result format, as a dictionary.
+
+    Raises:
+        ValueError: If the level is not a GX result format.
+    """
+    if result_format is None:
+        result_format = RESULT_FORMAT
+    if not isinstance(result_format, dict):
+        result_format = {"result_format": result_format}
+    level = result_format.get("result_format", RESULT_FORMAT)
+    level = str(getattr(level, "value", level)).upper()
+    if level not in RESULT_FORMATS:
+        raise ValueError(f"Unknown result format: {level}")
+
+    bounded = {
+        key: value
+        for key, value in result_format.items()
+        if key not in ("include_unexpected_rows", "return_unexpected_index_query")
+    }
+    count = result_format.get("partial_unexpected_count", UNEXPECTED_SAMPLE_CAP)
+    bounded["result_format"] = "SUMMARY" if level == "COMPLETE" else level
+    bounded["partial_unexpected_count"] = max(0, min(count, UNEXPECTED_SAMPLE_CAP))
+    return bounded
+
+
+def expectation_result_format(
+    configuration, run_format: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Returns the bounded result format of an expectation.
+
+    Args:
+        configuration (ExpectationConfiguration): The configuration of the expectation.
+        run_format (Dict[str, Any]): The bounded result format of the run.
+
+    Returns:
+        Dict[str, Any]: The expectation's own `result_format` argument, bounded, or
+        the format of the run if it has none.
+    """
+    own = configuration.kwargs.get("result_format")
+    return run_format if own is None else bounded_result_format(own)
+
+
+def widest_result_format(
+    run_format: Dict[str, Any], configurations: list
+) -> Dict[str, Any]:
+    """
+    Returns the bounded format detailed enough for the run and every expectation.
+
+    GX applies the format of a run to all its expectations, so the run asks for the
+    most detailed one and `bound_result` trims each result to its own format.
+
+    Args:
+        run_format (Dict[str, Any]): The bounded result format of the run.
+        configurations (list): The configurations of the expectations.
+
+    Returns:
+        Dict[str, Any]: The bounded result format.
+    """
+    formats = [run_format] + [
+        expectation_result_format(configuration, run_format)
+        for configuration in configurations
+    ]
+    return {
+        **run_format,
+        "result_format": max(
+            (f["result_format"] for f in formats), key=RESULT_FORMATS.index
+        ),
+        "partial_unexpected_count": max(f["partial_unexpected_count"] for f in formats),
+    }
+
+
+def bound_result(
+    result: ExpectationValidationResult, result_format: Dict[str, Any]
+) -> bool:
+    """
+    Trims the `result` of an expectation to a bounded result format, in place.
+
+    Args:
+        result (ExpectationValidationResult): The expectation result.
+        result_format (Dict[str, Any]): The bounded result format.
+
+    Returns:
+        bool: Whether anything was trimmed.
+    """
+    details = result.result or {}
+    level = result_format["result_format"]
+    if level == "BOOLEAN_ONLY":
+        result.result = {}
+        return bool(details)
+
+    count = result_format["partial_unexpected_count"]
+    dropped = _UNBOUNDED_KEYS + (_SUMMARY_KEYS if level == "BASIC" else ())
+    bounded = {key: value for key, value in details.items() if key not in dropped}
+    truncated = False
+    for key in ("partial_unexpected_list", "partial_unexpected_index_list"):
+        if key in bounded and len(bounded[key]) > count:
+            bounded[key] = list(bounded[key])[:count]
+            truncated = True
+    if truncated and "partial_unexpected_counts" in bounded:
+        bounded["partial_unexpected_counts"] = partial_unexpected_counts(
+            bounded.get("partial_unexpected_list", [])
+        )
+    if not truncated and len(bounded) == len(details):
+        return False
+    result.result = bounded
+    return True
+
+
+def bound_results(
+    results: list[ExpectationValidationResult],
+    result_format: str | Dict | None = None,
+) -> bool:
+    """
+    Trims expectation results to their bounded result formats, in place.
+
+    Args:
+        results (list[ExpectationValidationResult]): The results.
+        result_format (str | Dict | None, optional): The result format of the run, for
+        the expectations without their own. Defaults to None, `RESULT_FORMAT`.
+
+    Returns:
+        bool: Whether any result was trimmed.
+    """
+    run_format = bounded_result_format(result_format)
+    trimmed = [
+        bound_result(
+            result, expectation_result_format(result.expectation_config, run_format)
+        )
+        for result in results
+    ]
+    return any(trimmed)
+
+
+def suite_result(
+    results: list[ExpectationValidationResult],
+    suite_name: str,
+    meta: Dict[str, Any] | None = None,
+) -> ExpectationSuiteValidationResult:
+    """
+    Assembles expectation results into a suite result with GX statistics.
+
+    Args:
+        results (list[ExpectationValidationResult]): The results, in suite order.
+        suite_name (str): The name of the suite.
+        meta (Dict[str, Any] | None, optional): Extra metadata. Defaults to None.
+
+    Returns:
+        ExpectationSuiteValidationResult: The suite result.
+    """
+    successful = sum(bool(result.success) for result in results)
+    return ExpectationSuiteValidationResult(
+        success=successful == len(results),
+        results=results,
+        suite_name=suite_name,
+        statistics={
+            "evaluated_expectations": len(results),
+            "successful_expectations": successful,
+            "unsuccessful_expectations": len(results) - successful,
+            "success_percent": percent(successful, len(results)),
+        },
+        meta={"great_expectations_version": gx.__version__, **(meta or {})},
+    )
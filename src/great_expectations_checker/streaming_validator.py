@@ -0,0 +1,160 @@
+import logging
+import pandas as pd
+
+from typing import Iterator
+from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.expectations.metadata_types import FailureSeverity
+
+from .pandas_checker import VectorizedValidator, finalize
+from .results import PartialMetrics, suite_result
+
+logger: logging.Logger = logging.getLogger("class StreamingValidator")
+
+
+class StreamingValidator:
+    """
+    Validates a stream of DataFrame chunks as they are extracted.
+
+    Each chunk yields the mergeable metrics of `VectorizedValidator`, which are
+    combined into the result of the whole stream, so validation needs neither the
+    whole file in memory nor a staged table. A critical expectation that can no
+    longer pass, e.g. a schema mismatch or a null in a column expected to be fully
+    non-null, aborts the stream before the following chunks are loaded; give an
+    expectation the "warning" severity to only report its failure at the end.
+    """
+
+    def __init__(self, expectations: list, suite_name: str = "streaming") -> None:
+        """
+        Initializes the validator.
+
+        Args:
+            expectations (list): The expectations, supported by `VectorizedValidator`.
+            suite_name (str, optional): The suite name of the result. Defaults to "streaming".
+        """
+        self.expectations = list(expectations)
+        self.suite_name = suite_name
+        self.metrics = [PartialMetrics() for _ in self.expectations]
+        self.chunks = 0
+
+    def iter_validated(self, chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Validates each chunk before passing it on.
+
+        Args:
+            chunks (Iterator[pd.DataFrame]): The extracted chunks.
+
+        Yields:
+            pd.DataFrame: The chunks, once validated.
+
+        Raises:
+            ValueError: If a chunk makes a critical expectation fail for good.
+        """
+        for chunk in chunks:
+            self.update(chunk)
+            yield chunk
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Merges the metrics of a chunk and checks for hard failures.
+
+        Args:
+            chunk (pd.DataFrame): The next chunk.
+
+        Raises:
+            ValueError: If an expectation is not supported, or if a critical
+            expectation can no longer pass.
+        """
+        validator = VectorizedValidator(chunk, workers=1)
+        unsupported = [e for e in self.expectations if not validator.supports(e)]
+        if unsupported:
+            raise ValueError(
+                f"Chunk {self.chunks} cannot be validated by streaming: "
+                + ", ".join(e.configuration.type for e in unsupported)
+            )
+
+        partial = validator.metrics(self.expectations)
+        self.metrics = [
+            metrics.merge(chunk_metrics)
+            for metrics, chunk_metrics in zip(self.metrics, partial)
+        ]
+        for expectation, metrics in zip(self.expectations, self.metrics):
+            if (
+                expectation.severity == FailureSeverity.CRITICAL
+                and self._failed_for_good(expectation, metrics)
+            ):
+                message = (
+                    f"Hard failure in chunk {self.chunks}: {_describe(expectation)} "
+                    f"failed after {metrics.element_count} rows."
+                )
+                logger.error(message)
+                raise ValueError(message)
+        self.chunks += 1
+
+    @staticmethod
+    def _failed_for_good(expectation, metrics: PartialMetrics) -> bool:
+        """
+        Checks whether an expectation fails whatever the following chunks hold.
+
+        Column lists and dtypes fail as soon as one chunk differs. Column map
+        expectations without `mostly` fail with their first unexpected value, row
+        counts once they exceed the maximum, and column minimums or maximums once
+        they cross their bound, since they only move further with more rows.
+
+        Args:
+            expectation (gxe.Expectation): The expectation.
+            metrics (PartialMetrics): Its metrics so far.
+
+        Returns:
+            bool: Whether the expectation can no longer pass.
+        """
+        kind = expectation.configuration.type
+        kwargs = expectation.configuration.kwargs
+        if kind in VectorizedValidator.MAP_EXPECTATIONS:
+            return kwargs.get("mostly", 1) >= 1 and metrics.unexpected_count > 0
+        if kind == "expect_table_row_count_to_be_between":
+            return not _below_max(metrics.element_count, kwargs)
+        if kind == "expect_column_min_to_be_between":
+            return metrics.minimum is not None and not _above_min(
+                metrics.minimum, kwargs
+            )
+        if kind == "expect_column_max_to_be_between":
+            return metrics.maximum is not None and not _below_max(
+                metrics.maximum, kwargs
+            )
+        return not finalize(expectation, metrics).success
+
+    def result(self) -> ExpectationSuiteValidationResult:
+        """
+        Returns the result of the chunks validated so far.
+
+        Returns:
+            ExpectationSuiteValidationResult: The result of the whole stream.
+        """
+        results = [
+            finalize(expectation, metrics)
+            for expectation, metrics in zip(self.expectations, self.metrics)
+        ]
+        return suite_result(results, self.suite_name, meta={"chunks": self.chunks})
+
+
+def _above_min(value, kwargs) -> bool:
+    """Checks a value against the `min_value` bound only."""
+    min_value = kwargs.get("min_value")
+    if min_value is None:
+        return True
+    return value > min_value or (not kwargs.get("strict_min") and value == min_value)
+
+
+def _below_max(value, kwargs) -> bool:
+    """Checks a value against the `max_value` bound only."""
+    max_value = kwargs.get("max_value")
+    if max_value is None:
+        return True
+    return value < max_value or (not kwargs.get("strict_max") and value == max_value)
+
+
+def _describe(expectation) -> str:
+    """Returns the type and column of an expectation, for messages."""
+    column = expectation.configuration.kwargs.get("column")
+    kind = expectation.configuration.type
+    return f"{kind}({column})" if column else kind
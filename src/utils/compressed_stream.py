@@ -0,0 +1,143 @@
+import io
+import time
+import logging
+
+import pyarrow as pa
+
+from pathlib import Path
+from typing import BinaryIO, Dict
+
+logger: logging.Logger = logging.getLogger("class DecompressingStream")
+
+COMPRESSION_EXTENSIONS: Dict[str, str] = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+    ".bz2": "bz2",
+}
+
+MAGIC_BYTES: Dict[bytes, str] = {
+    b"\x1f\x8b": "gzip",
+    b"\x28\xb5\x2f\xfd": "zstd",
+    b"BZh": "bz2",
+}
+
+MAGIC_LENGTH: int = max(len(magic) for magic in MAGIC_BYTES)
+
+
+def detect_compression(name: str, head: bytes = b"") -> str | None:
+    """
+    Detects the compression of a file from its extension, then from its magic bytes.
+
+    Args:
+        name (str): The file name, path or URL.
+        head (bytes, optional): The first bytes of the file. Defaults to b"".
+
+    Returns:
+        str | None: The pyarrow codec name ('gzip', 'zstd' or 'bz2'), or None if the
+        file is not compressed.
+    """
+    extension = Path(name.split("?")[0]).suffix.lower()
+    if extension in COMPRESSION_EXTENSIONS:
+        return COMPRESSION_EXTENSIONS[extension]
+
+    for magic, codec in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+class MeteredStream(io.RawIOBase):
+    """Read-only stream wrapper counting the bytes read through it."""
+
+    def __init__(self, raw: BinaryIO, prefix: bytes = b"") -> None:
+        """
+        Wraps a readable binary stream.
+
+        Args:
+            raw (BinaryIO): The stream to read from.
+            prefix (bytes, optional): Bytes already consumed from `raw` (e.g. to sniff the
+            magic bytes) that are returned before the rest of the stream. Defaults to b"".
+        """
+        super().__init__()
+        self.raw = raw
+        self.prefix = prefix
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        """Returns True, the stream is readable."""
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Reads bytes into a pre-allocated buffer.
+
+        Args:
+            buffer: The writable buffer.
+
+        Returns:
+            int: The number of bytes read, 0 at the end of the stream.
+        """
+        if self.prefix:
+            data, self.prefix = self.prefix[: len(buffer)], self.prefix[len(buffer) :]
+        else:
+            data = self.raw.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        self.bytes_read += size
+        return size
+
+
+class DecompressingStream:
+    """Context manager decompressing a binary stream on the fly for the CSV parser."""
+
+    def __init__(self, raw: BinaryIO, name: str) -> None:
+        """
+        Sniffs the compression of a stream.
+
+        Args:
+            raw (BinaryIO): The compressed (or plain) binary stream.
+            name (str): The file name, path or URL, used to detect the compression.
+        """
+        head = raw.read(MAGIC_LENGTH)
+        self.codec = detect_compression(name, head)
+        self.compressed = MeteredStream(raw, prefix=head)
+        if self.codec is None:
+            self.uncompressed = self.compressed
+        else:
+            self.uncompressed = MeteredStream(
+                pa.CompressedInputStream(
+                    pa.PythonFile(self.compressed, mode="r"), self.codec
+                )
+            )
+        self.started = time.perf_counter()
+        self.throughput: Dict[str, float] = {}
+
+    def __enter__(self) -> MeteredStream:
+        """
+        Starts the clock.
+
+        Returns:
+            MeteredStream: The decompressed stream to hand to the parser.
+        """
+        self.started = time.perf_counter()
+        return self.uncompressed
+
+    def __exit__(self, *exc_info) -> None:
+        """Computes and logs the throughput achieved while the stream was read."""
+        seconds = max(time.perf_counter() - self.started, 1e-9)
+        self.throughput = {
+            "codec": self.codec or "none",
+            "compressed_bytes": self.compressed.bytes_read,
+            "uncompressed_bytes": self.uncompressed.bytes_read,
+            "seconds": seconds,
+            "compressed_mb_per_s": self.compressed.bytes_read / seconds / 1024**2,
+            "uncompressed_mb_per_s": self.uncompressed.bytes_read / seconds / 1024**2,
+        }
+        logger.info(
+            "Read {compressed_bytes} {codec} bytes ({compressed_mb_per_s:.1f} MB/s) "
+            "into {uncompressed_bytes} bytes ({uncompressed_mb_per_s:.1f} MB/s).".format(
+                **self.throughput
+            )
+        )
@@ -0,0 +1,345 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import urllib.parse
+import urllib.request
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pathlib import Path
+from typing import Dict, Iterator
+
+from src.utils.my_logger import LoggerSetup
+from src.config.config import CACHE_DIR, CACHE_MAX_BYTES, CACHE_MAX_AGE_SECONDS
+
+logger: logging.Logger = logging.getLogger("class ParquetDataCache")
+
+HASH_BLOCK_SIZE: int = 1024 * 1024
+# Remembers the content hash of each local file, by absolute path and (size, mtime_ns).
+HASH_INDEX: str = "hashes.json"
+# Directory of the copies of remote sources downloaded to hash them.
+SOURCES_DIR: str = "sources"
+
+
+class ParquetDataCache:
+    """Content-addressed on-disk cache storing parsed source files as Parquet."""
+
+    def __init__(
+        self,
+        cache_dir: str = CACHE_DIR,
+        max_bytes: int = CACHE_MAX_BYTES,
+        max_age_seconds: int = CACHE_MAX_AGE_SECONDS,
+    ) -> None:
+        """
+        Initializes the cache in the given directory.
+
+        Args:
+            cache_dir (str, optional): Directory where the Parquet files are stored.
+            Defaults to `CACHE_DIR`.
+            max_bytes (int, optional): Maximum total size of the cache, the least recently
+            used entries are evicted above it. Defaults to `CACHE_MAX_BYTES`.
+            max_age_seconds (int, optional): Entries not used for longer than this are
+            evicted. Defaults to `CACHE_MAX_AGE_SECONDS`.
+
+        Raises:
+            ValueError: If `max_bytes` or `max_age_seconds` is not positive.
+        """
+        LoggerSetup()
+
+        if max_bytes <= 0 or max_age_seconds <= 0:
+            logger.error("Cache limits must be positive.")
+            raise ValueError("Cache limits must be positive")
+
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.copies: Dict[str, Path] = {}
+
+    def fingerprint(self, url: str, schema: Dict[str, str] | None = None) -> str:
+        """
+        Builds the cache key of a source from its URL and version validator.
+
+        Remote sources are identified by their `ETag` or `Last-Modified` header, local
+        files and servers without validators by a hash of their content. A remote
+        source hashed this way is downloaded once, see `local_copy`.
+
+        Args:
+            url (str): The URL or local path of the source file.
+            schema (Dict[str, str] | None, optional): The schema the source is parsed
+            with, so that data parsed with different dtypes is cached separately.
+            Defaults to None.
+
+        Returns:
+            str: The hexadecimal cache key.
+        """
+        validator = self._source_validator(url)
+        schema_key = json.dumps(schema, sort_keys=True)
+        return hashlib.sha256(f"{url}|{validator}|{schema_key}".encode()).hexdigest()
+
+    def _source_validator(self, url: str) -> str:
+        """
+        Returns a string that changes whenever the content of the source changes.
+
+        Args:
+            url (str): The URL or local path of the source file.
+
+        Returns:
+            str: The `ETag`, `Last-Modified` header or content hash of the source.
+        """
+        if not url.startswith(("http://", "https://")):
+            return f"sha256:{self._local_hash(url)}"
+
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request) as response:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            length = response.headers.get("Content-Length", "")
+
+        if etag:
+            return f"etag:{etag}"
+        if last_modified:
+            return f"last-modified:{last_modified}:{length}"
+        return f"sha256:{self._download_hash(url)}"
+
+    def _local_hash(self, path: str) -> str:
+        """
+        Returns the content hash of a local file, hashing it only if it changed.
+
+        A file with the same size and modification time as when it was last hashed
+        keeps its hash from `HASH_INDEX`, so an unchanged file is not read again.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            str: The SHA-256 hex digest of the file content.
+        """
+        stat = os.stat(path)
+        source = str(Path(path).resolve())
+        index_path = self.cache_dir / HASH_INDEX
+        try:
+            index = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            index = {}
+
+        entry = index.get(source)
+        if entry is not None and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return entry[2]
+
+        with open(path, "rb") as file:
+            digest = self._hash_stream(file)
+        index[source] = [stat.st_size, stat.st_mtime_ns, digest]
+        tmp_path = index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(index))
+        tmp_path.replace(index_path)
+        return digest
+
+    def _download_hash(self, url: str) -> str:
+        """
+        Downloads a remote source to the cache directory, hashing it on the way.
+
+        The copy is kept for `local_copy`, so the source is parsed from disk instead
+        of being downloaded a second time.
+
+        Args:
+            url (str): The URL of the source.
+
+        Returns:
+            str: The SHA-256 hex digest of the source content.
+        """
+        name = Path(urllib.parse.urlparse(url).path).name
+        url_key = hashlib.sha256(url.encode()).hexdigest()
+        target = self.cache_dir / SOURCES_DIR / f"{url_key}_{name}"
+        target.parent.mkdir(exist_ok=True)
+        tmp_path = target.with_name(f"{target.name}.part")
+
+        digest = hashlib.sha256()
+        with urllib.request.urlopen(url) as response, open(tmp_path, "wb") as out:
+            while block := response.read(HASH_BLOCK_SIZE):
+                digest.update(block)
+                out.write(block)
+        tmp_path.replace(target)
+        self.copies[url] = target
+        logger.info(f"Downloaded {url} to hash it.")
+        return digest.hexdigest()
+
+    def local_copy(self, url: str) -> str | None:
+        """
+        Returns the copy of a remote source downloaded by `fingerprint`, if any.
+
+        Args:
+            url (str): The URL of the source.
+
+        Returns:
+            str | None: The path of the copy, or None if the source was not downloaded.
+        """
+        path = self.copies.get(url)
+        return str(path) if path is not None and path.exists() else None
+
+    @staticmethod
+    def _hash_stream(stream) -> str:
+        """
+        Hashes a binary stream block by block.
+
+        Args:
+            stream: A readable binary file-like object.
+
+        Returns:
+            str: The SHA-256 hex digest of the stream content.
+        """
+        digest = hashlib.sha256()
+        while block := stream.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """
+        Returns the Parquet file path of a cache key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Path: The location of the cached Parquet file.
+        """
+        return self.cache_dir / f"{key}.parquet"
+
+    def contains(self, key: str) -> bool:
+        """
+        Checks whether a key is cached and refreshes its last access time.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            bool: True if a Parquet file is stored for the key.
+        """
+        path = self._path(key)
+        if not path.exists():
+            return False
+        os.utime(path)
+        return True
+
+    def read(self, key: str) -> pd.DataFrame:
+        """
+        Reads a cached entry as a single DataFrame.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            pd.DataFrame: The cached data.
+        """
+        logger.info(f"Reading cached data: {key}.")
+        return pd.read_parquet(self._path(key))
+
+    def iter_read(self, key: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Reads a cached entry as DataFrame chunks.
+
+        Args:
+            key (str): The cache key.
+            chunksize (int): The number of rows in each chunk.
+
+        Yields:
+            pd.DataFrame: The next chunk of cached data.
+        """
+        logger.info(f"Streaming cached data: {key}.")
+        parquet_file = pq.ParquetFile(self._path(key))
+        for batch in parquet_file.iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """
+        Stores a DataFrame in the cache and applies the eviction policy.
+
+        Args:
+            key (str): The cache key.
+            df (pd.DataFrame): The parsed data to cache.
+        """
+        tmp_path = self._path(key).with_suffix(".tmp")
+        df.to_parquet(tmp_path, index=False)
+        tmp_path.replace(self._path(key))
+        logger.info(f"Cached {len(df)} rows: {key}.")
+        self.evict(keep=self._path(key))
+
+    def write_through(
+        self, key: str, chunks: Iterator[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Passes chunks through while writing them to the cache.
+
+        The entry only becomes visible once the last chunk has been written, so a
+        partially consumed iterator never leaves a truncated file behind.
+
+        Args:
+            key (str): The cache key.
+            chunks (Iterator[pd.DataFrame]): The parsed chunks to cache.
+
+        Yields:
+            pd.DataFrame: The same chunks, unchanged.
+        """
+        tmp_path = self._path(key).with_suffix(".tmp")
+        writer: pq.ParquetWriter | None = None
+        total_rows: int = 0
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+                total_rows += len(chunk)
+                yield chunk
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if writer is not None:
+            writer.close()
+            tmp_path.replace(self._path(key))
+            logger.info(f"Cached {total_rows} rows: {key}.")
+            self.evict(keep=self._path(key))
+
+    def evict(self, keep: Path | None = None) -> list[Path]:
+        """
+        Removes expired entries, then the least recently used ones above the size limit.
+
+        The copies of downloaded sources (see `local_copy`) count as entries too.
+
+        Args:
+            keep (Path | None, optional): An entry never evicted, the one just written.
+            Defaults to None.
+
+        Returns:
+            list[Path]: The evicted files.
+        """
+        now = time.time()
+        entries = sorted(
+            (path.stat().st_mtime, path.stat().st_size, path)
+            for path in [
+                *self.cache_dir.glob("*.parquet"),
+                *self.cache_dir.glob(f"{SOURCES_DIR}/*"),
+            ]
+            if not path.name.endswith(".part")
+        )
+        total_bytes = sum(size for _, size, _ in entries)
+
+        evicted: list[Path] = []
+        for mtime, size, path in entries:
+            if path == keep:
+                continue
+            if now - mtime > self.max_age_seconds or total_bytes > self.max_bytes:
+                path.unlink(missing_ok=True)
+                total_bytes -= size
+                evicted.append(path)
+
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} cache entries.")
+        return evicted
@@ -0,0 +1,438 @@
+import json
+import time
+import shutil
+import hashlib
+import logging
+import threading
+import urllib.request
+
+from pathlib import Path
+from typing import Dict
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.my_logger import LoggerSetup
+from src.config.config import (
+    DOWNLOAD_DIR,
+    DOWNLOAD_PART_SIZE,
+    DOWNLOAD_WORKERS,
+    DOWNLOAD_RETRIES,
+    DOWNLOAD_MAX_BYTES,
+    DOWNLOAD_MAX_AGE_SECONDS,
+)
+
+logger: logging.Logger = logging.getLogger("class RangedDownloader")
+
+READ_BLOCK_SIZE: int = 1024 * 1024
+
+
+class RangedDownloader:
+    """Downloads large files as parallel HTTP byte ranges, resuming partial downloads."""
+
+    def __init__(
+        self,
+        download_dir: str = DOWNLOAD_DIR,
+        part_size: int = DOWNLOAD_PART_SIZE,
+        workers: int = DOWNLOAD_WORKERS,
+        retries: int = DOWNLOAD_RETRIES,
+        max_bytes: int = DOWNLOAD_MAX_BYTES,
+        max_age_seconds: int = DOWNLOAD_MAX_AGE_SECONDS,
+    ) -> None:
+        """
+        Initializes the downloader.
+
+        Args:
+            download_dir (str, optional): Directory for finished and partial downloads.
+            Defaults to `DOWNLOAD_DIR`.
+            part_size (int, optional): The size in bytes of each byte range.
+            Defaults to `DOWNLOAD_PART_SIZE`.
+            workers (int, optional): The number of ranges fetched in parallel.
+            Defaults to `DOWNLOAD_WORKERS`.
+            retries (int, optional): The number of attempts for each range.
+            Defaults to `DOWNLOAD_RETRIES`.
+            max_bytes (int, optional): Maximum total size of the download directory, the
+            least recently used downloads are evicted above it. Defaults to
+            `DOWNLOAD_MAX_BYTES`.
+            max_age_seconds (int, optional): Downloads not used for longer than this are
+            evicted. Defaults to `DOWNLOAD_MAX_AGE_SECONDS`.
+
+        Raises:
+            ValueError: If a size, count or limit is not positive.
+        """
+        LoggerSetup()
+
+        if min(part_size, workers, retries) <= 0:
+            logger.error("Part size, workers and retries must be positive.")
+            raise ValueError("Part size, workers and retries must be positive")
+
+        if max_bytes <= 0 or max_age_seconds <= 0:
+            logger.error("Download limits must be positive.")
+            raise ValueError("Download limits must be positive")
+
+        self.download_dir = Path(download_dir)
+        self.part_size = part_size
+        self.workers = workers
+        self.retries = retries
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.download_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _probe(self, url: str) -> tuple[int, str, bool]:
+        """
+        Requests the headers of a remote file.
+
+        Args:
+            url (str): The URL of the file.
+
+        Returns:
+            tuple[int, str, bool]: The size in bytes (0 if unknown), the `ETag` (or
+            `Last-Modified`) validator and whether byte ranges are supported. A weak
+            `ETag` is not a valid `If-Range` validator, so it is ignored; without any
+            validator the download is not resumed.
+        """
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request) as response:
+            size = int(response.headers.get("Content-Length") or 0)
+            etag = response.headers.get("ETag", "")
+            if etag.startswith("W/"):
+                etag = ""
+            validator = etag or response.headers.get("Last-Modified", "")
+            accepts_ranges = response.headers.get("Accept-Ranges", "") == "bytes"
+        return size, validator, accepts_ranges
+
+    def _target(self, url: str) -> Path:
+        """
+        Returns the final path of the download of a URL.
+
+        The name starts with a hash of the whole URL, as the keys of
+        `ParquetDataCache` do, so URLs with the same file name never share a file.
+        It ends with that file name, which keeps its extension.
+
+        Args:
+            url (str): The URL of the file.
+
+        Returns:
+            Path: The final path of the download.
+        """
+        url_key = hashlib.sha256(url.encode()).hexdigest()
+        return self.download_dir / f"{url_key}_{Path(urlparse(url).path).name}"
+
+    @staticmethod
+    def _manifest_path(target: Path) -> Path:
+        """
+        Returns the path of the manifest tracking the parts of a download.
+
+        Args:
+            target (Path): The final path of the download.
+
+        Returns:
+            Path: The manifest path.
+        """
+        return target.with_name(f"{target.name}.parts.json")
+
+    @staticmethod
+    def _partial_path(target: Path) -> Path:
+        """
+        Returns the path of the file that receives the parts of a download.
+
+        Args:
+            target (Path): The final path of the download.
+
+        Returns:
+            Path: The partial file path.
+        """
+        return target.with_name(f"{target.name}.part")
+
+    def _load_manifest(self, target: Path, size: int, validator: str) -> Dict:
+        """
+        Loads the manifest of a previous attempt if it was for the same remote file.
+
+        Args:
+            target (Path): The final path of the download.
+            size (int): The size of the remote file.
+            validator (str): The validator of the remote file.
+
+        Returns:
+            Dict: The manifest, reset when the remote file or part size changed.
+        """
+        manifest_path = self._manifest_path(target)
+        fresh = {
+            "size": size,
+            "validator": validator,
+            "part_size": self.part_size,
+            "parts": {},
+            "complete": False,
+        }
+        if not manifest_path.exists():
+            return fresh
+
+        with open(manifest_path) as file:
+            manifest = json.load(file)
+
+        same_file = (
+            manifest.get("size") == size
+            and manifest.get("validator") == validator
+            and manifest.get("part_size") == self.part_size
+        )
+        if same_file and validator:
+            return manifest
+        logger.info(f"Remote file changed, restarting download: {target.name}.")
+        return fresh
+
+    def _save_manifest(self, target: Path, manifest: Dict) -> None:
+        """
+        Atomically writes the manifest of a download.
+
+        Args:
+            target (Path): The final path of the download.
+            manifest (Dict): The manifest to persist.
+        """
+        manifest_path = self._manifest_path(target)
+        tmp_path = manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as file:
+            json.dump(manifest, file)
+        tmp_path.replace(manifest_path)
+
+    def _part_range(self, index: int, size: int) -> tuple[int, int]:
+        """
+        Returns the inclusive byte range of a part.
+
+        Args:
+            index (int): The part index.
+            size (int): The size of the file.
+
+        Returns:
+            tuple[int, int]: The first and last byte of the part.
+        """
+        start = index * self.part_size
+        return start, min(start + self.part_size, size) - 1
+
+    def _hash_local_part(self, partial: Path, start: int, end: int) -> str:
+        """
+        Hashes a byte range of the partial file.
+
+        Args:
+            partial (Path): The partial file.
+            start (int): The first byte.
+            end (int): The last byte.
+
+        Returns:
+            str: The SHA-256 hex digest of the range.
+        """
+        digest = hashlib.sha256()
+        with open(partial, "rb") as file:
+            file.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                block = file.read(min(READ_BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                digest.update(block)
+                remaining -= len(block)
+        return digest.hexdigest()
+
+    def _is_part_valid(
+        self, partial: Path, manifest: Dict, index: int, size: int
+    ) -> bool:
+        """
+        Checks whether a recorded part is still intact in the partial file.
+
+        Args:
+            partial (Path): The partial file.
+            manifest (Dict): The manifest of the download.
+            index (int): The part index.
+            size (int): The size of the file.
+
+        Returns:
+            bool: True if the part was recorded and its content matches its hash.
+        """
+        recorded = manifest["parts"].get(str(index))
+        if recorded is None:
+            return False
+        return recorded == self._hash_local_part(
+            partial, *self._part_range(index, size)
+        )
+
+    def _fetch_part(
+        self, url: str, partial: Path, index: int, size: int, validator: str
+    ) -> str:
+        """
+        Downloads one byte range into its place in the partial file.
+
+        Args:
+            url (str): The URL of the file.
+            partial (Path): The partial file.
+            index (int): The part index.
+            size (int): The size of the file.
+            validator (str): The validator sent as `If-Range`.
+
+        Returns:
+            str: The SHA-256 hex digest of the downloaded part.
+
+        Raises:
+            IOError: If the part could not be downloaded in `retries` attempts.
+        """
+        start, end = self._part_range(index, size)
+        headers = {"Range": f"bytes={start}-{end}"}
+        if validator:
+            headers["If-Range"] = validator
+
+        last_error: Exception | None = None
+        for attempt in range(1, self.retries + 1):
+            try:
+                request = urllib.request.Request(url, headers=headers)
+                digest = hashlib.sha256()
+                written = 0
+                with (
+                    urllib.request.urlopen(request) as response,
+                    open(partial, "r+b") as file,
+                ):
+                    if response.status != 206:
+                        raise IOError(f"Range request returned {response.status}")
+                    file.seek(start)
+                    while block := response.read(READ_BLOCK_SIZE):
+                        file.write(block)
+                        digest.update(block)
+                        written += len(block)
+
+                expected = end - start + 1
+                if written != expected:
+                    raise IOError(
+                        f"Part {index} is {written} bytes, expected {expected}"
+                    )
+                return digest.hexdigest()
+            except Exception as e:
+                last_error = e
+                logger.warning(f"Part {index} failed (attempt {attempt}): {e}.")
+
+        raise IOError(f"Part {index} of {url} could not be downloaded: {last_error}")
+
+    def _record_part(
+        self, target: Path, manifest: Dict, index: int, digest: str
+    ) -> None:
+        """
+        Marks a part as downloaded and persists the manifest.
+
+        Args:
+            target (Path): The final path of the download.
+            manifest (Dict): The manifest of the download.
+            index (int): The part index.
+            digest (str): The SHA-256 hex digest of the part.
+        """
+        with self._lock:
+            manifest["parts"][str(index)] = digest
+            self._save_manifest(target, manifest)
+
+    def _download_whole(self, url: str, target: Path) -> None:
+        """
+        Downloads a file in a single stream, for servers without range support.
+
+        Args:
+            url (str): The URL of the file.
+            target (Path): The final path of the download.
+        """
+        partial = self._partial_path(target)
+        with urllib.request.urlopen(url) as response, open(partial, "wb") as file:
+            shutil.copyfileobj(response, file, READ_BLOCK_SIZE)
+        partial.replace(target)
+
+    def download(self, url: str) -> str:
+        """
+        Downloads a remote file, resuming from the parts already on disk.
+
+        Every part is written at its offset of a preallocated partial file and its
+        hash is recorded in a manifest next to it. After a crash, parts whose content
+        still matches the recorded hash are kept and only the others are fetched.
+
+        Args:
+            url (str): The URL of the file.
+
+        Returns:
+            str: The local path of the finished file.
+
+        Raises:
+            IOError: If a part could not be downloaded.
+        """
+        target = self._target(url)
+        size, validator, accepts_ranges = self._probe(url)
+
+        if not accepts_ranges or size == 0:
+            logger.info(f"Server does not support ranges, downloading {url} whole.")
+            self._download_whole(url, target)
+            self.evict(keep=target)
+            return str(target)
+
+        manifest = self._load_manifest(target, size, validator)
+        if manifest["complete"] and target.exists():
+            logger.info(f"Already downloaded: {target}.")
+            target.touch()
+            self.evict(keep=target)
+            return str(target)
+
+        partial = self._partial_path(target)
+        if not partial.exists() or partial.stat().st_size != size:
+            manifest["parts"] = {}
+            with open(partial, "wb") as file:
+                file.truncate(size)
+
+        total_parts = -(-size // self.part_size)
+        pending = [
+            index
+            for index in range(total_parts)
+            if not self._is_part_valid(partial, manifest, index, size)
+        ]
+        logger.info(
+            f"Downloading {len(pending)} of {total_parts} parts of {url} "
+            f"({total_parts - len(pending)} resumed)."
+        )
+
+        def fetch(index: int) -> None:
+            digest = self._fetch_part(url, partial, index, size, validator)
+            self._record_part(target, manifest, index, digest)
+
+        with ThreadPoolExecutor(self.workers) as pool:
+            list(pool.map(fetch, pending))
+
+        partial.replace(target)
+        manifest["complete"] = True
+        self._save_manifest(target, manifest)
+        logger.info(f"Downloaded {size} bytes to {target}.")
+        self.evict(keep=target)
+        return str(target)
+
+    def evict(self, keep: Path | None = None) -> list[Path]:
+        """
+        Removes expired downloads, then the least recently used ones above the size limit.
+
+        Finished and partial downloads are evicted together with their manifest.
+
+        Args:
+            keep (Path | None, optional): A download never evicted, the one about to be
+            read. Defaults to None.
+
+        Returns:
+            list[Path]: The evicted files, without their manifests.
+        """
+        now = time.time()
+        entries = sorted(
+            (path.stat().st_mtime, path.stat().st_size, path)
+            for path in self.download_dir.iterdir()
+            if path.is_file() and not path.name.endswith((".parts.json", ".tmp"))
+        )
+        total_bytes = sum(size for _, size, _ in entries)
+
+        evicted: list[Path] = []
+        for mtime, size, path in entries:
+            if path == keep:
+                continue
+            if now - mtime > self.max_age_seconds or total_bytes > self.max_bytes:
+                target = path.with_suffix("") if path.suffix == ".part" else path
+                path.unlink(missing_ok=True)
+                self._manifest_path(target).unlink(missing_ok=True)
+                total_bytes -= size
+                evicted.append(path)
+
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} downloads.")
+        return evicted
@@ -1,20 +1,70 @@
 import logging
+import urllib.request
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterator
 
 from src.utils.my_logger import LoggerSetup
+from src.utils.data_cache import ParquetDataCache
+from src.utils.data_downloader import RangedDownloader
+from src.utils.compressed_stream import DecompressingStream
+from src.config.config import DATETIME_FORMAT
 
 logger: logging.Logger = logging.getLogger("class TaxiDataExtractor")
 
+PYARROW_TYPES: Dict[str, pa.DataType] = {
+    "Int8": pa.int8(),
+    "Int16": pa.int16(),
+    "Int32": pa.int32(),
+    "float32": pa.float32(),
+    "float64": pa.float64(),
+    "datetime64[ns]": pa.timestamp("ns"),
+    "category": pa.dictionary(pa.int32(), pa.string()),
+    "string": pa.string(),
+}
+
+PANDAS_TYPES: Dict[pa.DataType, object] = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+}
+
 
 class TaxiDataExtractor:
     """Extracts and processes NYC Taxi data from a given URL."""
 
-    def __init__(self, url: str) -> None:
+    DATETIME_COLUMNS: list[str] = ["pickup_datetime", "dropoff_datetime"]
+    WATERMARK_COLUMN: str = "pickup_datetime"
+
+    def __init__(
+        self,
+        url: str,
+        cache: ParquetDataCache | None = None,
+        schema: Dict[str, str] | None = None,
+        downloader: RangedDownloader | None = None,
+        watermark: pd.Timestamp | None = None,
+    ) -> None:
         """
         Initialize the extractor with a data URL.
 
         Args:
             url (str): The URL pointing to the CSV data file.
+            cache (ParquetDataCache | None, optional): On-disk cache of parsed sources.
+            When set, repeat reads of an unchanged source skip the download and parsing.
+            Defaults to None.
+            schema (Dict[str, str] | None, optional): Declared pandas dtype of every column
+            (see `TAXI_SCHEMA`). When set, the CSV is parsed by pyarrow straight into these
+            compact dtypes. Defaults to None, which infers the dtypes.
+            downloader (RangedDownloader | None, optional): Downloads remote sources to disk
+            in resumable parallel ranges before they are parsed. Defaults to None, which
+            lets the parser read the URL directly.
+            watermark (pd.Timestamp | None, optional): High-water mark of `pickup_datetime`
+            already loaded (see `WatermarkStore`). Rows at or below it are dropped from each
+            chunk as it is read. Defaults to None, which keeps every row.
 
         Raises:
             ValueError: If the provided URL is not a string.
@@ -23,23 +73,263 @@ class TaxiDataExtractor:
 
         if isinstance(url, str):
             self.url = url
+            self.cache = cache
+            self.schema = schema
+            self.downloader = downloader
+            self.watermark = watermark
+            self.skipped_rows: int = 0
             self.df: pd.DataFrame | None = None
+            self.memory_report: Dict[str, int] = {
+                "typed_bytes": 0,
+                "default_bytes": 0,
+                "saved_bytes": 0,
+            }
+            self.throughput_report: Dict[str, float] = {}
         else:
             logger.error("Input value for URL is not a string.")
             raise ValueError("URL must be a string")
 
-    def _processsed_data(self) -> pd.DataFrame:
+    def _transform_dates(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Convert datetime columns to pandas datetime format.
+        Convert the datetime columns of a DataFrame to pandas datetime format.
+
+        Args:
+            df (pd.DataFrame): The DataFrame (or chunk) to be transformed.
 
         Returns:
             pd.DataFrame: The DataFrame with transformed datetime columns.
         """
-        if self.df is not None:
-            transform_to_date = ["pickup_datetime", "dropoff_datetime"]
-            for col in transform_to_date:
-                self.df[col] = pd.to_datetime(self.df[col])
-        return self.df
+        for col in self.DATETIME_COLUMNS:
+            df[col] = pd.to_datetime(df[col])
+        return df
+
+    def _cache_key(self) -> str | None:
+        """
+        Returns the cache key of the source, or None when caching is disabled.
+
+        Returns:
+            str | None: The cache key.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.fingerprint(self.url, self.schema)
+
+    def _is_remote(self) -> bool:
+        """
+        Checks whether the source is an HTTP(S) URL.
+
+        Returns:
+            bool: True for remote sources.
+        """
+        return self.url.startswith(("http://", "https://"))
+
+    def _source(self) -> str:
+        """
+        Returns the location the parser reads from.
+
+        A remote source the cache already downloaded to hash it is read from that
+        copy. Otherwise remote sources are first downloaded by the downloader when
+        one is set, so a failed attempt resumes from the parts already on disk.
+
+        Returns:
+            str: The local path of the downloaded file, or the source URL or path.
+        """
+        if self.cache is not None and self._is_remote():
+            local = self.cache.local_copy(self.url)
+            if local is not None:
+                return local
+        if self.downloader is not None and self._is_remote():
+            return self.downloader.download(self.url)
+        return self.url
+
+    @contextmanager
+    def _open_source(self):
+        """
+        Opens the source as something the pyarrow and pandas CSV readers can consume.
+
+        Gzip, zstd and bz2 files, detected from their extension or magic bytes, are
+        decompressed as a stream while the parser reads them, without an uncompressed
+        copy on disk. The throughput achieved is stored in `throughput_report`.
+
+        Yields:
+            The local path of a plain file, or a (decompressed) binary stream.
+        """
+        source = self._source()
+        remote = source.startswith(("http://", "https://"))
+        with ExitStack() as stack:
+            if remote:
+                raw = stack.enter_context(urllib.request.urlopen(source))
+            else:
+                raw = stack.enter_context(open(source, "rb"))
+
+            stream = DecompressingStream(raw, source)
+            if stream.codec is None and not remote:
+                yield source
+                return
+
+            with stream as decompressed:
+                yield decompressed
+            self.throughput_report = stream.throughput
+
+    def _convert_options(self) -> pa_csv.ConvertOptions:
+        """
+        Builds the pyarrow conversion options from the declared schema.
+
+        Returns:
+            pa_csv.ConvertOptions: Options typing each column during the read.
+        """
+        return pa_csv.ConvertOptions(
+            column_types={
+                col: PYARROW_TYPES[dtype] for col, dtype in self.schema.items()
+            },
+            timestamp_parsers=[DATETIME_FORMAT],
+        )
+
+    def _to_pandas(self, table: pa.Table) -> pd.DataFrame:
+        """
+        Converts a pyarrow table to pandas, keeping integers narrow and nullable.
+
+        Args:
+            table (pa.Table): The parsed table.
+
+        Returns:
+            pd.DataFrame: The typed DataFrame.
+        """
+        df = table.to_pandas(types_mapper=PANDAS_TYPES.get)
+        self._report_memory(df)
+        return df
+
+    def _report_memory(self, df: pd.DataFrame) -> None:
+        """
+        Accumulates the memory used by the typed data against the default dtypes.
+
+        The default path stores numbers and datetimes in 8 bytes per value and text as
+        Python objects, which is what `pd.read_csv` infers without a schema.
+
+        Args:
+            df (pd.DataFrame): The typed DataFrame (or chunk).
+        """
+        typed_bytes = int(df.memory_usage(deep=True, index=False).sum())
+        default_bytes = 0
+        for col in df.columns:
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                default_bytes += int(
+                    df[col].astype(object).memory_usage(deep=True, index=False)
+                )
+            else:
+                default_bytes += 8 * len(df)
+
+        self.memory_report["typed_bytes"] += typed_bytes
+        self.memory_report["default_bytes"] += default_bytes
+        self.memory_report["saved_bytes"] += default_bytes - typed_bytes
+
+    def _log_memory_report(self) -> None:
+        """Logs the memory saved by the typed parsing."""
+        logger.info(
+            "Typed parsing used {typed_bytes} bytes instead of {default_bytes} bytes "
+            "(saved {saved_bytes} bytes).".format(**self.memory_report)
+        )
+
+    def _read_typed(self) -> pd.DataFrame:
+        """
+        Reads the whole source with pyarrow into the declared schema.
+
+        Returns:
+            pd.DataFrame: The typed DataFrame.
+        """
+        with self._open_source() as source:
+            table = pa_csv.read_csv(source, convert_options=self._convert_options())
+        return self._to_pandas(table)
+
+    def _iter_typed(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Streams the source with pyarrow into DataFrame chunks of the declared schema.
+
+        Args:
+            chunksize (int): The number of rows in each chunk.
+
+        Yields:
+            pd.DataFrame: The next typed chunk.
+        """
+        with self._open_source() as source:
+            reader = pa_csv.open_csv(source, convert_options=self._convert_options())
+            buffered: list[pa.RecordBatch] = []
+            buffered_rows: int = 0
+            for batch in reader:
+                buffered.append(batch)
+                buffered_rows += batch.num_rows
+                while buffered_rows >= chunksize:
+                    table = pa.Table.from_batches(buffered)
+                    yield self._to_pandas(table.slice(0, chunksize))
+                    rest = table.slice(chunksize)
+                    buffered, buffered_rows = rest.to_batches(), rest.num_rows
+
+            if buffered_rows:
+                yield self._to_pandas(pa.Table.from_batches(buffered))
+
+        self._log_memory_report()
+
+    def _iter_untyped(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Streams the source with pandas, inferring the dtypes.
+
+        Args:
+            chunksize (int): The number of rows in each chunk.
+
+        Yields:
+            pd.DataFrame: The next chunk, with datetime columns converted.
+        """
+        with self._open_source() as source:
+            with pd.read_csv(source, chunksize=chunksize) as reader:
+                for chunk in reader:
+                    yield self._transform_dates(chunk)
+
+    def read_source(self) -> pd.DataFrame:
+        """
+        Reads the whole source into a processed DataFrame, bypassing the cache and the
+        watermark.
+
+        Unlike `load_data`, errors are raised rather than logged, so a caller reading
+        many files (see `MultiFileTaxiDataExtractor`) fails with the error of the
+        broken file.
+
+        Returns:
+            pd.DataFrame: The DataFrame, typed by the declared schema if any, with
+            datetime columns converted.
+
+        Raises:
+            Exception: If an error occurs while reading the source.
+        """
+        if self.schema:
+            return self._read_typed()
+        with self._open_source() as source:
+            df = pd.read_csv(source)
+        return self._transform_dates(df)
+
+    def _filter_watermark(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drops the rows at or below the watermark, which were already loaded.
+
+        Rows without a value in the watermark column are kept so that validation
+        still reports them.
+
+        Args:
+            df (pd.DataFrame): The DataFrame (or chunk) to filter.
+
+        Returns:
+            pd.DataFrame: The rows newer than the watermark.
+        """
+        values = df[self.WATERMARK_COLUMN]
+        keep = (values > self.watermark) | values.isna()
+        skipped = len(df) - int(keep.sum())
+        self.skipped_rows += skipped
+        return df[keep] if skipped else df
+
+    def _log_watermark_report(self) -> None:
+        """Logs how many rows the watermark filtered out."""
+        logger.info(
+            f"Skipped {self.skipped_rows} rows at or below the watermark {self.watermark}."
+        )
 
     def load_data(self) -> None:
         """
@@ -49,12 +339,69 @@ class TaxiDataExtractor:
             Exception: If an error occurs while loading the data.
         """
         try:
-            self.df = pd.read_csv(self.url)
-            self.df = self._processsed_data()
+            key = self._cache_key()
+            if key and self.cache.contains(key):
+                self.df = self.cache.read(key)
+            else:
+                self.df = self.read_source()
+                if self.schema:
+                    self._log_memory_report()
+                if key:
+                    self.cache.put(key, self.df)
+
+            if self.watermark is not None:
+                self.df = self._filter_watermark(self.df)
+                self._log_watermark_report()
         except Exception as e:
             logger.error(f"Error loading data: {e}.")
             self.df = None
 
+    def iter_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Stream the data from the provided URL as processed DataFrame chunks.
+
+        Only one chunk is held in memory at a time, so peak memory is bounded by
+        `chunksize` instead of the size of the source file.
+
+        Args:
+            chunksize (int): The number of rows in each chunk.
+
+        Yields:
+            pd.DataFrame: The next chunk, with datetime columns already converted.
+
+        Raises:
+            ValueError: If `chunksize` is not a positive integer.
+            Exception: If an error occurs while reading the data.
+        """
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            logger.error("Chunk size must be a positive integer.")
+            raise ValueError("Chunk size must be a positive integer")
+
+        try:
+            key = self._cache_key()
+            if key and self.cache.contains(key):
+                chunks = self.cache.iter_read(key, chunksize)
+            else:
+                if self.schema:
+                    chunks = self._iter_typed(chunksize)
+                else:
+                    chunks = self._iter_untyped(chunksize)
+                if key:
+                    chunks = self.cache.write_through(key, chunks)
+
+            for chunk in chunks:
+                if self.watermark is not None:
+                    chunk = self._filter_watermark(chunk)
+                    if chunk.empty:
+                        continue
+                yield chunk
+
+            if self.watermark is not None:
+                self._log_watermark_report()
+        except Exception as e:
+            logger.error(f"Error streaming data: {e}.")
+            raise
+
     def get_data(self) -> pd.DataFrame:
         """
         Retrieve the processed DataFrame.
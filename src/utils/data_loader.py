@@ -1,49 +1,855 @@
-import os
+import io
+import csv
+import hashlib
+import time
 import logging
+import threading
 
 import pandas as pd
 import sqlalchemy as sa
 
-from dotenv import load_dotenv
-from src.utils.my_logger import LoggerSetup
+from typing import Dict, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
-load_dotenv()
+from src.utils.my_logger import LoggerSetup
+from src.utils.engine_registry import get_engine
+from src.utils.load_manifest import LoadManifest, chunk_fingerprint
+from src.config.config import BULK_CHUNK_SIZE, LOAD_RETRIES
 
 logger: logging.Logger = logging.getLogger("class DataLoader")
 
+# The most parameters one statement may bind, by dialect; SQLite's for the others.
+MAX_BIND_PARAMETERS: Dict[str, int] = {"sqlite": 32_766, "mssql": 2_100}
+
+
+def row_hash(df: pd.DataFrame) -> pd.Series:
+    """
+    Computes a 128-bit hash of the content of every row.
+
+    Each row is encoded as the text of its values, whatever the dtypes they were
+    parsed with, and hashed with BLAKE2b, which keeps collisions out of reach for
+    any realistic table size. The 32 hexadecimal digits are accepted as-is by a
+    PostgreSQL `UUID` column.
+
+    Args:
+        df (pd.DataFrame): The rows to hash. The index is ignored.
+
+    Returns:
+        pd.Series: The hash of each row, aligned with `df`.
+    """
+    texts = [_canonical_text(df.iloc[:, position]) for position in range(df.shape[1])]
+    rows = texts[0].str.cat(texts[1:]) if texts else pd.Series("", index=df.index)
+    return pd.Series(
+        [
+            hashlib.blake2b(row.encode(), digest_size=16).hexdigest()
+            for row in rows.to_numpy()
+        ],
+        index=df.index,
+        dtype=object,
+    )
+
+
+def _canonical_text(series: pd.Series) -> pd.Series:
+    """
+    Encodes the values of a column as text that does not depend on their dtype.
+
+    Categories are encoded as the values they stand for, integral floats as
+    integers and timestamps with microseconds. Every value is prefixed with its
+    length, and nulls are encoded as "-", so the texts of a row concatenate
+    without ambiguity.
+
+    Args:
+        series (pd.Series): The column.
+
+    Returns:
+        pd.Series: The text of each value.
+    """
+    types = pd.api.types
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object).infer_objects()
+    if types.is_datetime64_any_dtype(series):
+        text = series.dt.strftime("%Y-%m-%d %H:%M:%S.%f")
+    else:
+        text = series.astype(str)
+        if types.is_float_dtype(series):
+            text = text.str.replace(r"\.0$", "", regex=True)
+    text = text.str.len().astype(str) + ":" + text
+    return text.where(series.notna(), "-")
+
+
+def copy_insert(table, conn, keys: list[str], data_iter) -> int:
+    """
+    Inserts rows with PostgreSQL `COPY ... FROM STDIN`, used as `to_sql(method=...)`.
+
+    The rows pandas hands over for one chunk are serialized into an in-memory CSV
+    buffer and streamed to the server in a single `COPY`, instead of one `INSERT`
+    per row.
+
+    Args:
+        table (pandas.io.sql.SQLTable): The target table.
+        conn (sa.engine.Connection): The SQLAlchemy connection of the load.
+        keys (list[str]): The column names.
+        data_iter (Iterable): The rows of the chunk.
+
+    Returns:
+        int: The number of rows copied.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+
+    columns = ", ".join(f'"{key}"' for key in keys)
+    target = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {target} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+        return cursor.rowcount
+
+
+def multi_insert(table, conn, keys: list[str], data_iter) -> int:
+    """
+    Inserts rows with multi-row `INSERT` statements, used as `to_sql(method=...)`.
+
+    Each statement binds one parameter per value, so the rows pandas hands over
+    for one chunk are split into statements of as many rows as the dialect's
+    parameter limit allows for the number of columns.
+
+    Args:
+        table (pandas.io.sql.SQLTable): The target table.
+        conn (sa.engine.Connection): The SQLAlchemy connection of the load.
+        keys (list[str]): The column names.
+        data_iter (Iterable): The rows of the chunk.
+
+    Returns:
+        int: The number of rows inserted.
+    """
+    limit = MAX_BIND_PARAMETERS.get(conn.dialect.name, MAX_BIND_PARAMETERS["sqlite"])
+    rows_per_statement = max(1, limit // max(1, len(keys)))
+    rows = [dict(zip(keys, row)) for row in data_iter]
+    for start in range(0, len(rows), rows_per_statement):
+        conn.execute(
+            table.table.insert().values(rows[start : start + rows_per_statement])
+        )
+    return len(rows)
+
 
 class DataLoader:
     """A class to handle loading pandas DataFrames into a SQL database."""
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(
+        self,
+        df: pd.DataFrame | Iterator[pd.DataFrame],
+        manifest: LoadManifest | None = None,
+    ):
         """
-        Initializes the DataLoader with a pandas DataFrame.
+        Initializes the DataLoader with a pandas DataFrame or an iterator of DataFrame chunks.
 
         Args:
-            df (pd.DataFrame): The DataFrame containing the data to be loaded.
+            df (pd.DataFrame | Iterator[pd.DataFrame]): The DataFrame containing the data to be
+            loaded, or an iterator yielding it chunk by chunk (e.g. `TaxiDataExtractor.iter_chunks`).
+            manifest (LoadManifest | None, optional): Records every committed chunk, so
+            a load interrupted by a crash resumes after the last committed chunk when
+            it is restarted with the same input. Defaults to None.
 
         Raises:
-            ValueError: If the input is not a pandas DataFrame.
+            ValueError: If the input is not a pandas DataFrame or an iterator.
         """
         LoggerSetup()
 
-        if isinstance(df, pd.DataFrame):
+        if isinstance(df, (pd.DataFrame, Iterator)):
             self.df = df
-            self.engine = sa.create_engine(os.getenv("CONNECTION_STRING"))
+            self.rows_written: int = 0
+            self.rows_per_second: float = 0.0
+            self.loaded_chunks: set[int] = set()
+            self.worker_report: Dict[str, Dict[str, float]] = {}
+            self.hash_column: str | None = None
+            self.rows_inserted: int = 0
+            self.rows_skipped: int = 0
+            self.rows_resumed: int = 0
+            self.manifest = manifest
+            self.engine = get_engine()
+            self._committed: Dict[int, tuple[int, int, str | None]] | None = None
+            self._report_lock = threading.Lock()
         else:
             logger.error("The input value is not a Dataframe.")
             raise ValueError("The input value is not a Dataframe.")
 
-    def write_to_sql(self, table_name: str, **kwargs) -> None:
+    @property
+    def is_chunked(self) -> bool:
+        """Whether the loader streams an iterator of chunks instead of a single DataFrame."""
+        return not isinstance(self.df, pd.DataFrame)
+
+    def _bulk_options(self) -> dict:
+        """
+        Returns the `to_sql` options of the bulk mode for the engine's dialect.
+
+        PostgreSQL loads through `COPY`, other databases fall back to multi-row
+        `INSERT` statements. Both take `BULK_CHUNK_SIZE` rows at a time, which bounds
+        the size of the in-memory buffer; `multi_insert` splits them further to stay
+        within the parameter limit of the dialect.
+
+        Returns:
+            dict: The `method` and `chunksize` arguments for `pandas.DataFrame.to_sql`.
+        """
+        if self.engine.dialect.name == "postgresql":
+            return {"method": copy_insert, "chunksize": BULK_CHUNK_SIZE}
+        return {"method": multi_insert, "chunksize": BULK_CHUNK_SIZE}
+
+    def write_to_sql(
+        self,
+        table_name: str,
+        bulk: bool = False,
+        workers: int = 1,
+        hash_column: str | None = None,
+        **kwargs,
+    ) -> None:
         """
         Writes the DataFrame to a SQL table.
 
+        When the loader holds an iterator, each chunk is written as soon as it is
+        produced. The `if_exists` policy applies to the first chunk only, the
+        following chunks are appended.
+
+        Args:
+            table_name (str): Name of the target table in the database.
+            bulk (bool, optional): Whether to load with `COPY` (or multi-row inserts on
+            other databases) instead of row-by-row inserts. Defaults to False.
+            workers (int, optional): The number of chunks written concurrently, each over
+            its own pooled connection. Defaults to 1.
+            hash_column (str | None, optional): When set, a column of this name holding
+            the `row_hash` of every row is added before writing. Defaults to None.
+            **kwargs: Additional arguments for `pandas.DataFrame.to_sql`.
+
+        Raises:
+            ValueError: If `workers` is not positive.
+        """
+        if workers <= 0:
+            logger.error("The number of workers must be positive.")
+            raise ValueError("The number of workers must be positive")
+
+        if bulk:
+            kwargs = {**self._bulk_options(), **kwargs}
+        self.hash_column = hash_column
+
+        start = time.perf_counter()
+        if workers > 1 or self.manifest is not None:
+            total_rows = self._write_chunks_parallel(table_name, workers, **kwargs)
+        elif self.is_chunked:
+            total_rows = self._write_chunks_to_sql(table_name, **kwargs)
+        else:
+            self._prepare(self.df).to_sql(name=table_name, con=self.engine, **kwargs)
+            total_rows: int = len(self.df)
+
+        seconds = time.perf_counter() - start
+        self.rows_written = total_rows
+        self.rows_per_second = total_rows / seconds if seconds > 0 else 0.0
+        message = (
+            f"{total_rows} rows written to {table_name} "
+            f"({self.rows_per_second:.0f} rows/s)."
+        )
+        logger.info(message)
+        print(message)
+
+    def _write_chunks_to_sql(self, table_name: str, **kwargs) -> int:
+        """
+        Writes every chunk of the iterator to a SQL table.
+
+        Args:
+            table_name (str): Name of the target table in the database.
+            **kwargs: Additional arguments for `pandas.DataFrame.to_sql`.
+
+        Returns:
+            int: The total number of rows written.
+        """
+        total_rows: int = 0
+        for chunk in self.df:
+            self._prepare(chunk).to_sql(name=table_name, con=self.engine, **kwargs)
+            kwargs["if_exists"] = "append"
+            total_rows += len(chunk)
+            logger.debug(f"{len(chunk)} rows written to {table_name}.")
+        return total_rows
+
+    def _prepare(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adds the row hash column to a chunk when `hash_column` is set.
+
+        Args:
+            chunk (pd.DataFrame): The rows to write.
+
+        Returns:
+            pd.DataFrame: The rows to write, with their hash if requested.
+        """
+        if self.hash_column is None:
+            return chunk
+        return chunk.assign(**{self.hash_column: row_hash(chunk)})
+
+    def _iter_input_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Yields the input as chunks, slicing a single DataFrame into `BULK_CHUNK_SIZE` rows.
+
+        Yields:
+            pd.DataFrame: The next chunk to write.
+        """
+        if self.is_chunked:
+            yield from self.df
+            return
+        for start in range(0, len(self.df), BULK_CHUNK_SIZE):
+            yield self.df.iloc[start : start + BULK_CHUNK_SIZE]
+
+    def write_chunk(
+        self,
+        position: int,
+        chunk: pd.DataFrame,
+        table_name: str,
+        bulk: bool = False,
+        hash_column: str | None = None,
+        row_offset: int = 0,
+        **kwargs,
+    ) -> int:
+        """
+        Writes a single chunk, for callers that schedule the chunks themselves.
+
+        The chunk gets the same treatment as in `write_to_sql(workers=...)`: its own
+        transaction, retries, and an entry in `loaded_chunks` and `worker_report`.
+        Since chunks may land in any order, the table should already exist.
+
         Args:
+            position (int): The position of the chunk in the input.
+            chunk (pd.DataFrame): The rows to write.
             table_name (str): Name of the target table in the database.
+            bulk (bool, optional): Whether to load with `COPY`, see `write_to_sql`.
+            Defaults to False.
+            hash_column (str | None, optional): The row hash column to add, see
+            `write_to_sql`. Defaults to None.
+            row_offset (int, optional): The number of input rows before the chunk,
+            recorded in the manifest. Defaults to 0.
             **kwargs: Additional arguments for `pandas.DataFrame.to_sql`.
+
+        Returns:
+            int: The number of rows written.
+
+        Raises:
+            RuntimeError: If the chunk could not be written in `LOAD_RETRIES` attempts.
         """
-        self.df.to_sql(name=table_name, con=self.engine, **kwargs)
+        if bulk:
+            kwargs = {**self._bulk_options(), **kwargs}
+        self.hash_column = hash_column
+        return self._write_chunk(
+            position, chunk, table_name, row_offset=row_offset, **kwargs
+        )
+
+    def _committed_chunks(self) -> Dict[int, tuple[int, int, str | None]]:
+        """
+        Returns the chunks the manifest records as committed by an earlier attempt.
+
+        Returns:
+            Dict[int, tuple[int, int, str | None]]: The row offset, row count and
+            fingerprint by chunk position, empty without a manifest.
+        """
+        if self._committed is None:
+            self._committed = self.manifest.committed() if self.manifest else {}
+            if self._committed:
+                logger.info(
+                    f"Resuming load: {len(self._committed)} chunks already committed."
+                )
+        return self._committed
+
+    def _skip_committed(self, position: int, chunk: pd.DataFrame) -> bool:
+        """
+        Checks whether a chunk was committed by an earlier attempt of the load.
+
+        Args:
+            position (int): The position of the chunk in the input.
+            chunk (pd.DataFrame): The rows of the chunk.
+
+        Returns:
+            bool: True if the chunk must be skipped.
+
+        Raises:
+            RuntimeError: If the committed chunk had a different number of rows or
+            fingerprint, i.e. the input changed since the interrupted load.
+        """
+        committed = self._committed_chunks().get(position)
+        if committed is None:
+            return False
+        _, row_count, chunk_hash = committed
+        if row_count != len(chunk):
+            raise RuntimeError(
+                f"Chunk {position} has {len(chunk)} rows but {row_count} were "
+                "committed, the input changed since the interrupted load"
+            )
+        if chunk_hash != chunk_fingerprint(chunk):
+            raise RuntimeError(
+                f"Chunk {position} differs from the committed one, the input "
+                "changed since the interrupted load"
+            )
+        with self._report_lock:
+            self.loaded_chunks.add(position)
+            self.rows_resumed += len(chunk)
+        return True
+
+    def _write_chunk(
+        self,
+        position: int,
+        chunk: pd.DataFrame,
+        table_name: str,
+        row_offset: int = 0,
+        **kwargs,
+    ) -> int:
+        """
+        Writes one chunk in its own transaction, retrying it on failure.
+
+        A failed attempt is rolled back, so a retry never duplicates rows and the
+        chunks written by other workers are left untouched. With a manifest, the
+        chunk is recorded in the same transaction and skipped if an earlier attempt
+        of the load already committed it.
+
+        Args:
+            position (int): The position of the chunk in the input.
+            chunk (pd.DataFrame): The rows to write.
+            table_name (str): Name of the target table in the database.
+            row_offset (int, optional): The number of input rows before the chunk.
+            Defaults to 0.
+            **kwargs: Additional arguments for `pandas.DataFrame.to_sql`.
+
+        Returns:
+            int: The number of rows of the chunk.
+
+        Raises:
+            RuntimeError: If the chunk could not be written in `LOAD_RETRIES` attempts.
+        """
+        if self._skip_committed(position, chunk):
+            return len(chunk)
+        chunk_hash = chunk_fingerprint(chunk) if self.manifest is not None else None
+
+        last_error: Exception | None = None
+        for attempt in range(1, LOAD_RETRIES + 1):
+            try:
+                start = time.perf_counter()
+                with self.engine.begin() as connection:
+                    self._prepare(chunk).to_sql(
+                        name=table_name, con=connection, **kwargs
+                    )
+                    if self.manifest is not None:
+                        self.manifest.record(
+                            connection, position, row_offset, len(chunk), chunk_hash
+                        )
+                self._record_chunk(position, len(chunk), time.perf_counter() - start)
+                return len(chunk)
+            except Exception as e:
+                last_error = e
+                logger.warning(f"Chunk {position} failed (attempt {attempt}): {e}.")
+
+        raise RuntimeError(
+            f"Chunk {position} could not be written to {table_name}: {last_error}"
+        )
+
+    def _record_chunk(self, position: int, rows: int, seconds: float) -> None:
+        """
+        Marks a chunk as written and adds it to the throughput of the current worker.
+
+        Args:
+            position (int): The position of the chunk in the input.
+            rows (int): The number of rows written.
+            seconds (float): The time spent writing them.
+        """
+        worker = threading.current_thread().name
+        with self._report_lock:
+            self.loaded_chunks.add(position)
+            report = self.worker_report.setdefault(
+                worker, {"chunks": 0, "rows": 0, "seconds": 0.0, "rows_per_second": 0.0}
+            )
+            report["chunks"] += 1
+            report["rows"] += rows
+            report["seconds"] += seconds
+            report["rows_per_second"] = (
+                report["rows"] / report["seconds"] if report["seconds"] > 0 else 0.0
+            )
+
+    def _write_chunks_parallel(self, table_name: str, workers: int, **kwargs) -> int:
+        """
+        Writes the input chunk by chunk over `workers` concurrent connections.
+
+        The first chunk is written alone so that the `if_exists` policy creates or
+        replaces the table once, the others are appended concurrently. At most two
+        chunks per worker are pulled from the input ahead of the writes, so a lazy
+        extractor is only advanced as fast as the database absorbs its chunks.
+
+        Args:
+            table_name (str): Name of the target table in the database.
+            workers (int): The number of concurrent writers.
+            **kwargs: Additional arguments for `pandas.DataFrame.to_sql`.
+
+        Returns:
+            int: The total number of rows written.
+
+        Raises:
+            RuntimeError: If a chunk could not be written.
+        """
+        self.loaded_chunks = set()
+        self.worker_report = {}
+        self.rows_resumed = 0
+        self._committed = None
+        chunks = enumerate(self._iter_input_chunks())
+        first = next(chunks, None)
+        if first is None:
+            return 0
+
+        total_rows = self._write_chunk(*first, table_name, row_offset=0, **kwargs)
+        row_offset = total_rows
+        kwargs["if_exists"] = "append"
+
+        pending: set[Future] = set()
+        with ThreadPoolExecutor(workers, thread_name_prefix="loader") as pool:
+            try:
+                for position, chunk in chunks:
+                    if len(pending) >= 2 * workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        total_rows += sum(future.result() for future in done)
+                    pending.add(
+                        pool.submit(
+                            self._write_chunk,
+                            position,
+                            chunk,
+                            table_name,
+                            row_offset=row_offset,
+                            **kwargs,
+                        )
+                    )
+                    row_offset += len(chunk)
+                total_rows += sum(future.result() for future in pending)
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        for worker, report in sorted(self.worker_report.items()):
+            logger.info(
+                f"{worker}: {report['rows']} rows in {report['chunks']} chunks "
+                f"({report['rows_per_second']:.0f} rows/s)."
+            )
+        return total_rows
+
+    @staticmethod
+    def _qualified_name(table_name: str, schema: str | None = None) -> str:
+        """
+        Returns the quoted, schema-qualified name of a table.
+
+        Args:
+            table_name (str): The table name.
+            schema (str | None, optional): The schema name. Defaults to None.
+
+        Returns:
+            str: The name to use in SQL statements.
+        """
+        return f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
+
+    @staticmethod
+    def _on_conflict(conflict_columns: list[str] | None) -> str:
+        """
+        Returns the `ON CONFLICT` clause skipping rows already present in the target.
+
+        Args:
+            conflict_columns (list[str] | None): The columns of a unique index of the
+            target, or None to insert every row.
+
+        Returns:
+            str: The clause, empty without `conflict_columns`.
+        """
+        if not conflict_columns:
+            return ""
+        columns = ", ".join(f'"{column}"' for column in conflict_columns)
+        return f" ON CONFLICT ({columns}) DO NOTHING"
+
+    def _log_promotion(self, source: str, target: str, seconds: float) -> None:
+        """
+        Logs the rows inserted and skipped by a promotion.
+
+        Args:
+            source (str): The qualified staging table.
+            target (str): The qualified target table.
+            seconds (float): The duration of the promotion.
+        """
+        logger.info(
+            f"{self.rows_inserted} rows promoted from {source} to {target} "
+            f"({self.rows_skipped} already present) in {seconds:.2f}s."
+        )
+
+    def promote(
+        self,
+        source_table: str,
+        target_table: str,
+        columns: list[str],
+        source_schema: str | None = None,
+        target_schema: str | None = None,
+        drop_source: bool = True,
+        conflict_columns: list[str] | None = None,
+    ) -> int:
+        """
+        Copies the rows of a staging table into a target table on the database server.
+
+        The `INSERT ... SELECT` and the drop of the staging table run in one
+        transaction, so the data never travels back through this process and a
+        failure leaves both tables untouched.
+
+        With `conflict_columns`, rows whose values in those columns already exist in
+        the target (typically the `row_hash` written by `write_to_sql`) are skipped
+        with `ON CONFLICT DO NOTHING`, so promoting the same data twice is a no-op.
+        The columns need a unique index in the target table.
+
+        Args:
+            source_table (str): The staging table.
+            target_table (str): The table receiving the rows.
+            columns (list[str]): The columns to copy.
+            source_schema (str | None, optional): The schema of the staging table. Defaults to None.
+            target_schema (str | None, optional): The schema of the target table. Defaults to None.
+            drop_source (bool, optional): Whether to drop the staging table afterwards.
+            Defaults to True.
+            conflict_columns (list[str] | None, optional): The uniquely indexed columns
+            used to skip rows already promoted. Defaults to None, which inserts every row.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+        source = self._qualified_name(source_table, source_schema)
+        target = self._qualified_name(target_table, target_schema)
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        # `WHERE true` keeps SQLite from parsing `ON CONFLICT` as a join constraint.
+        on_conflict = (
+            f" WHERE true{self._on_conflict(conflict_columns)}"
+            if conflict_columns
+            else ""
+        )
+
+        start = time.perf_counter()
+        with self.engine.begin() as connection:
+            source_rows = connection.execute(
+                sa.text(f"SELECT COUNT(*) FROM {source}")
+            ).scalar()
+            result = connection.execute(
+                sa.text(
+                    f"INSERT INTO {target} ({column_list}) "
+                    f"SELECT {column_list} FROM {source}{on_conflict}"
+                )
+            )
+            if drop_source:
+                connection.execute(sa.text(f"DROP TABLE IF EXISTS {source}"))
+
+        self.rows_inserted = result.rowcount
+        self.rows_skipped = source_rows - self.rows_inserted
+        self._log_promotion(source, target, time.perf_counter() - start)
+        return self.rows_inserted
+
+    @staticmethod
+    def _partitions(
+        connection: sa.engine.Connection, table_name: str, schema: str | None
+    ) -> set[str]:
+        """
+        Lists the partitions attached to a PostgreSQL partitioned table.
+
+        Args:
+            connection (sa.engine.Connection): The connection of the promotion.
+            table_name (str): The partitioned table.
+            schema (str | None): Its schema, None for `public`.
+
+        Returns:
+            set[str]: The names of the attached partitions.
+        """
+        query = sa.text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "JOIN pg_namespace ON pg_namespace.oid = parent.relnamespace "
+            "WHERE parent.relname = :table_name AND pg_namespace.nspname = :schema"
+        )
+        rows = connection.execute(
+            query, {"table_name": table_name, "schema": schema or "public"}
+        )
+        return set(rows.scalars().all())
+
+    def _attach_month(
+        self,
+        connection: sa.engine.Connection,
+        source: str,
+        target: str,
+        partition_table: str,
+        target_schema: str | None,
+        column_list: str,
+        partition_column: str,
+        bounds: tuple[str, str],
+        conflict_columns: list[str] | None,
+    ) -> int:
+        """
+        Loads one month into a new detached table and attaches it as a partition.
+
+        The table stays invisible to readers until the `ATTACH PARTITION`. A `CHECK`
+        constraint matching the partition bounds is added first, so PostgreSQL can
+        attach the table without scanning it.
+
+        Args:
+            connection (sa.engine.Connection): The connection of the promotion.
+            source (str): The qualified staging table.
+            target (str): The qualified partitioned table.
+            partition_table (str): The name of the new partition.
+            target_schema (str | None): The schema of the partitioned table.
+            column_list (str): The quoted columns to copy.
+            partition_column (str): The partition key.
+            bounds (tuple[str, str]): The inclusive lower and exclusive upper bound.
+            conflict_columns (list[str] | None): The uniquely indexed columns.
+
+        Returns:
+            int: The number of rows loaded into the partition.
+        """
+        partition = self._qualified_name(partition_table, target_schema)
+        key = f'"{partition_column}"'
+        lower, upper = bounds
+        in_bounds = f"{key} >= '{lower}' AND {key} < '{upper}'"
+
+        connection.execute(
+            sa.text(
+                f"CREATE TABLE {partition} "
+                f"(LIKE {target} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        if conflict_columns:
+            index_columns = ", ".join(f'"{column}"' for column in conflict_columns)
+            connection.execute(
+                sa.text(f"CREATE UNIQUE INDEX ON {partition} ({index_columns})")
+            )
+        result = connection.execute(
+            sa.text(
+                f"INSERT INTO {partition} ({column_list}) "
+                f"SELECT {column_list} FROM {source} WHERE {in_bounds}"
+                f"{self._on_conflict(conflict_columns)}"
+            )
+        )
+        constraint = f'"{partition_table}_bounds"'
+        connection.execute(
+            sa.text(
+                f"ALTER TABLE {partition} ADD CONSTRAINT {constraint} CHECK ({in_bounds})"
+            )
+        )
+        connection.execute(
+            sa.text(
+                f"ALTER TABLE {target} ATTACH PARTITION {partition} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        )
+        connection.execute(
+            sa.text(f"ALTER TABLE {partition} DROP CONSTRAINT {constraint}")
+        )
+        logger.info(f"Attached partition {partition} for [{lower}, {upper}).")
+        return result.rowcount
+
+    def promote_partitioned(
+        self,
+        source_table: str,
+        target_table: str,
+        columns: list[str],
+        partition_column: str,
+        source_schema: str | None = None,
+        target_schema: str | None = None,
+        drop_source: bool = True,
+        conflict_columns: list[str] | None = None,
+    ) -> int:
+        """
+        Promotes a staging table into a table range-partitioned by month on PostgreSQL.
+
+        Each month of the staging data that has no partition yet is loaded into a new
+        detached table which is then attached with `ATTACH PARTITION`, so publishing
+        it is a metadata change. Months that already have a partition (e.g. an
+        incremental load of the current month) are inserted into the partitioned
+        table directly. Everything runs in one transaction, like `promote`.
+
+        The partitions of a month are checked and created under a transaction-level
+        advisory lock of that month, so concurrent promotions reaching a new month
+        create it once and the others insert into it. Months are locked in order,
+        which keeps two promotions from waiting on each other.
+
+        The table must be partitioned already: see
+        `scripts/partition_production_taxi_data.sql` to migrate an existing one.
+
+        Args:
+            source_table (str): The staging table.
+            target_table (str): The partitioned table receiving the rows.
+            columns (list[str]): The columns to copy.
+            partition_column (str): The timestamp column the table is partitioned on.
+            source_schema (str | None, optional): The schema of the staging table. Defaults to None.
+            target_schema (str | None, optional): The schema of the target table. Defaults to None.
+            drop_source (bool, optional): Whether to drop the staging table afterwards.
+            Defaults to True.
+            conflict_columns (list[str] | None, optional): The uniquely indexed columns
+            used to skip rows already promoted. Defaults to None.
+
+        Returns:
+            int: The number of rows inserted.
+
+        Raises:
+            ValueError: If the database is not PostgreSQL.
+        """
+        if self.engine.dialect.name != "postgresql":
+            logger.error("Partitioned promotion requires PostgreSQL.")
+            raise ValueError("Partitioned promotion requires PostgreSQL")
+
+        source = self._qualified_name(source_table, source_schema)
+        target = self._qualified_name(target_table, target_schema)
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        key = f'"{partition_column}"'
+
+        start = time.perf_counter()
+        inserted = 0
+        with self.engine.begin() as connection:
+            source_rows = connection.execute(
+                sa.text(f"SELECT COUNT(*) FROM {source}")
+            ).scalar()
+            months = connection.execute(
+                sa.text(
+                    f"SELECT DISTINCT date_trunc('month', {key}) FROM {source} ORDER BY 1"
+                )
+            )
+            months = [pd.Timestamp(month) for month in months.scalars().all()]
+
+            for month in months:
+                partition_table = f"{target_table}_{month:%Y_%m}"
+                bounds = (
+                    str(month),
+                    str(month + pd.offsets.MonthBegin(1)),
+                )
+                connection.execute(
+                    sa.text("SELECT pg_advisory_xact_lock(hashtext(:partition))"),
+                    {"partition": self._qualified_name(partition_table, target_schema)},
+                )
+                attached = self._partitions(connection, target_table, target_schema)
+                if partition_table not in attached:
+                    inserted += self._attach_month(
+                        connection,
+                        source,
+                        target,
+                        partition_table,
+                        target_schema,
+                        column_list,
+                        partition_column,
+                        bounds,
+                        conflict_columns,
+                    )
+                    continue
+
+                result = connection.execute(
+                    sa.text(
+                        f"INSERT INTO {target} ({column_list}) "
+                        f"SELECT {column_list} FROM {source} "
+                        f"WHERE {key} >= :lower AND {key} < :upper"
+                        f"{self._on_conflict(conflict_columns)}"
+                    ),
+                    {"lower": bounds[0], "upper": bounds[1]},
+                )
+                inserted += result.rowcount
+
+            if drop_source:
+                connection.execute(sa.text(f"DROP TABLE IF EXISTS {source}"))
 
-        total_rows: int = len(self.df)
-        logger.info(f"{total_rows} rows written to {table_name}.")
-        print(f"{total_rows} rows written to {table_name}.")
+        self.rows_inserted = inserted
+        self.rows_skipped = source_rows - inserted
+        self._log_promotion(source, target, time.perf_counter() - start)
+        return self.rows_inserted
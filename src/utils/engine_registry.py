@@ -0,0 +1,212 @@
+import os
+import time
+import logging
+import threading
+
+import sqlalchemy as sa
+
+from typing import Dict
+from sqlalchemy.pool import QueuePool
+
+from dotenv import load_dotenv
+from src.config.config import (
+    POOL_SIZE,
+    POOL_MAX_OVERFLOW,
+    POOL_TIMEOUT,
+    POOL_RECYCLE,
+    POOL_PRE_PING,
+)
+
+load_dotenv()
+
+logger: logging.Logger = logging.getLogger("class EngineRegistry")
+
+
+class PoolStats:
+    """Connection-acquire latency and saturation of one connection pool."""
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initializes empty statistics.
+
+        Args:
+            capacity (int): The maximum number of connections of the pool
+            (`pool_size + max_overflow`).
+        """
+        self.capacity = capacity
+        self.acquisitions: int = 0
+        self.timeouts: int = 0
+        self.total_acquire_seconds: float = 0.0
+        self.max_acquire_seconds: float = 0.0
+        self.checked_out: int = 0
+        self.peak_checked_out: int = 0
+        self._lock = threading.Lock()
+
+    def record_acquire(self, seconds: float, checked_out: int) -> None:
+        """
+        Records a connection handed out by the pool.
+
+        Args:
+            seconds (float): The time spent waiting for the connection.
+            checked_out (int): The number of connections checked out afterwards.
+        """
+        with self._lock:
+            self.acquisitions += 1
+            self.total_acquire_seconds += seconds
+            self.max_acquire_seconds = max(self.max_acquire_seconds, seconds)
+            self.checked_out = checked_out
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def record_timeout(self) -> None:
+        """Records a caller that gave up waiting for a connection."""
+        with self._lock:
+            self.timeouts += 1
+
+    def record_release(self, checked_out: int) -> None:
+        """
+        Records a connection returned to the pool.
+
+        Args:
+            checked_out (int): The number of connections still checked out.
+        """
+        with self._lock:
+            self.checked_out = checked_out
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Returns a snapshot of the statistics.
+
+        Returns:
+            Dict[str, float]: The acquisition count, timeouts, mean and max acquire
+            latency in milliseconds, current and peak checked-out connections, and
+            current and peak saturation (checked-out connections over capacity).
+        """
+        with self._lock:
+            mean_seconds = (
+                self.total_acquire_seconds / self.acquisitions
+                if self.acquisitions
+                else 0.0
+            )
+            return {
+                "acquisitions": self.acquisitions,
+                "timeouts": self.timeouts,
+                "mean_acquire_ms": mean_seconds * 1000,
+                "max_acquire_ms": self.max_acquire_seconds * 1000,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "capacity": self.capacity,
+                "saturation": self.checked_out / self.capacity,
+                "peak_saturation": self.peak_checked_out / self.capacity,
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """`QueuePool` recording how long callers wait for a connection in `stats`."""
+
+    stats: PoolStats
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except sa.exc.TimeoutError:
+            self.stats.record_timeout()
+            raise
+        self.stats.record_acquire(time.perf_counter() - start, self.checkedout())
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self.stats.record_release(self.checkedout())
+
+
+class EngineRegistry:
+    """Process-wide registry handing out one pooled engine per connection string."""
+
+    _engines: Dict[str, sa.engine.Engine] = {}
+    _stats: Dict[str, PoolStats] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def pool_options() -> Dict[str, int | bool]:
+        """
+        Returns the pool settings every engine of the registry is created with.
+
+        They are plain values, so they can also be stored in the Great Expectations
+        datasource configuration.
+
+        Returns:
+            Dict[str, int | bool]: The `create_engine` pool arguments.
+        """
+        return {
+            "pool_size": POOL_SIZE,
+            "max_overflow": POOL_MAX_OVERFLOW,
+            "pool_timeout": POOL_TIMEOUT,
+            "pool_recycle": POOL_RECYCLE,
+            "pool_pre_ping": POOL_PRE_PING,
+        }
+
+    @classmethod
+    def get_engine(cls, connection_string: str | None = None) -> sa.engine.Engine:
+        """
+        Returns the shared engine of a database, creating it on first use.
+
+        Args:
+            connection_string (str | None, optional): The database URL. Defaults to
+            None, which uses the `CONNECTION_STRING` environment variable.
+
+        Returns:
+            sa.engine.Engine: The pooled engine.
+        """
+        connection_string = connection_string or os.getenv("CONNECTION_STRING")
+        with cls._lock:
+            if connection_string not in cls._engines:
+                stats = PoolStats(capacity=POOL_SIZE + POOL_MAX_OVERFLOW)
+                poolclass = type("TimedQueuePool", (TimedQueuePool,), {"stats": stats})
+                cls._engines[connection_string] = sa.create_engine(
+                    connection_string, poolclass=poolclass, **cls.pool_options()
+                )
+                cls._stats[connection_string] = stats
+                logger.info(
+                    f"Created pooled engine (size {POOL_SIZE}, overflow {POOL_MAX_OVERFLOW})."
+                )
+            return cls._engines[connection_string]
+
+    @classmethod
+    def stats(cls, connection_string: str | None = None) -> Dict[str, float]:
+        """
+        Returns the pool statistics of a registered engine.
+
+        Args:
+            connection_string (str | None, optional): The database URL. Defaults to
+            None, which uses the `CONNECTION_STRING` environment variable.
+
+        Returns:
+            Dict[str, float]: See `PoolStats.as_dict`, empty if no engine was created.
+        """
+        connection_string = connection_string or os.getenv("CONNECTION_STRING")
+        stats = cls._stats.get(connection_string)
+        return stats.as_dict() if stats is not None else {}
+
+    @classmethod
+    def dispose_all(cls) -> None:
+        """Closes the pooled connections of every engine and empties the registry."""
+        with cls._lock:
+            for engine in cls._engines.values():
+                engine.dispose()
+            cls._engines.clear()
+            cls._stats.clear()
+
+
+def get_engine(connection_string: str | None = None) -> sa.engine.Engine:
+    """
+    Returns the shared pooled engine of a database, see `EngineRegistry.get_engine`.
+
+    Args:
+        connection_string (str | None, optional): The database URL. Defaults to None,
+        which uses the `CONNECTION_STRING` environment variable.
+
+    Returns:
+        sa.engine.Engine: The pooled engine.
+    """
+    return EngineRegistry.get_engine(connection_string)
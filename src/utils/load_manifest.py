@@ -0,0 +1,166 @@
+import hashlib
+import logging
+
+import pandas as pd
+import sqlalchemy as sa
+
+from typing import Dict
+
+from src.utils.my_logger import LoggerSetup
+from src.utils.engine_registry import get_engine
+from src.config.config import STAGE_SCHEMA, LOAD_MANIFEST_TABLE
+
+logger: logging.Logger = logging.getLogger("class LoadManifest")
+
+
+def chunk_fingerprint(chunk: pd.DataFrame) -> str:
+    """
+    Computes a fingerprint of the columns and rows of a chunk.
+
+    Args:
+        chunk (pd.DataFrame): The rows of the chunk. The index is ignored.
+
+    Returns:
+        str: The 32 hexadecimal digits of the fingerprint.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\x1f".join(map(str, chunk.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(chunk, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class LoadManifest:
+    """Control table recording which chunks of a load were committed to a table."""
+
+    def __init__(
+        self,
+        target: str,
+        engine: sa.engine.Engine | None = None,
+        table_name: str = LOAD_MANIFEST_TABLE,
+        schema: str | None = STAGE_SCHEMA,
+    ) -> None:
+        """
+        Initializes the manifest of the load into `target`.
+
+        Args:
+            target (str): The table being loaded, e.g. the staging table of a run.
+            engine (sa.engine.Engine | None, optional): The engine of the database.
+            Defaults to None, which uses the shared engine of `CONNECTION_STRING`.
+            table_name (str, optional): The control table. Defaults to `LOAD_MANIFEST_TABLE`.
+            schema (str | None, optional): The schema of the control table.
+            Defaults to `STAGE_SCHEMA`.
+        """
+        LoggerSetup()
+
+        self.target = target
+        self.engine = engine or get_engine()
+        self.table_name = table_name
+        self.schema = schema
+        self._table_ready = False
+
+    @property
+    def qualified_name(self) -> str:
+        """The quoted, schema-qualified name of the control table."""
+        if self.schema:
+            return f'"{self.schema}"."{self.table_name}"'
+        return f'"{self.table_name}"'
+
+    def _ensure_table(self) -> None:
+        """
+        Creates the control table on first use.
+
+        A table created before chunks had a fingerprint gets the `chunk_hash` column.
+        """
+        if self._table_ready:
+            return
+        with self.engine.begin() as connection:
+            connection.execute(
+                sa.text(
+                    f"CREATE TABLE IF NOT EXISTS {self.qualified_name} ("
+                    "target VARCHAR(128) NOT NULL, "
+                    "position INT NOT NULL, "
+                    "row_offset BIGINT NOT NULL, "
+                    "row_count BIGINT NOT NULL, "
+                    "chunk_hash VARCHAR(32), "
+                    "committed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+                    "PRIMARY KEY (target, position))"
+                )
+            )
+            columns = sa.inspect(connection).get_columns(
+                self.table_name, schema=self.schema
+            )
+            if "chunk_hash" not in [column["name"] for column in columns]:
+                connection.execute(
+                    sa.text(
+                        f"ALTER TABLE {self.qualified_name} "
+                        "ADD COLUMN chunk_hash VARCHAR(32)"
+                    )
+                )
+        self._table_ready = True
+
+    def committed(self) -> Dict[int, tuple[int, int, str | None]]:
+        """
+        Returns the chunks already committed to the target.
+
+        Returns:
+            Dict[int, tuple[int, int, str | None]]: The row offset, row count and
+            fingerprint (see `chunk_fingerprint`) of each committed chunk, by chunk
+            position.
+        """
+        self._ensure_table()
+        with self.engine.connect() as connection:
+            rows = connection.execute(
+                sa.text(
+                    "SELECT position, row_offset, row_count, chunk_hash "
+                    f"FROM {self.qualified_name} WHERE target = :target"
+                ),
+                {"target": self.target},
+            ).all()
+        return {position: tuple(chunk) for position, *chunk in rows}
+
+    def record(
+        self,
+        connection: sa.engine.Connection,
+        position: int,
+        row_offset: int,
+        row_count: int,
+        chunk_hash: str,
+    ) -> None:
+        """
+        Records a chunk as committed.
+
+        It must run on the connection that wrote the chunk, inside the same
+        transaction, so a chunk is recorded if and only if its rows were committed.
+
+        Args:
+            connection (sa.engine.Connection): The connection of the chunk write.
+            position (int): The position of the chunk in the input.
+            row_offset (int): The number of input rows before the chunk.
+            row_count (int): The number of rows of the chunk.
+            chunk_hash (str): The fingerprint of the chunk, see `chunk_fingerprint`.
+        """
+        self._ensure_table()
+        connection.execute(
+            sa.text(
+                f"INSERT INTO {self.qualified_name} "
+                "(target, position, row_offset, row_count, chunk_hash) "
+                "VALUES (:target, :position, :row_offset, :row_count, :chunk_hash)"
+            ),
+            {
+                "target": self.target,
+                "position": position,
+                "row_offset": row_offset,
+                "row_count": row_count,
+                "chunk_hash": chunk_hash,
+            },
+        )
+
+    def clear(self) -> None:
+        """Forgets the chunks of the target, once its load is finished."""
+        self._ensure_table()
+        with self.engine.begin() as connection:
+            connection.execute(
+                sa.text(f"DELETE FROM {self.qualified_name} WHERE target = :target"),
+                {"target": self.target},
+            )
+        logger.info(f"Cleared the load manifest of {self.target}.")
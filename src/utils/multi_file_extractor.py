@@ -0,0 +1,295 @@
+import os
+import glob
+import shutil
+import logging
+import tempfile
+import threading
+import urllib.request
+
+import pandas as pd
+
+from pathlib import Path
+from typing import Dict, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+
+from src.utils.my_logger import LoggerSetup
+from src.utils.data_extractor import TaxiDataExtractor
+from src.config.config import (
+    MAX_DOWNLOAD_WORKERS,
+    MAX_PARSE_WORKERS,
+    MAX_BYTES_IN_FLIGHT,
+)
+
+logger: logging.Logger = logging.getLogger("class MultiFileTaxiDataExtractor")
+
+
+def _parse_file(path: str, schema: Dict[str, str] | None) -> pd.DataFrame:
+    """
+    Parses a single downloaded file, run inside a worker process.
+
+    `TaxiDataExtractor.read_source` is used rather than `load_data`, which logs errors
+    away, so a broken file fails with its own error.
+
+    Args:
+        path (str): The local path of the file.
+        schema (Dict[str, str] | None): The declared schema, see `TaxiDataExtractor`.
+
+    Returns:
+        pd.DataFrame: The parsed DataFrame.
+    """
+    return TaxiDataExtractor(path, schema=schema).read_source()
+
+
+class _ByteBudget:
+    """Blocks producers while too many downloaded bytes wait to be consumed."""
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Initializes the budget.
+
+        Args:
+            max_bytes (int): The maximum number of bytes in flight.
+        """
+        self.max_bytes = max_bytes
+        self.in_flight = 0
+        self.cancelled = False
+        self._condition = threading.Condition()
+
+    def acquire(self, size: int) -> None:
+        """
+        Waits until `size` bytes fit in the budget. A file larger than the whole
+        budget is still admitted when nothing else is in flight.
+
+        Args:
+            size (int): The number of bytes to reserve.
+
+        Raises:
+            CancelledError: If the budget was cancelled while waiting.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: (
+                    self.cancelled
+                    or self.in_flight == 0
+                    or self.in_flight + size <= self.max_bytes
+                )
+            )
+            if self.cancelled:
+                raise CancelledError("Extraction was cancelled")
+            self.in_flight += size
+
+    def release(self, size: int) -> None:
+        """
+        Returns `size` bytes to the budget.
+
+        Args:
+            size (int): The number of bytes to release.
+        """
+        with self._condition:
+            self.in_flight -= size
+            self._condition.notify_all()
+
+    def cancel(self) -> None:
+        """Wakes up and rejects every producer waiting for the budget."""
+        with self._condition:
+            self.cancelled = True
+            self._condition.notify_all()
+
+
+class MultiFileTaxiDataExtractor:
+    """Extracts many NYC Taxi files concurrently, e.g. monthly `yellow_tripdata_*` partitions."""
+
+    def __init__(
+        self,
+        sources: str | list[str],
+        schema: Dict[str, str] | None = None,
+        download_workers: int = MAX_DOWNLOAD_WORKERS,
+        parse_workers: int = MAX_PARSE_WORKERS,
+        max_bytes_in_flight: int = MAX_BYTES_IN_FLIGHT,
+    ) -> None:
+        """
+        Initializes the extractor with the sources to extract.
+
+        Args:
+            sources (str | list[str]): A list of URLs or paths, or a glob pattern of local files.
+            schema (Dict[str, str] | None, optional): The declared schema passed on to
+            `TaxiDataExtractor`. Defaults to None.
+            download_workers (int, optional): The number of download threads.
+            Defaults to `MAX_DOWNLOAD_WORKERS`.
+            parse_workers (int, optional): The number of parsing processes.
+            Defaults to `MAX_PARSE_WORKERS`.
+            max_bytes_in_flight (int, optional): The maximum number of downloaded bytes not yet
+            consumed by the caller. Defaults to `MAX_BYTES_IN_FLIGHT`.
+
+        Raises:
+            ValueError: If no source is given or a limit is not positive.
+        """
+        LoggerSetup()
+
+        self.sources = self._resolve_sources(sources)
+        if not self.sources:
+            logger.error("No source files to extract.")
+            raise ValueError("No source files to extract")
+
+        if min(download_workers, parse_workers, max_bytes_in_flight) <= 0:
+            logger.error("Worker and byte limits must be positive.")
+            raise ValueError("Worker and byte limits must be positive")
+
+        self.schema = schema
+        self.download_workers = download_workers
+        self.parse_workers = parse_workers
+        self.max_bytes_in_flight = max_bytes_in_flight
+
+    @staticmethod
+    def _resolve_sources(sources: str | list[str]) -> list[str]:
+        """
+        Expands a glob pattern into the sorted list of matching files.
+
+        Args:
+            sources (str | list[str]): A list of sources or a single source or glob pattern.
+
+        Returns:
+            list[str]: The sources to extract.
+        """
+        if isinstance(sources, str):
+            if glob.has_magic(sources):
+                return sorted(glob.glob(sources))
+            return [sources]
+        return list(sources)
+
+    @staticmethod
+    def _is_remote(source: str) -> bool:
+        """
+        Checks whether a source has to be downloaded.
+
+        Args:
+            source (str): The URL or path of the source.
+
+        Returns:
+            bool: True for HTTP(S) URLs.
+        """
+        return source.startswith(("http://", "https://"))
+
+    def _source_size(self, source: str) -> int:
+        """
+        Returns the size of a source in bytes, or 0 when the server does not tell.
+
+        Args:
+            source (str): The URL or path of the source.
+
+        Returns:
+            int: The size in bytes.
+        """
+        if not self._is_remote(source):
+            return os.path.getsize(source)
+
+        request = urllib.request.Request(source, method="HEAD")
+        with urllib.request.urlopen(request) as response:
+            return int(response.headers.get("Content-Length") or 0)
+
+    def _download(
+        self, source: str, download_dir: str, budget: _ByteBudget
+    ) -> tuple[str, int]:
+        """
+        Reserves the byte budget and downloads a remote source to a local file.
+
+        Local files are parsed in place and only reserve their size. A remote source
+        whose size the server does not tell reserves the bytes actually downloaded,
+        once they are on disk.
+
+        Args:
+            source (str): The URL or path of the source.
+            download_dir (str): The directory for downloaded files.
+            budget (_ByteBudget): The shared budget of bytes in flight.
+
+        Returns:
+            tuple[str, int]: The local path and the number of bytes reserved.
+        """
+        size = self._source_size(source)
+        remote = self._is_remote(source)
+        reserved = not remote or size > 0
+        if reserved:
+            budget.acquire(size)
+        if not remote:
+            return source, size
+
+        try:
+            fd, target = tempfile.mkstemp(
+                dir=download_dir, suffix=f"_{Path(source).name}"
+            )
+            with urllib.request.urlopen(source) as response, os.fdopen(fd, "wb") as out:
+                shutil.copyfileobj(response, out)
+        except BaseException:
+            if reserved:
+                budget.release(size)
+            raise
+
+        if not reserved:
+            size = os.path.getsize(target)
+            budget.acquire(size)
+        logger.info(f"Downloaded {source}.")
+        return target, size
+
+    def iter_results(self) -> Iterator[tuple[str, pd.DataFrame]]:
+        """
+        Downloads and parses every source concurrently.
+
+        Downloads run on a thread pool and parsing on a process pool. Results are
+        yielded as soon as each file is parsed, so the order is completion order and
+        not the order of `sources`.
+
+        Yields:
+            tuple[str, pd.DataFrame]: The source and its parsed DataFrame.
+
+        Raises:
+            Exception: If a file fails to download or parse.
+        """
+        budget = _ByteBudget(self.max_bytes_in_flight)
+        download_dir = tempfile.mkdtemp(prefix="taxi_downloads_")
+        downloads: Dict[Future, str] = {}
+        parses: Dict[Future, tuple[str, str, int]] = {}
+
+        with (
+            ThreadPoolExecutor(self.download_workers) as download_pool,
+            ProcessPoolExecutor(self.parse_workers) as parse_pool,
+        ):
+            try:
+                for source in self.sources:
+                    future = download_pool.submit(
+                        self._download, source, download_dir, budget
+                    )
+                    downloads[future] = source
+
+                while downloads or parses:
+                    done, _ = wait([*downloads, *parses], return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future in downloads:
+                            source = downloads.pop(future)
+                            path, size = future.result()
+                            parse = parse_pool.submit(_parse_file, path, self.schema)
+                            parses[parse] = (source, path, size)
+                            continue
+
+                        source, path, size = parses.pop(future)
+                        try:
+                            df = future.result()
+                            logger.info(f"Parsed {len(df)} rows from {source}.")
+                            yield source, df
+                        finally:
+                            if path != source:
+                                Path(path).unlink(missing_ok=True)
+                            budget.release(size)
+            except BaseException:
+                for future in [*downloads, *parses]:
+                    future.cancel()
+                budget.cancel()
+                raise
+            finally:
+                shutil.rmtree(download_dir, ignore_errors=True)
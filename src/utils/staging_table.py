@@ -0,0 +1,217 @@
+import re
+import uuid
+import logging
+
+import sqlalchemy as sa
+
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+
+from src.utils.my_logger import LoggerSetup
+from src.utils.engine_registry import get_engine
+from src.utils.load_manifest import LoadManifest
+from src.config.config import (
+    STAGE_SCHEMA,
+    STAGE_TABLE_PREFIX,
+    STAGE_DDL_FILE,
+    STAGE_MAX_AGE_SECONDS,
+)
+
+logger: logging.Logger = logging.getLogger("class StagingTableManager")
+
+TIMESTAMP_FORMAT: str = "%Y%m%d%H%M%S"
+MAX_IDENTIFIER_LENGTH: int = 63
+
+
+class StagingTableManager:
+    """Creates one staging table per pipeline run and drops the ones left behind."""
+
+    def __init__(
+        self,
+        engine: sa.engine.Engine | None = None,
+        schema: str = STAGE_SCHEMA,
+        prefix: str = STAGE_TABLE_PREFIX,
+        ddl_path: str = STAGE_DDL_FILE,
+        max_age_seconds: int = STAGE_MAX_AGE_SECONDS,
+    ) -> None:
+        """
+        Initializes the manager.
+
+        Args:
+            engine (sa.engine.Engine | None, optional): The engine of the database.
+            Defaults to None, which uses the shared engine of `CONNECTION_STRING`.
+            schema (str, optional): The schema of the staging tables. Defaults to `STAGE_SCHEMA`.
+            prefix (str, optional): The name prefix of the staging tables.
+            Defaults to `STAGE_TABLE_PREFIX`.
+            ddl_path (str, optional): The SQL script whose `CREATE TABLE` columns are used
+            for every staging table. Defaults to `STAGE_DDL_FILE`.
+            max_age_seconds (int, optional): Staging tables older than this are considered
+            orphaned. Defaults to `STAGE_MAX_AGE_SECONDS`.
+        """
+        LoggerSetup()
+
+        self.engine = engine or get_engine()
+        self.schema = schema
+        self.prefix = prefix
+        self.ddl_path = Path(ddl_path)
+        self.max_age_seconds = max_age_seconds
+
+    @staticmethod
+    def new_run_id() -> str:
+        """
+        Returns a random run id.
+
+        Returns:
+            str: An 8-character hexadecimal id.
+        """
+        return uuid.uuid4().hex[:8]
+
+    def table_name(self, run_id: str, created_at: datetime | None = None) -> str:
+        """
+        Returns the staging table name of a run.
+
+        The name holds the creation time, so orphaned tables can be aged without
+        any bookkeeping, and the run id reduced to characters valid in an identifier.
+
+        Args:
+            run_id (str): The run id, e.g. an Airflow `run_id`.
+            created_at (datetime | None, optional): The creation time. Defaults to now.
+
+        Returns:
+            str: The table name, at most 63 characters long.
+        """
+        created_at = created_at or datetime.now(timezone.utc)
+        safe_run_id = re.sub(r"[^a-z0-9_]", "_", run_id.lower())
+        name = f"{self.prefix}_{created_at.strftime(TIMESTAMP_FORMAT)}_{safe_run_id}"
+        return name[:MAX_IDENTIFIER_LENGTH]
+
+    def _column_definitions(self) -> str:
+        """
+        Reads the column definitions of the `CREATE TABLE` statement of the DDL script.
+
+        Returns:
+            str: The text between the parentheses of the statement.
+
+        Raises:
+            ValueError: If the script has no `CREATE TABLE` statement.
+        """
+        ddl = self.ddl_path.read_text()
+        match = re.search(r"CREATE\s+TABLE\s+[\w.\"]+\s*\((.*)\)\s*;", ddl, re.S | re.I)
+        if match is None:
+            logger.error(f"No CREATE TABLE statement in {self.ddl_path}.")
+            raise ValueError(f"No CREATE TABLE statement in {self.ddl_path}")
+        return match.group(1).strip()
+
+    def _qualified_name(self, table_name: str) -> str:
+        """
+        Returns the quoted, schema-qualified name of a staging table.
+
+        Args:
+            table_name (str): The table name.
+
+        Returns:
+            str: The name to use in SQL statements.
+        """
+        return f'"{self.schema}"."{table_name}"'
+
+    def find(self, run_id: str) -> str | None:
+        """
+        Returns the existing staging table of a run, if any.
+
+        Args:
+            run_id (str): The run id.
+
+        Returns:
+            str | None: The table name, or None if the run has no table.
+        """
+        # The name without its "<prefix>_<14-digit timestamp>" head.
+        suffix = self.table_name(run_id)[len(self.prefix) + 15 :]
+        pattern = re.compile(rf"^{re.escape(self.prefix)}_\d{{14}}{re.escape(suffix)}$")
+        matches = [
+            table_name
+            for table_name in sa.inspect(self.engine).get_table_names(
+                schema=self.schema
+            )
+            if pattern.match(table_name)
+        ]
+        return max(matches, default=None)
+
+    def create(self, run_id: str) -> str:
+        """
+        Creates the staging table of a run, or reuses it if the run already has one.
+
+        A restarted run (e.g. an Airflow retry, which keeps its `run_id`) thus resumes
+        loading into the table of the interrupted attempt, see `LoadManifest`.
+        On PostgreSQL the table is `UNLOGGED`: its rows are not written to the WAL,
+        which is fine for data that is either promoted or thrown away.
+
+        Args:
+            run_id (str): The run id.
+
+        Returns:
+            str: The name of the table.
+        """
+        existing = self.find(run_id)
+        if existing is not None:
+            logger.info(f"Reusing staging table {self.schema}.{existing}.")
+            return existing
+
+        table_name = self.table_name(run_id)
+        unlogged = "UNLOGGED " if self.engine.dialect.name == "postgresql" else ""
+        with self.engine.begin() as connection:
+            if self.engine.dialect.name == "postgresql":
+                connection.execute(
+                    sa.text(f'CREATE SCHEMA IF NOT EXISTS "{self.schema}"')
+                )
+            connection.execute(
+                sa.text(
+                    f"CREATE {unlogged}TABLE {self._qualified_name(table_name)} "
+                    f"({self._column_definitions()})"
+                )
+            )
+        logger.info(f"Created staging table {self.schema}.{table_name}.")
+        return table_name
+
+    def drop(self, table_name: str) -> None:
+        """
+        Drops a staging table if it exists.
+
+        Args:
+            table_name (str): The table name.
+        """
+        with self.engine.begin() as connection:
+            connection.execute(
+                sa.text(f"DROP TABLE IF EXISTS {self._qualified_name(table_name)}")
+            )
+        logger.info(f"Dropped staging table {self.schema}.{table_name}.")
+
+    def cleanup_orphans(self) -> list[str]:
+        """
+        Drops the staging tables created more than `max_age_seconds` ago.
+
+        Runs that fail validation keep their table for inspection, and crashed runs
+        never drop theirs; both are removed here once they are old enough not to
+        belong to a run still in progress, together with their `LoadManifest` entries.
+
+        Returns:
+            list[str]: The dropped tables.
+        """
+        pattern = re.compile(rf"^{re.escape(self.prefix)}_(\d{{14}})_")
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.max_age_seconds)
+
+        dropped: list[str] = []
+        for table_name in sa.inspect(self.engine).get_table_names(schema=self.schema):
+            match = pattern.match(table_name)
+            if match is None:
+                continue
+            created_at = datetime.strptime(match.group(1), TIMESTAMP_FORMAT).replace(
+                tzinfo=timezone.utc
+            )
+            if created_at < cutoff:
+                self.drop(table_name)
+                LoadManifest(table_name, self.engine, schema=self.schema).clear()
+                dropped.append(table_name)
+
+        if dropped:
+            logger.info(f"Dropped {len(dropped)} orphaned staging tables.")
+        return dropped
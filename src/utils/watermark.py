@@ -0,0 +1,116 @@
+import json
+import logging
+
+import pandas as pd
+import sqlalchemy as sa
+
+from pathlib import Path
+
+from src.utils.my_logger import LoggerSetup
+from src.utils.engine_registry import get_engine
+from src.config.config import WATERMARK_FILE
+
+logger: logging.Logger = logging.getLogger("class WatermarkStore")
+
+
+class WatermarkStore:
+    """Tracks the high-water mark of a timestamp column already loaded into production."""
+
+    def __init__(
+        self,
+        engine: sa.engine.Engine | None = None,
+        path: str = WATERMARK_FILE,
+        table_name: str = "taxi_data",
+        schema: str = "production",
+        column: str = "pickup_datetime",
+    ) -> None:
+        """
+        Initializes the store for a table column.
+
+        Args:
+            engine (sa.engine.Engine | None, optional): The engine used to query the table.
+            Defaults to None, which uses the shared engine of `CONNECTION_STRING`.
+            path (str, optional): The local JSON file caching the watermark between runs.
+            Defaults to `WATERMARK_FILE`.
+            table_name (str, optional): The table holding the loaded rows. Defaults to "taxi_data".
+            schema (str, optional): The schema of the table. Defaults to "production".
+            column (str, optional): The timestamp column. Defaults to "pickup_datetime".
+        """
+        LoggerSetup()
+
+        self.engine = engine or get_engine()
+        self.path = Path(path)
+        self.table_name = table_name
+        self.schema = schema
+        self.column = column
+
+    @property
+    def key(self) -> str:
+        """The key of the watermark in the local cache file."""
+        return f"{self.schema}.{self.table_name}.{self.column}"
+
+    def _read_local(self) -> dict:
+        """
+        Reads the local cache file.
+
+        Returns:
+            dict: The cached watermarks by key, empty if the file does not exist.
+        """
+        if not self.path.exists():
+            return {}
+        with open(self.path) as file:
+            return json.load(file)
+
+    def _write_local(self, watermark: pd.Timestamp | None) -> None:
+        """
+        Atomically stores a watermark in the local cache file.
+
+        Args:
+            watermark (pd.Timestamp | None): The watermark to cache.
+        """
+        watermarks = self._read_local()
+        watermarks[self.key] = watermark.isoformat() if watermark is not None else None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as file:
+            json.dump(watermarks, file, indent=2)
+        tmp_path.replace(self.path)
+
+    def _query(self) -> pd.Timestamp | None:
+        """
+        Queries the maximum value of the column in the table.
+
+        Returns:
+            pd.Timestamp | None: The maximum value, None if the table is empty.
+        """
+        query = sa.text(
+            f'SELECT MAX("{self.column}") FROM "{self.schema}"."{self.table_name}"'
+        )
+        with self.engine.connect() as connection:
+            value = connection.execute(query).scalar()
+        return pd.Timestamp(value) if value is not None else None
+
+    def get(self) -> pd.Timestamp | None:
+        """
+        Returns the watermark, from the local cache when available.
+
+        Returns:
+            pd.Timestamp | None: The highest value already loaded, None if nothing was.
+        """
+        watermarks = self._read_local()
+        if self.key in watermarks:
+            value = watermarks[self.key]
+            return pd.Timestamp(value) if value is not None else None
+        return self.refresh()
+
+    def refresh(self) -> pd.Timestamp | None:
+        """
+        Re-reads the watermark from the table and updates the local cache.
+
+        Returns:
+            pd.Timestamp | None: The highest value already loaded, None if nothing was.
+        """
+        watermark = self._query()
+        self._write_local(watermark)
+        logger.info(f"Watermark of {self.key}: {watermark}.")
+        return watermark
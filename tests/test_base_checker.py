@@ -4,7 +4,17 @@ import pandas as pd
 from enum import Enum
 from typing import Dict
 from unittest.mock import patch, MagicMock
+import great_expectations.expectations as gxe
 from src.great_expectations_checker.base_checker import GreatExpectationsChecker
+from src.great_expectations_checker.context_cache import ContextCache
+from great_expectations.core import (
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+)
+from great_expectations.exceptions import DataContextError
 
 
 class MockConfig(Enum):
@@ -17,6 +27,12 @@ class MockConfig(Enum):
     SUITE_NAME: str = "mock_suite"
 
 
+@pytest.fixture(autouse=True)
+def reset_context_cache():
+    yield
+    ContextCache.clear()
+
+
 @pytest.fixture
 def mock_config():
     return MockConfig
@@ -76,6 +92,22 @@ def test_set_data_docs_site_except_branch(mock_get_context, mock_config):
     )
 
 
+def test_set_data_docs_site_unchanged(mock_get_context, mock_config):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    mock_context.variables.data_docs_sites = {
+        mock_config.SITE_NAME: mock_config.SITE_CONFIG
+    }
+
+    # Call function
+    result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
+    result.set_data_docs_site(mock_config.SITE_NAME, mock_config.SITE_CONFIG)
+
+    # Asserts
+    mock_context.add_data_docs_site.assert_not_called()
+    mock_context.update_data_docs_site.assert_not_called()
+
+
 def test_set_suite_existing_suite(mock_get_context, mock_config):
     # Mocks
     mock_context = mock_get_context.return_value
@@ -153,6 +185,7 @@ def test_create_validation_definition(
     mock_validation_definition.return_value = mock_validation_instance
 
     mock_context.validation_definitions = MagicMock()
+    mock_context.validation_definitions.get.side_effect = DataContextError("missing")
     mock_context.validation_definitions.add_or_update = MagicMock(
         return_value=mock_validation_instance
     )
@@ -176,22 +209,17 @@ def test_create_validation_definition(
     assert check_result is mock_validation_instance
 
 
-@patch("great_expectations.checkpoint.actions.UpdateDataDocsAction")
 @patch("great_expectations.checkpoint.checkpoint.Checkpoint")
-def test_create_checkpoint(
-    mock_checkpoint, mock_update_action, mock_get_context, mock_config
-):
+def test_create_checkpoint(mock_checkpoint, mock_get_context, mock_config):
     # Mocks
     mock_context = mock_get_context.return_value
     mock_validation_definition = MagicMock()
 
-    mock_action_instance = MagicMock()
-    mock_update_action.return_value = mock_action_instance
-
     mock_checkpoint_instance = MagicMock()
     mock_checkpoint.return_value = mock_checkpoint_instance
 
     mock_context.checkpoints = MagicMock()
+    mock_context.checkpoints.get.side_effect = DataContextError("missing")
     mock_context.checkpoints.add_or_update = MagicMock(
         return_value=mock_checkpoint_instance
     )
@@ -200,19 +228,18 @@ def test_create_checkpoint(
     result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
     result.context = mock_context
 
+    result.suite = MagicMock(expectations=[])
+
     result_check = result.create_checkpoint(
         mock_validation_definition, mock_config.SITE_NAME
     )
 
     # Asserts
-    mock_update_action.assert_called_once_with(
-        name="update_my_site", site_names=[mock_config.SITE_NAME]
-    )
     mock_checkpoint.assert_called_once_with(
         name="checkpoint",
         validation_definitions=[mock_validation_definition],
-        actions=[mock_action_instance],
-        result_format="COMPLETE",
+        actions=[],
+        result_format={"result_format": "SUMMARY", "partial_unexpected_count": 20},
     )
     mock_context.checkpoints.add_or_update.assert_called_once_with(
         mock_checkpoint_instance
@@ -231,7 +258,10 @@ def test_run_checkpoint(
     mock_validation_definition = MagicMock()
 
     mock_checkpoint_instance = MagicMock()
-    mock_checkpoint_instance.run.return_value = {"success": True}
+    mock_run_result = MagicMock(
+        success=True, run_results={"validation_id": MagicMock(results=[])}
+    )
+    mock_checkpoint_instance.run.return_value = mock_run_result
 
     mock_checkpoint.return_value = mock_checkpoint_instance
     mock_context.create_validation_definition = MagicMock(
@@ -252,9 +282,134 @@ def test_run_checkpoint(
     # Asserts
     result.create_validation_definition.assert_called_once()
     result.create_checkpoint.assert_called_once_with(
-        mock_validation_definition, mock_config.SITE_NAME
+        mock_validation_definition, mock_config.SITE_NAME, None
+    )
+    mock_context.validation_results_store.set.assert_not_called()
+    assert checkpoint_result is mock_run_result
+    assert result.docs.resource_identifiers == ["validation_id"]
+
+
+@patch("great_expectations.checkpoint.checkpoint.Checkpoint")
+def test_create_checkpoint_result_format(
+    mock_checkpoint, mock_get_context, mock_config
+):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    own_format = {"result_format": "COMPLETE", "partial_unexpected_count": 500}
+    mock_context.checkpoints.get.side_effect = DataContextError("missing")
+
+    # Call function
+    result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
+    result.context = mock_context
+    result.suite = MagicMock(
+        expectations=[
+            gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"),
+            gxe.ExpectColumnValuesToNotBeNull(
+                column="passenger_count", result_format=own_format
+            ),
+        ]
     )
-    assert checkpoint_result == {"success": True}
+    result.create_checkpoint(MagicMock(), mock_config.SITE_NAME, "BASIC")
+
+    # Asserts
+    assert mock_checkpoint.call_args.kwargs["result_format"] == {
+        "result_format": "SUMMARY",
+        "partial_unexpected_count": 20,
+    }
+
+
+def test_run_checkpoint_bounds_results(mock_get_context, mock_config):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    expectation = gxe.ExpectColumnValuesToNotBeNull(column="vendor_id")
+    expectation_result = ExpectationValidationResult(
+        success=False,
+        expectation_config=expectation.configuration,
+        result={
+            "unexpected_count": 2,
+            "partial_unexpected_list": [None, None],
+            "partial_unexpected_counts": [{"value": None, "count": 2}],
+            "partial_unexpected_index_list": [3, 7],
+        },
+    )
+    suite_result = MagicMock(results=[expectation_result])
+    mock_checkpoint = MagicMock()
+    mock_checkpoint.run.return_value = MagicMock(
+        run_results={"validation_id": suite_result}
+    )
+
+    # Call function
+    result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
+    result.context = mock_context
+    result.create_validation_definition = MagicMock()
+    result.create_checkpoint = MagicMock(return_value=mock_checkpoint)
+    result.run_checkpoint(mock_config.SITE_NAME, result_format="BASIC")
+
+    # Asserts
+    assert expectation_result.result == {
+        "unexpected_count": 2,
+        "partial_unexpected_list": [None, None],
+    }
+    mock_context.validation_results_store.set.assert_called_once_with(
+        "validation_id", suite_result
+    )
+
+
+@patch("great_expectations.checkpoint.checkpoint.CheckpointResult")
+def test_run_partitioned(mock_checkpoint_result, mock_get_context, mock_config):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    partitions = [
+        {"year": 2019, "month": 1, "day": 1},
+        {"year": 2019, "month": 1, "day": 2},
+    ]
+    suite_results = [
+        ExpectationSuiteValidationResult(
+            success=success, results=[], suite_name="mock_suite", batch_id=batch_id
+        )
+        for success, batch_id in [(True, "day_1"), (False, "day_2")]
+    ]
+    mock_checkpoint_result.side_effect = lambda **kwargs: MagicMock(**kwargs)
+
+    # Call function
+    result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
+    result.context = mock_context
+    result.suite = MagicMock()
+    result.suite.name = "mock_suite"
+    result.batch_definition = MagicMock()
+    result.batch_definition.get_batch_identifiers_list.return_value = partitions
+    result.create_validation_definition = MagicMock()
+    validation_definition = result.create_validation_definition.return_value
+    validation_definition.run.side_effect = lambda **kwargs: suite_results[
+        partitions.index(kwargs["batch_parameters"])
+    ]
+    result.create_checkpoint = MagicMock()
+    checkpoint_result = result.run_partitioned(mock_config.SITE_NAME, workers=2)
+
+    # Asserts
+    run_results = checkpoint_result.run_results
+    assert [key.batch_identifier for key in run_results] == ["day_1", "day_2"]
+    assert list(run_results.values()) == suite_results
+    run_ids = {
+        call.kwargs["run_id"] for call in validation_definition.run.call_args_list
+    }
+    assert run_ids == {checkpoint_result.run_id}
+    assert checkpoint_result.run_id.run_name == "partitioned"
+    assert checkpoint_result.checkpoint_config is result.create_checkpoint.return_value
+    assert len(result.docs.resource_identifiers) == 2
+
+
+def test_run_partitioned_without_partitions(mock_get_context, mock_config):
+    # Call function
+    result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
+    result.batch_definition = MagicMock()
+    result.batch_definition.get_batch_identifiers_list.return_value = []
+    result.create_validation_definition = MagicMock()
+    result.create_checkpoint = MagicMock()
+
+    # Asserts
+    with pytest.raises(ValueError, match="has no partitions"):
+        result.run_partitioned(mock_config.SITE_NAME)
 
 
 def test_generate_data_docs(mock_get_context, mock_config):
@@ -264,11 +419,15 @@ def test_generate_data_docs(mock_get_context, mock_config):
     # Call function
     result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
     result.context = mock_get_context
+    result.docs.context = mock_get_context
+    result.docs.suite_changed(mock_config.SUITE_NAME.value)
+    result.generate_data_docs(site_name=mock_config.SITE_NAME)
     result.generate_data_docs(site_name=mock_config.SITE_NAME)
 
     # Asserts
     mock_context.build_data_docs.assert_called_once_with(
-        site_names=mock_config.SITE_NAME
+        site_names=[mock_config.SITE_NAME],
+        resource_identifiers=[ExpectationSuiteIdentifier(mock_config.SUITE_NAME.value)],
     )
 
 
@@ -283,3 +442,98 @@ def test_open_report(mock_get_context, mock_config):
 
     # Asserts
     mock_context.open_data_docs.assert_called_once()
+
+
+@patch("src.great_expectations_checker.base_checker.model_fingerprint")
+@patch("great_expectations.core.validation_definition.ValidationDefinition")
+def test_create_validation_definition_unchanged(
+    mock_validation_definition, mock_model_fingerprint, mock_get_context, mock_config
+):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    mock_model_fingerprint.return_value = "same"
+
+    # Call function
+    result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
+    check_result = result.create_validation_definition()
+
+    # Asserts
+    mock_context.validation_definitions.get.assert_called_once_with(
+        mock_validation_definition.return_value.name
+    )
+    mock_context.validation_definitions.add_or_update.assert_not_called()
+    assert check_result is mock_context.validation_definitions.get.return_value
+
+
+@patch("src.great_expectations_checker.base_checker.model_fingerprint")
+@patch("great_expectations.checkpoint.checkpoint.Checkpoint")
+def test_create_checkpoint_changed(
+    mock_checkpoint, mock_model_fingerprint, mock_get_context, mock_config
+):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    mock_model_fingerprint.side_effect = ["stored", "candidate"]
+
+    # Call function
+    result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
+    result.suite = MagicMock(expectations=[])
+    check_result = result.create_checkpoint(MagicMock(), mock_config.SITE_NAME)
+
+    # Asserts
+    mock_context.checkpoints.add_or_update.assert_called_once_with(
+        mock_checkpoint.return_value
+    )
+    assert check_result is mock_context.checkpoints.add_or_update.return_value
+
+
+@patch("great_expectations.checkpoint.checkpoint.Checkpoint")
+def test_create_checkpoint_missing(mock_checkpoint, mock_get_context, mock_config):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    mock_context.checkpoints.get.side_effect = DataContextError("Checkpoint not found")
+
+    # Call function
+    result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
+    result.suite = MagicMock(expectations=[])
+    result.create_checkpoint(MagicMock(), mock_config.SITE_NAME)
+
+    # Asserts
+    mock_context.checkpoints.add_or_update.assert_called_once()
+
+
+def test_set_expectations_unchanged(mock_get_context, mock_config):
+    # Mocks
+    mock_suite = MagicMock()
+    mock_suite.expectations = [
+        gxe.ExpectColumnValuesToNotBeNull(column="vendor_id", id="mock-id")
+    ]
+
+    # Call function
+    result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
+    result.suite = mock_suite
+    result._update_suite = MagicMock()
+    result._set_expectations([gxe.ExpectColumnValuesToNotBeNull(column="vendor_id")])
+
+    # Asserts
+    result._update_suite.assert_not_called()
+    assert mock_suite.expectations[0].id == "mock-id"
+    assert result.docs.resource_identifiers == []
+
+
+def test_set_expectations_changed(mock_get_context, mock_config):
+    # Mocks
+    mock_suite = MagicMock()
+    mock_suite.expectations = [
+        gxe.ExpectColumnValuesToNotBeNull(column="vendor_id", id="mock-id")
+    ]
+    expectations = [gxe.ExpectColumnValuesToNotBeNull(column="passenger_count")]
+
+    # Call function
+    result = GreatExpectationsChecker(mock_config.CONTEXT_MODE)
+    result.suite = mock_suite
+    result._update_suite = MagicMock()
+    result._set_expectations(expectations)
+
+    # Asserts
+    result._update_suite.assert_called_once()
+    assert mock_suite.expectations == expectations
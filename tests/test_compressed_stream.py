@@ -0,0 +1,104 @@
+import io
+import gzip
+import pytest
+import pyarrow as pa
+
+from src.utils.compressed_stream import (
+    DecompressingStream,
+    MeteredStream,
+    detect_compression,
+)
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.CompressedOutputStream(sink, codec) as stream:
+        stream.write(data)
+    return sink.getvalue().to_pybytes()
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("yellow_tripdata_2019-01.csv.gz", "gzip"),
+        ("https://mock.test/yellow_tripdata_2019-01.csv.zst?token=1", "zstd"),
+        ("yellow_tripdata_2019-01.csv.BZ2", "bz2"),
+        ("yellow_tripdata_2019-01.csv", None),
+    ],
+)
+def test_detect_compression_extension(name, expected):
+    # Call function
+    result = detect_compression(name)
+
+    # Asserts
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "head, expected",
+    [
+        (b"\x1f\x8b\x08\x00", "gzip"),
+        (b"\x28\xb5\x2f\xfd", "zstd"),
+        (b"BZh9", "bz2"),
+        (b"vend", None),
+    ],
+)
+def test_detect_compression_magic_bytes(head, expected):
+    # Call function
+    result = detect_compression("download", head)
+
+    # Asserts
+    assert result == expected
+
+
+def test_metered_stream_prefix():
+    # Call function
+    stream = MeteredStream(io.BytesIO(b"cdef"), prefix=b"ab")
+    result = stream.read()
+
+    # Asserts
+    assert result == b"abcdef"
+    assert stream.bytes_read == 6
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd", "bz2"])
+def test_decompressing_stream(codec):
+    # Parameters
+    data = b"vendor_id,total_amount\n" + b"1,10.5\n" * 1000
+    compressed = compress(data, codec)
+
+    # Call function
+    stream = DecompressingStream(io.BytesIO(compressed), "no_extension")
+    with stream as decompressed:
+        result = decompressed.read()
+
+    # Asserts
+    assert stream.codec == codec
+    assert result == data
+    assert stream.throughput["compressed_bytes"] == len(compressed)
+    assert stream.throughput["uncompressed_bytes"] == len(data)
+    assert stream.throughput["uncompressed_mb_per_s"] > 0
+
+
+def test_decompressing_stream_plain():
+    # Call function
+    stream = DecompressingStream(io.BytesIO(b"vendor_id\n1\n"), "data.csv")
+    with stream as decompressed:
+        result = decompressed.read()
+
+    # Asserts
+    assert stream.codec is None
+    assert result == b"vendor_id\n1\n"
+    assert stream.throughput["compressed_bytes"] == len(result)
+
+
+def test_decompressing_stream_python_gzip():
+    # Parameters
+    data = b"vendor_id\n" + b"2\n" * 100
+
+    # Call function
+    with DecompressingStream(io.BytesIO(gzip.compress(data)), "f.gz") as stream:
+        result = stream.read()
+
+    # Asserts
+    assert result == data
@@ -0,0 +1,111 @@
+import os
+import pytest
+
+from unittest.mock import patch, MagicMock
+from src.great_expectations_checker.context_cache import ContextCache
+
+
+@pytest.fixture(autouse=True)
+def mock_config_dir(tmp_path):
+    (tmp_path / "expectations").mkdir()
+    (tmp_path / "great_expectations.yml").write_text("config_version: 4.0\n")
+    with patch.object(ContextCache, "config_dir", tmp_path):
+        yield tmp_path
+    ContextCache.clear()
+
+
+@pytest.fixture
+def mock_get_context():
+    with patch(
+        "src.great_expectations_checker.context_cache.gx.get_context",
+        side_effect=lambda mode: MagicMock(),
+    ) as mock_get_context:
+        yield mock_get_context
+
+
+def touch(path, content):
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_get_context_is_shared(mock_get_context):
+    # Call function
+    result = ContextCache.get_context("file")
+    other = ContextCache.get_context("file")
+
+    # Asserts
+    assert result is other
+    mock_get_context.assert_called_once_with(mode="file")
+
+
+def test_get_context_per_mode(mock_get_context):
+    # Call function
+    result = ContextCache.get_context("file")
+    other = ContextCache.get_context("ephemeral")
+
+    # Asserts
+    assert result is not other
+
+
+def test_put_get(mock_get_context):
+    # Mocks
+    ContextCache.get_context("file")
+    mock_suite = MagicMock()
+
+    # Call function
+    ContextCache.put("file", ("suite", "mock_suite"), mock_suite)
+
+    # Asserts
+    assert ContextCache.get("file", ("suite", "mock_suite")) is mock_suite
+    assert ContextCache.get("file", ("suite", "other")) is None
+    assert ContextCache.get("ephemeral", ("suite", "mock_suite")) is None
+
+
+def test_config_change_invalidates(mock_get_context, mock_config_dir):
+    # Mocks
+    result = ContextCache.get_context("file")
+    ContextCache.put("file", ("suite", "mock_suite"), MagicMock())
+
+    # Call function
+    touch(mock_config_dir / "expectations" / "mock_suite.json", "{}")
+    other = ContextCache.get_context("file")
+
+    # Asserts
+    assert other is not result
+    assert ContextCache.get("file", ("suite", "mock_suite")) is None
+    assert mock_get_context.call_count == 2
+
+
+def test_uncommitted_ignored(mock_get_context, mock_config_dir):
+    # Mocks
+    result = ContextCache.get_context("file")
+
+    # Call function
+    (mock_config_dir / "uncommitted" / "validations").mkdir(parents=True)
+    touch(mock_config_dir / "uncommitted" / "validations" / "result.json", "{}")
+
+    # Asserts
+    assert ContextCache.get_context("file") is result
+
+
+def test_mark_clean(mock_get_context, mock_config_dir):
+    # Mocks
+    result = ContextCache.get_context("file")
+
+    # Call function
+    touch(mock_config_dir / "great_expectations.yml", "config_version: 4.0\n# x\n")
+    ContextCache.mark_clean("file")
+
+    # Asserts
+    assert ContextCache.get_context("file") is result
+    mock_get_context.assert_called_once()
+
+
+def test_fingerprint_missing_dir(tmp_path):
+    # Call function
+    with patch.object(ContextCache, "config_dir", tmp_path / "missing"):
+        result = ContextCache.fingerprint()
+
+    # Asserts
+    assert result == ()
@@ -0,0 +1,216 @@
+import os
+import time
+import hashlib
+import pytest
+import pandas as pd
+
+from unittest.mock import MagicMock, patch
+from src.utils.data_cache import ParquetDataCache
+
+
+@pytest.fixture
+def mock_df():
+    data = {
+        "vendor_id": [1, 2, 1],
+        "pickup_datetime": pd.to_datetime(
+            ["2025-01-01 08:00:00", "2025-01-01 09:00:00", "2025-01-01 10:00:00"]
+        ),
+        "total_amount": [10.5, 20.0, 7.25],
+    }
+    return pd.DataFrame(data)
+
+
+@pytest.fixture
+def mock_cache(tmp_path):
+    return ParquetDataCache(cache_dir=str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def mock_csv_file(tmp_path, mock_df):
+    csv_path = tmp_path / "mock_taxi_data.csv"
+    mock_df.to_csv(csv_path, index=False)
+    return csv_path
+
+
+@pytest.mark.parametrize("max_bytes, max_age", [(0, 10), (10, 0), (-1, -1)])
+def test_not_initilized(tmp_path, max_bytes, max_age):
+    # Call function
+    with pytest.raises(ValueError, match="Cache limits must be positive"):
+        ParquetDataCache(str(tmp_path), max_bytes=max_bytes, max_age_seconds=max_age)
+
+
+def test_fingerprint_local_file_changes_with_content(mock_cache, mock_csv_file):
+    # Call function
+    first_key = mock_cache.fingerprint(str(mock_csv_file))
+    same_key = mock_cache.fingerprint(str(mock_csv_file))
+    mock_csv_file.write_text("vendor_id\n3\n")
+    new_key = mock_cache.fingerprint(str(mock_csv_file))
+
+    # Asserts
+    assert first_key == same_key
+    assert first_key != new_key
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"ETag": '"abc"'}, 'etag:"abc"'),
+        (
+            {"Last-Modified": "Mon, 03 Feb 2025", "Content-Length": "10"},
+            "last-modified:Mon, 03 Feb 2025:10",
+        ),
+    ],
+)
+@patch("src.utils.data_cache.urllib.request.urlopen")
+def test_source_validator_remote_headers(mock_urlopen, mock_cache, headers, expected):
+    # Mocks
+    mock_response = MagicMock()
+    mock_response.headers = headers
+    mock_urlopen.return_value.__enter__.return_value = mock_response
+
+    # Call function
+    result = mock_cache._source_validator("https://mock.test/data.csv")
+
+    # Asserts
+    assert result == expected
+    mock_urlopen.assert_called_once()
+
+
+def test_fingerprint_local_file_hashed_once(mock_cache, mock_csv_file):
+    # Call function
+    with patch.object(
+        ParquetDataCache, "_hash_stream", side_effect=ParquetDataCache._hash_stream
+    ) as mock_hash_stream:
+        first_key = mock_cache.fingerprint(str(mock_csv_file))
+        same_key = mock_cache.fingerprint(str(mock_csv_file))
+        os.utime(mock_csv_file, ns=(0, 0))
+        touched_key = mock_cache.fingerprint(str(mock_csv_file))
+
+    # Asserts
+    assert first_key == same_key == touched_key
+    assert mock_hash_stream.call_count == 2
+
+
+@patch("src.utils.data_cache.urllib.request.urlopen")
+def test_source_validator_remote_content(mock_urlopen, mock_cache):
+    # Mocks
+    content = b"vendor_id\n1\n"
+    head_response = MagicMock(headers={})
+    get_response = MagicMock()
+    get_response.read.side_effect = [content, b""]
+    mock_urlopen.return_value.__enter__.side_effect = [head_response, get_response]
+
+    # Call function
+    result = mock_cache._source_validator("https://mock.test/data.csv?month=1")
+    local_copy = mock_cache.local_copy("https://mock.test/data.csv?month=1")
+
+    # Asserts
+    assert result == f"sha256:{hashlib.sha256(content).hexdigest()}"
+    assert mock_urlopen.call_count == 2
+    assert local_copy.endswith("_data.csv")
+    with open(local_copy, "rb") as copy:
+        assert copy.read() == content
+    assert mock_cache.local_copy("https://mock.test/other.csv") is None
+
+
+def test_put_and_read(mock_cache, mock_df):
+    # Call function
+    mock_cache.put("mock_key", mock_df)
+
+    # Asserts
+    assert mock_cache.contains("mock_key")
+    assert not mock_cache.contains("missing_key")
+    pd.testing.assert_frame_equal(mock_cache.read("mock_key"), mock_df)
+
+
+def test_write_through(mock_cache, mock_df):
+    # Parameters
+    chunks = iter([mock_df.head(2), mock_df.tail(1)])
+
+    # Call function
+    passed = list(mock_cache.write_through("mock_key", chunks))
+    result = list(mock_cache.iter_read("mock_key", chunksize=2))
+
+    # Asserts
+    assert [len(chunk) for chunk in passed] == [2, 1]
+    assert [len(chunk) for chunk in result] == [2, 1]
+    pd.testing.assert_frame_equal(
+        pd.concat(result, ignore_index=True), mock_df, check_dtype=False
+    )
+
+
+def test_write_through_interrupted(mock_cache, mock_df):
+    # Call function
+    chunks = mock_cache.write_through("mock_key", iter([mock_df, mock_df]))
+    next(chunks)
+    chunks.close()
+
+    # Asserts
+    assert not mock_cache.contains("mock_key")
+    assert list(mock_cache.cache_dir.iterdir()) == []
+
+
+def test_evict_by_age(mock_cache, mock_df):
+    # Mocks
+    mock_cache.put("old_key", mock_df)
+    mock_cache.put("new_key", mock_df)
+    old_time = time.time() - mock_cache.max_age_seconds - 1
+    os.utime(mock_cache._path("old_key"), (old_time, old_time))
+
+    # Call function
+    evicted = mock_cache.evict()
+
+    # Asserts
+    assert evicted == [mock_cache._path("old_key")]
+    assert mock_cache.contains("new_key")
+
+
+def test_evict_by_size(mock_cache, mock_df):
+    # Mocks
+    mock_cache.put("first_key", mock_df)
+    mock_cache.max_bytes = mock_cache._path("first_key").stat().st_size
+    past_time = time.time() - 10
+    os.utime(mock_cache._path("first_key"), (past_time, past_time))
+
+    # Call function
+    mock_cache.put("second_key", mock_df)
+
+    # Asserts
+    assert not mock_cache.contains("first_key")
+    assert mock_cache.contains("second_key")
+
+
+def test_evict_entry_above_size_limit(mock_cache, mock_df):
+    # Mocks
+    mock_cache.put("first_key", mock_df)
+    mock_cache.max_bytes = 1
+    future_time = time.time() + 10
+    os.utime(mock_cache._path("first_key"), (future_time, future_time))
+
+    # Call function
+    mock_cache.put("second_key", mock_df)
+    passed = list(mock_cache.write_through("third_key", iter([mock_df])))
+
+    # Asserts
+    assert len(passed) == 1
+    assert not mock_cache.contains("first_key")
+    assert not mock_cache.contains("second_key")
+    assert mock_cache.contains("third_key")
+
+
+def test_evict_source_copies(mock_cache):
+    # Mocks
+    sources = mock_cache.cache_dir / "sources"
+    sources.mkdir()
+    old_copy = sources / "old_data.csv"
+    old_copy.write_text("vendor_id\n1\n")
+    (sources / "new_data.csv.part").write_text("vendor_id\n")
+    old_time = time.time() - mock_cache.max_age_seconds - 1
+    os.utime(old_copy, (old_time, old_time))
+
+    # Call function
+    evicted = mock_cache.evict()
+
+    # Asserts
+    assert evicted == [old_copy]
+    assert (sources / "new_data.csv.part").exists()
@@ -0,0 +1,293 @@
+import os
+import json
+import time
+import pytest
+import threading
+import pandas as pd
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.utils.data_downloader import RangedDownloader
+from src.utils.data_extractor import TaxiDataExtractor
+
+
+class MockServerState:
+    content: bytes = b""
+    etag: str = '"v1"'
+    last_modified: str | None = None
+    accept_ranges: bool = True
+    fail_ranges: set = set()
+    requested_ranges: list = []
+    if_ranges: list = []
+
+
+class MockRangeHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _send_headers(self, status, length, extra=None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        self.send_header("ETag", MockServerState.etag)
+        if MockServerState.last_modified:
+            self.send_header("Last-Modified", MockServerState.last_modified)
+        if MockServerState.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        for key, value in (extra or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._send_headers(200, len(MockServerState.content))
+
+    def do_GET(self):
+        content = MockServerState.content
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        MockServerState.if_ranges.append(if_range)
+        # A weak or outdated `If-Range` validator gets the whole file (RFC 9110).
+        stale = if_range is not None and (
+            if_range.startswith("W/")
+            or if_range not in (MockServerState.etag, MockServerState.last_modified)
+        )
+        if not range_header or not MockServerState.accept_ranges or stale:
+            self._send_headers(200, len(content))
+            self.wfile.write(content)
+            return
+
+        start, end = (int(value) for value in range_header[6:].split("-"))
+        MockServerState.requested_ranges.append(start)
+        if start in MockServerState.fail_ranges:
+            self.send_error(500)
+            return
+
+        body = content[start : end + 1]
+        self._send_headers(
+            206, len(body), {"Content-Range": f"bytes {start}-{end}/{len(content)}"}
+        )
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def mock_server():
+    MockServerState.content = b"".join(
+        f"{i},2019-01-05 06:{i % 60:02d}:00\n".encode() for i in range(500)
+    )
+    MockServerState.content = b"vendor_id,pickup_datetime\n" + MockServerState.content
+    MockServerState.etag = '"v1"'
+    MockServerState.last_modified = None
+    MockServerState.accept_ranges = True
+    MockServerState.fail_ranges = set()
+    MockServerState.requested_ranges = []
+    MockServerState.if_ranges = []
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockRangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/yellow_tripdata_2019-01.csv"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def mock_downloader(tmp_path):
+    return RangedDownloader(str(tmp_path), part_size=1024, workers=3, retries=2)
+
+
+@pytest.mark.parametrize("limits", [{"part_size": 0}, {"workers": 0}, {"retries": -1}])
+def test_not_initilized(tmp_path, limits):
+    # Call function
+    with pytest.raises(
+        ValueError, match="Part size, workers and retries must be positive"
+    ):
+        RangedDownloader(str(tmp_path), **limits)
+
+
+@pytest.mark.parametrize("limits", [{"max_bytes": 0}, {"max_age_seconds": -1}])
+def test_not_initilized_download_limits(tmp_path, limits):
+    # Call function
+    with pytest.raises(ValueError, match="Download limits must be positive"):
+        RangedDownloader(str(tmp_path), **limits)
+
+
+def test_download(mock_server, mock_downloader):
+    # Call function
+    result = mock_downloader.download(mock_server)
+
+    # Asserts
+    target = mock_downloader._target(mock_server)
+    assert result == str(target)
+    assert target.name.endswith("_yellow_tripdata_2019-01.csv")
+    assert open(result, "rb").read() == MockServerState.content
+    assert len(MockServerState.requested_ranges) == -(
+        -len(MockServerState.content) // 1024
+    )
+    assert not target.with_name(f"{target.name}.part").exists()
+
+
+def test_download_resumes_after_failure(mock_server, mock_downloader):
+    # Mocks
+    MockServerState.fail_ranges = {2048}
+
+    # Call function
+    with pytest.raises(IOError, match="Part 2"):
+        mock_downloader.download(mock_server)
+
+    target = mock_downloader._target(mock_server)
+    manifest_path = target.with_name(f"{target.name}.parts.json")
+    completed_parts = set(json.loads(manifest_path.read_text())["parts"])
+
+    MockServerState.fail_ranges = set()
+    MockServerState.requested_ranges = []
+    result = mock_downloader.download(mock_server)
+
+    # Asserts
+    assert "2" not in completed_parts
+    assert open(result, "rb").read() == MockServerState.content
+    assert 2048 in MockServerState.requested_ranges
+    assert not any(
+        int(index) * 1024 in MockServerState.requested_ranges
+        for index in completed_parts
+    )
+
+
+@pytest.mark.parametrize(
+    "last_modified, resumed",
+    [("Sat, 05 Jan 2019 06:00:00 GMT", True), (None, False)],
+)
+def test_download_weak_etag(mock_server, mock_downloader, last_modified, resumed):
+    # Mocks
+    MockServerState.etag = 'W/"v1"'
+    MockServerState.last_modified = last_modified
+    MockServerState.fail_ranges = {2048}
+    with pytest.raises(IOError, match="Part 2"):
+        mock_downloader.download(mock_server)
+
+    MockServerState.fail_ranges = set()
+    MockServerState.requested_ranges = []
+    MockServerState.if_ranges = []
+
+    # Call function
+    result = mock_downloader.download(mock_server)
+
+    # Asserts
+    part_count = -(-len(MockServerState.content) // 1024)
+    assert open(result, "rb").read() == MockServerState.content
+    assert set(MockServerState.if_ranges) == {last_modified}
+    assert (len(MockServerState.requested_ranges) < part_count) == resumed
+
+
+def test_download_refetches_corrupted_part(mock_server, mock_downloader):
+    # Mocks
+    MockServerState.fail_ranges = {0}
+    with pytest.raises(IOError):
+        mock_downloader.download(mock_server)
+
+    target = mock_downloader._target(mock_server)
+    partial = target.with_name(f"{target.name}.part")
+    with open(partial, "r+b") as file:
+        file.seek(1024)
+        file.write(b"corrupted")
+
+    # Call function
+    MockServerState.fail_ranges = set()
+    MockServerState.requested_ranges = []
+    result = mock_downloader.download(mock_server)
+
+    # Asserts
+    assert open(result, "rb").read() == MockServerState.content
+    assert sorted(MockServerState.requested_ranges)[:2] == [0, 1024]
+
+
+def test_download_restarts_when_remote_changes(mock_server, mock_downloader):
+    # Mocks
+    MockServerState.fail_ranges = {0}
+    with pytest.raises(IOError):
+        mock_downloader.download(mock_server)
+
+    # Call function
+    MockServerState.fail_ranges = set()
+    MockServerState.etag = '"v2"'
+    MockServerState.requested_ranges = []
+    mock_downloader.download(mock_server)
+
+    # Asserts
+    assert len(MockServerState.requested_ranges) == -(
+        -len(MockServerState.content) // 1024
+    )
+
+
+def test_download_complete_is_reused(mock_server, mock_downloader):
+    # Call function
+    mock_downloader.download(mock_server)
+    MockServerState.requested_ranges = []
+    mock_downloader.download(mock_server)
+
+    # Asserts
+    assert MockServerState.requested_ranges == []
+
+
+def test_download_without_range_support(mock_server, mock_downloader):
+    # Mocks
+    MockServerState.accept_ranges = False
+
+    # Call function
+    result = mock_downloader.download(mock_server)
+
+    # Asserts
+    assert open(result, "rb").read() == MockServerState.content
+    assert MockServerState.requested_ranges == []
+
+
+def test_extractor_streams_downloaded_file(mock_server, mock_downloader):
+    # Call function
+    extractor = TaxiDataExtractor(
+        mock_server,
+        schema={"vendor_id": "Int16", "pickup_datetime": "datetime64[ns]"},
+        downloader=mock_downloader,
+    )
+    chunks = list(extractor.iter_chunks(chunksize=200))
+
+    # Asserts
+    assert [len(chunk) for chunk in chunks] == [200, 200, 100]
+    assert pd.api.types.is_datetime64_any_dtype(chunks[0]["pickup_datetime"])
+
+
+def test_download_urls_with_same_name(mock_server, mock_downloader):
+    # Call function
+    first = mock_downloader.download(mock_server)
+    second = mock_downloader.download(f"{mock_server}?month=2")
+
+    # Asserts
+    assert first != second
+    assert open(first, "rb").read() == open(second, "rb").read()
+
+
+def test_evict(mock_downloader, tmp_path):
+    # Mocks
+    mock_downloader.max_bytes = 40
+    old = tmp_path / "old_data.csv"
+    old.write_bytes(b"x" * 10)
+    (tmp_path / "old_data.csv.parts.json").write_text("{}")
+    stale = tmp_path / "stale_data.csv.part"
+    stale.write_bytes(b"x" * 10)
+    (tmp_path / "stale_data.csv.parts.json").write_text("{}")
+    kept = tmp_path / "kept_data.csv"
+    kept.write_bytes(b"x" * 30)
+    large = tmp_path / "large_data.csv"
+    large.write_bytes(b"x" * 30)
+    recent = tmp_path / "recent_data.csv"
+    recent.write_bytes(b"x" * 5)
+    old_time = time.time() - mock_downloader.max_age_seconds - 1
+    for path in (old, stale, kept):
+        os.utime(path, (old_time, old_time))
+    os.utime(large, (time.time() - 10, time.time() - 10))
+
+    # Call function
+    evicted = mock_downloader.evict(keep=kept)
+
+    # Asserts
+    assert evicted == [old, stale, large]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "kept_data.csv",
+        "recent_data.csv",
+    ]
@@ -1,8 +1,11 @@
 import pytest
 import pandas as pd
+import pyarrow as pa
 
+from contextlib import nullcontext
 from unittest.mock import MagicMock, patch
 from src.utils.data_extractor import TaxiDataExtractor
+from src.utils.data_cache import ParquetDataCache
 
 
 @pytest.fixture
@@ -19,6 +22,13 @@ def mock_taxi_data_loader():
     return TaxiDataExtractor("https://mock.test")
 
 
+@pytest.fixture
+def mock_open_source(monkeypatch):
+    monkeypatch.setattr(
+        TaxiDataExtractor, "_open_source", lambda self: nullcontext(self.url)
+    )
+
+
 def test_initilization(mock_taxi_data_loader):
     # Asserts
     assert mock_taxi_data_loader.url == "https://mock.test"
@@ -32,7 +42,9 @@ def test_not_initilized(url):
         TaxiDataExtractor(url)
 
 
-def test_load_data_success(mock_taxi_data_loader, mock_csv_data, monkeypatch):
+def test_load_data_success(
+    mock_taxi_data_loader, mock_open_source, mock_csv_data, monkeypatch
+):
     def mock_read_csv(url):
         return mock_csv_data
 
@@ -68,7 +80,9 @@ def test_load_data_failed(mock_taxi_data_loader, monkeypatch):
 
 
 @patch('src.utils.data_extractor.logger.error')
-def test_load_data_exception(mock_logger_error, mock_taxi_data_loader):
+def test_load_data_exception(
+    mock_logger_error, mock_taxi_data_loader, mock_open_source
+):
 
     # Mocks
     with patch('pandas.read_csv', side_effect=Exception('Test exception')):
@@ -79,7 +93,7 @@ def test_load_data_exception(mock_logger_error, mock_taxi_data_loader):
         assert mock_taxi_data_loader.df is None
 
 
-def test_get_data(mock_taxi_data_loader, mock_csv_data, monkeypatch):
+def test_get_data(mock_taxi_data_loader, mock_open_source, mock_csv_data, monkeypatch):
     def mock_read_csv(url):
         return mock_csv_data
 
@@ -106,3 +120,276 @@ def test_get_data_no_data(mock_taxi_data_loader):
     # Call function
     with pytest.raises(ValueError, match="Data has not been loaded or processed yet."):
         mock_taxi_data_loader.get_data()
+
+
+def test_iter_chunks(tmp_path, mock_csv_data):
+    # Mock value
+    csv_path = tmp_path / "mock_taxi_data.csv"
+    pd.concat([mock_csv_data] * 3).to_csv(csv_path, index=False)
+
+    # Call function
+    extractor = TaxiDataExtractor(str(csv_path))
+    chunks = list(extractor.iter_chunks(chunksize=4))
+
+    # Asserts
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+    for chunk in chunks:
+        assert pd.api.types.is_datetime64_any_dtype(chunk["pickup_datetime"])
+        assert pd.api.types.is_datetime64_any_dtype(chunk["dropoff_datetime"])
+    assert extractor.df is None
+
+
+@pytest.mark.parametrize("chunksize", [0, -1, 1.5, "10", None])
+def test_iter_chunks_invalid_chunksize(mock_taxi_data_loader, chunksize):
+    # Call function
+    with pytest.raises(ValueError, match="Chunk size must be a positive integer"):
+        next(mock_taxi_data_loader.iter_chunks(chunksize=chunksize))
+
+
+@patch("src.utils.data_extractor.logger.error")
+def test_iter_chunks_exception(
+    mock_logger_error, mock_taxi_data_loader, mock_open_source
+):
+    # Mocks
+    with patch("pandas.read_csv", side_effect=Exception("Test exception")):
+        with pytest.raises(Exception, match="Test exception"):
+            next(mock_taxi_data_loader.iter_chunks(chunksize=10))
+
+        # Asserts
+        mock_logger_error.assert_called_with("Error streaming data: Test exception.")
+
+
+def test_load_data_cached(tmp_path, mock_csv_data, monkeypatch):
+    # Mock value
+    csv_path = tmp_path / "mock_taxi_data.csv"
+    mock_csv_data.to_csv(csv_path, index=False)
+    cache = ParquetDataCache(cache_dir=str(tmp_path / "cache"))
+
+    # Call function
+    TaxiDataExtractor(str(csv_path), cache=cache).load_data()
+    monkeypatch.setattr(pd, "read_csv", None)
+    extractor = TaxiDataExtractor(str(csv_path), cache=cache)
+    extractor.load_data()
+
+    # Asserts
+    assert extractor.df is not None
+    assert len(extractor.df) == 2
+    assert pd.api.types.is_datetime64_any_dtype(extractor.df["pickup_datetime"])
+
+
+def test_iter_chunks_cached(tmp_path, mock_csv_data):
+    # Mock value
+    csv_path = tmp_path / "mock_taxi_data.csv"
+    pd.concat([mock_csv_data] * 3).to_csv(csv_path, index=False)
+    cache = ParquetDataCache(cache_dir=str(tmp_path / "cache"))
+
+    # Call function
+    first_run = list(TaxiDataExtractor(str(csv_path), cache=cache).iter_chunks(4))
+    with patch("pandas.read_csv", side_effect=Exception("Not cached")):
+        second_run = list(TaxiDataExtractor(str(csv_path), cache=cache).iter_chunks(4))
+
+    # Asserts
+    assert [len(chunk) for chunk in first_run] == [4, 2]
+    assert [len(chunk) for chunk in second_run] == [4, 2]
+    assert pd.api.types.is_datetime64_any_dtype(second_run[0]["dropoff_datetime"])
+
+
+def test_load_data_cached_remote_copy(tmp_path, mock_csv_data):
+    # Mock value
+    cache = ParquetDataCache(cache_dir=str(tmp_path / "cache"))
+    copy_path = tmp_path / "copy.csv"
+    mock_csv_data.to_csv(copy_path, index=False)
+    cache.copies["https://mock.test/data.csv"] = copy_path
+
+    # Call function
+    extractor = TaxiDataExtractor("https://mock.test/data.csv", cache=cache)
+    with patch.object(cache, "fingerprint", return_value="mock_key"):
+        extractor.load_data()
+
+    # Asserts
+    assert extractor._source() == str(copy_path)
+    assert len(extractor.df) == 2
+
+
+@pytest.fixture
+def mock_typed_csv(tmp_path):
+    csv_path = tmp_path / "mock_typed_taxi_data.csv"
+    csv_path.write_text(
+        "vendor_id,pickup_datetime,store_and_fwd_flag,pickup_location_id,total_amount\n"
+        "1,2019-01-05 06:36:51,N,151,10.5\n"
+        "2,2019-01-05 07:10:00,Y,239,3.25\n"
+        ",2019-01-05 07:45:12,N,236,7.0\n"
+    )
+    return csv_path
+
+
+@pytest.fixture
+def mock_schema():
+    return {
+        "vendor_id": "Int8",
+        "pickup_datetime": "datetime64[ns]",
+        "store_and_fwd_flag": "category",
+        "pickup_location_id": "Int16",
+        "total_amount": "float32",
+    }
+
+
+def test_load_data_typed(mock_typed_csv, mock_schema):
+    # Call function
+    extractor = TaxiDataExtractor(str(mock_typed_csv), schema=mock_schema)
+    extractor.load_data()
+    result = extractor.get_data()
+
+    # Asserts
+    assert {col: str(dtype) for col, dtype in result.dtypes.items()} == mock_schema
+    assert result["vendor_id"].isna().sum() == 1
+    assert result["pickup_datetime"][0] == pd.Timestamp("2019-01-05 06:36:51")
+    assert extractor.memory_report["typed_bytes"] > 0
+    assert extractor.memory_report["saved_bytes"] == (
+        extractor.memory_report["default_bytes"]
+        - extractor.memory_report["typed_bytes"]
+    )
+
+
+def test_iter_chunks_typed(mock_typed_csv, mock_schema):
+    # Call function
+    extractor = TaxiDataExtractor(str(mock_typed_csv), schema=mock_schema)
+    chunks = list(extractor.iter_chunks(chunksize=2))
+
+    # Asserts
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    for chunk in chunks:
+        assert {col: str(dtype) for col, dtype in chunk.dtypes.items()} == mock_schema
+    assert extractor.memory_report["default_bytes"] == sum(
+        8 * len(chunk) * 4
+        + chunk["store_and_fwd_flag"]
+        .astype(object)
+        .memory_usage(deep=True, index=False)
+        for chunk in chunks
+    )
+
+
+@patch("src.utils.data_extractor.logger.error")
+def test_load_data_typed_schema_mismatch(mock_logger_error, tmp_path, mock_schema):
+    # Mock value
+    csv_path = tmp_path / "mock_bad_taxi_data.csv"
+    csv_path.write_text("vendor_id,pickup_datetime\nabc,2019-01-05 06:36:51\n")
+
+    # Call function
+    extractor = TaxiDataExtractor(str(csv_path), schema={"vendor_id": "Int8"})
+    extractor.load_data()
+
+    # Asserts
+    assert extractor.df is None
+    mock_logger_error.assert_called_once()
+
+
+def test_read_source(tmp_path, mock_typed_csv, mock_schema, mock_csv_data):
+    # Mocks
+    csv_path = tmp_path / "mock_taxi_data.csv"
+    mock_csv_data.to_csv(csv_path, index=False)
+
+    # Call function
+    typed = TaxiDataExtractor(str(mock_typed_csv), schema=mock_schema).read_source()
+    untyped = TaxiDataExtractor(str(csv_path)).read_source()
+
+    # Asserts
+    assert {col: str(dtype) for col, dtype in typed.dtypes.items()} == mock_schema
+    assert (untyped.dtypes == "datetime64[ns]").all()
+
+
+def test_read_source_error(tmp_path):
+    # Mocks
+    csv_path = tmp_path / "mock_bad_taxi_data.csv"
+    csv_path.write_text("vendor_id\n1\n")
+
+    # Call function
+    extractor = TaxiDataExtractor(str(csv_path))
+
+    # Asserts
+    with pytest.raises(KeyError, match="pickup_datetime"):
+        extractor.read_source()
+
+
+@pytest.mark.parametrize(
+    "codec, suffix", [("gzip", ".csv.gz"), ("zstd", ".csv.zst"), ("zstd", "")]
+)
+def test_iter_chunks_compressed(tmp_path, mock_typed_csv, mock_schema, codec, suffix):
+    # Mock value
+    sink = pa.BufferOutputStream()
+    with pa.CompressedOutputStream(sink, codec) as stream:
+        stream.write(mock_typed_csv.read_bytes())
+    compressed_path = tmp_path / f"mock_compressed_taxi_data{suffix}"
+    compressed_path.write_bytes(sink.getvalue().to_pybytes())
+
+    # Call function
+    extractor = TaxiDataExtractor(str(compressed_path), schema=mock_schema)
+    chunks = list(extractor.iter_chunks(chunksize=2))
+
+    # Asserts
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert extractor.throughput_report["codec"] == codec
+    assert extractor.throughput_report["uncompressed_bytes"] == len(
+        mock_typed_csv.read_bytes()
+    )
+    assert sorted(tmp_path.iterdir()) == sorted([mock_typed_csv, compressed_path])
+
+
+@pytest.mark.parametrize("codec, suffix", [("gzip", ".csv.gz"), ("zstd", "")])
+def test_untyped_compressed(tmp_path, mock_csv_data, codec, suffix):
+    # Mock value
+    sink = pa.BufferOutputStream()
+    with pa.CompressedOutputStream(sink, codec) as stream:
+        stream.write(mock_csv_data.to_csv(index=False).encode())
+    compressed_path = tmp_path / f"mock_compressed_taxi_data{suffix}"
+    compressed_path.write_bytes(sink.getvalue().to_pybytes())
+
+    # Call function
+    extractor = TaxiDataExtractor(str(compressed_path))
+    chunks = list(extractor.iter_chunks(chunksize=1))
+    streamed = extractor.throughput_report
+    extractor.load_data()
+
+    # Asserts
+    assert [len(chunk) for chunk in chunks] == [1, 1]
+    assert pd.api.types.is_datetime64_any_dtype(extractor.df["pickup_datetime"])
+    assert len(extractor.df) == 2
+    assert streamed["codec"] == extractor.throughput_report["codec"] == codec
+
+
+def test_iter_chunks_watermark(mock_typed_csv, mock_schema):
+    # Call function
+    extractor = TaxiDataExtractor(
+        str(mock_typed_csv),
+        schema=mock_schema,
+        watermark=pd.Timestamp("2019-01-05 07:10:00"),
+    )
+    chunks = list(extractor.iter_chunks(chunksize=2))
+
+    # Asserts
+    assert [len(chunk) for chunk in chunks] == [1]
+    assert chunks[0]["pickup_datetime"].iloc[0] == pd.Timestamp("2019-01-05 07:45:12")
+    assert extractor.skipped_rows == 2
+
+
+def test_load_data_watermark_keeps_missing_timestamps(
+    mock_taxi_data_loader, mock_open_source, monkeypatch
+):
+    # Mock value
+    mock_data = pd.DataFrame(
+        {
+            "pickup_datetime": ["2025-01-01 08:00:00", None, "2025-01-02 08:00:00"],
+            "dropoff_datetime": ["2025-01-01 08:30:00", None, "2025-01-02 08:30:00"],
+        }
+    )
+    monkeypatch.setattr(pd, "read_csv", lambda url: mock_data)
+    mock_taxi_data_loader.watermark = pd.Timestamp("2025-01-01 08:00:00")
+
+    # Call function
+    mock_taxi_data_loader.load_data()
+    result = mock_taxi_data_loader.get_data()
+
+    # Asserts
+    assert len(result) == 2
+    assert result["pickup_datetime"].isna().sum() == 1
+    assert mock_taxi_data_loader.skipped_rows == 1
@@ -1,9 +1,23 @@
 import os
+import time
+import sqlite3
 import pytest
+import threading
+import numpy as np
 import pandas as pd
+import sqlalchemy as sa
 
-from unittest.mock import MagicMock, patch
-from src.utils.data_loader import DataLoader
+from unittest.mock import ANY, MagicMock, patch
+from src.utils.data_loader import DataLoader, copy_insert, row_hash
+from src.utils.engine_registry import EngineRegistry, get_engine
+from src.utils.load_manifest import LoadManifest, chunk_fingerprint
+from src.config.config import BULK_CHUNK_SIZE
+
+
+@pytest.fixture(autouse=True)
+def reset_engine_registry():
+    yield
+    EngineRegistry.dispose_all()
 
 
 @pytest.fixture
@@ -48,7 +62,9 @@ def test_initilization(
 
     # Asserts
     mock_logger_setup.assert_called_once()
-    mock_create_engine.assert_called_once_with(mock_db_connection_url)
+    mock_create_engine.assert_called_once_with(
+        mock_db_connection_url, poolclass=ANY, **EngineRegistry.pool_options()
+    )
     assert isinstance(result.df, pd.DataFrame)
     assert len(result.df) == 3
     assert result.engine is not None
@@ -65,10 +81,11 @@ def test_not_initilized(mock_logger, df):
     mock_logger.error.assert_any_call("The input value is not a Dataframe.")
 
 
+@patch("src.utils.data_loader.time.perf_counter", side_effect=[0.0, 1.5])
 @patch("pandas.DataFrame.to_sql")
 @patch("builtins.print")
 def test_write_to_sql(
-    mock_print, mock_to_sql, mock_logger, mock_create_engine, mock_df
+    mock_print, mock_to_sql, mock_perf_counter, mock_logger, mock_create_engine, mock_df
 ):
     # Parameters
     table_name = "mock_table_name"
@@ -82,5 +99,571 @@ def test_write_to_sql(
 
     # Asserts
     mock_to_sql.assert_called_once_with(name=table_name, con=mock_engine, index=False)
-    mock_logger.info.assert_called_once_with(f"3 rows written to {table_name}.")
-    mock_print.assert_called_once_with(f"3 rows written to {table_name}.")
+    mock_logger.info.assert_called_once_with(
+        f"3 rows written to {table_name} (2 rows/s)."
+    )
+    mock_print.assert_called_once_with(f"3 rows written to {table_name} (2 rows/s).")
+    assert data_loader.rows_per_second == 2.0
+
+
+@patch("src.utils.data_loader.time.perf_counter", side_effect=[0.0, 2.0])
+@patch("pandas.DataFrame.to_sql")
+@patch("builtins.print")
+def test_write_to_sql_chunks(
+    mock_print, mock_to_sql, mock_perf_counter, mock_logger, mock_create_engine, mock_df
+):
+    # Parameters
+    table_name = "mock_table_name"
+    chunks = iter([mock_df, mock_df.head(1)])
+
+    # Mocks
+    mock_engine = mock_create_engine.return_value
+
+    # Call function
+    data_loader = DataLoader(chunks)
+    data_loader.write_to_sql(table_name=table_name, if_exists="replace", index=False)
+
+    # Asserts
+    assert data_loader.is_chunked
+    assert mock_to_sql.call_count == 2
+    assert mock_to_sql.call_args_list[0].kwargs == {
+        "name": table_name,
+        "con": mock_engine,
+        "if_exists": "replace",
+        "index": False,
+    }
+    assert mock_to_sql.call_args_list[1].kwargs["if_exists"] == "append"
+    mock_logger.info.assert_called_once_with(
+        f"4 rows written to {table_name} (2 rows/s)."
+    )
+    mock_print.assert_called_once_with(f"4 rows written to {table_name} (2 rows/s).")
+
+
+@pytest.fixture
+def mock_sqlite_url(tmp_path):
+    # Parameters
+    mock_connection_string = f"sqlite:///{tmp_path / 'mock.db'}?check_same_thread=false"
+
+    with patch.dict(os.environ, {"CONNECTION_STRING": mock_connection_string}):
+        yield mock_connection_string
+
+
+@patch("pandas.DataFrame.to_sql")
+def test_write_to_sql_bulk_postgres(mock_to_sql, mock_create_engine, mock_df):
+    # Mocks
+    mock_engine = mock_create_engine.return_value
+    mock_engine.dialect.name = "postgresql"
+
+    # Call function
+    data_loader = DataLoader(mock_df)
+    data_loader.write_to_sql(table_name="mock_table_name", bulk=True, index=False)
+
+    # Asserts
+    mock_to_sql.assert_called_once_with(
+        name="mock_table_name",
+        con=mock_engine,
+        method=copy_insert,
+        chunksize=BULK_CHUNK_SIZE,
+        index=False,
+    )
+
+
+def test_write_to_sql_bulk_fallback(mock_sqlite_url):
+    # Mocks
+    # 18 columns allow 1_820 rows per statement within SQLite's 32_766 parameters.
+    df = pd.DataFrame(
+        np.arange(5_000 * 18).reshape(5_000, 18),
+        columns=[f"column_{i}" for i in range(18)],
+    )
+
+    # Call function
+    data_loader = DataLoader(iter([df, df]))
+
+    # Some builds raise the limit; enforce SQLite's default one.
+    @sa.event.listens_for(data_loader.engine, "connect")
+    def limit_variables(dbapi_connection, connection_record):
+        dbapi_connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 32_766)
+
+    data_loader.write_to_sql(table_name="mock_table_name", bulk=True, index=False)
+
+    # Asserts
+    result = pd.read_sql_table("mock_table_name", data_loader.engine)
+    assert len(result) == 10_000
+    assert result["column_17"].sum() == 2 * df["column_17"].sum()
+    assert data_loader.rows_written == 10_000
+    assert data_loader.rows_per_second > 0
+
+
+def test_copy_insert():
+    # Mocks
+    mock_table = MagicMock()
+    mock_table.schema = "stage"
+    mock_table.name = "stg_taxi_data"
+    mock_conn = MagicMock()
+    mock_cursor = mock_conn.connection.cursor.return_value.__enter__.return_value
+    mock_cursor.rowcount = 2
+    copied = {}
+    mock_cursor.copy_expert.side_effect = lambda sql, buffer: copied.update(
+        sql=sql, data=buffer.read()
+    )
+
+    # Call function
+    result = copy_insert(
+        mock_table, mock_conn, ["vendor_id", "flag"], iter([(1, "N"), (2, None)])
+    )
+
+    # Asserts
+    assert result == 2
+    assert copied["sql"] == (
+        'COPY "stage"."stg_taxi_data" ("vendor_id", "flag") '
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+    assert copied["data"] == "1,N\r\n2,\r\n"
+
+
+@pytest.fixture
+def mock_sqlite_schemas(mock_sqlite_url, tmp_path):
+    engine = sa.create_engine(mock_sqlite_url)
+
+    @sa.event.listens_for(engine, "connect")
+    def attach_schemas(dbapi_connection, connection_record):
+        for schema in ["stage", "production"]:
+            dbapi_connection.execute(
+                f"ATTACH DATABASE '{tmp_path / schema}.db' AS {schema}"
+            )
+
+    with engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE production.taxi_data (a INT, b TEXT)"))
+    return engine
+
+
+def test_promote(mock_sqlite_schemas, mock_df):
+    # Mocks
+    with mock_sqlite_schemas.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE stage.stg (a INT, b TEXT, c INT)"))
+        connection.execute(
+            sa.text("INSERT INTO stage.stg VALUES (1, 'x', 0), (2, 'y', 0)")
+        )
+
+    # Call function
+    data_loader = DataLoader(mock_df)
+    data_loader.engine = mock_sqlite_schemas
+    result = data_loader.promote(
+        source_table="stg",
+        source_schema="stage",
+        target_table="taxi_data",
+        target_schema="production",
+        columns=["a", "b"],
+    )
+
+    # Asserts
+    with mock_sqlite_schemas.connect() as connection:
+        rows = connection.execute(
+            sa.text("SELECT a, b FROM production.taxi_data")
+        ).all()
+        staged = connection.execute(
+            sa.text("SELECT name FROM stage.sqlite_master WHERE name = 'stg'")
+        ).all()
+    assert result == 2
+    assert rows == [(1, "x"), (2, "y")]
+    assert staged == []
+
+
+def test_promote_failure_keeps_staging(mock_sqlite_schemas, mock_df):
+    # Mocks
+    with mock_sqlite_schemas.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE production.strict (a INT NOT NULL)"))
+        connection.execute(sa.text("CREATE TABLE stage.stg (a INT)"))
+        connection.execute(sa.text("INSERT INTO stage.stg VALUES (1), (NULL)"))
+
+    # Call function
+    data_loader = DataLoader(mock_df)
+    data_loader.engine = mock_sqlite_schemas
+    with pytest.raises(sa.exc.IntegrityError):
+        data_loader.promote(
+            source_table="stg",
+            source_schema="stage",
+            target_table="strict",
+            target_schema="production",
+            columns=["a"],
+        )
+
+    # Asserts
+    with mock_sqlite_schemas.connect() as connection:
+        assert connection.execute(sa.text("SELECT a FROM stage.stg")).all() == [
+            (1,),
+            (None,),
+        ]
+        assert (
+            connection.execute(sa.text("SELECT a FROM production.strict")).all() == []
+        )
+
+
+def test_row_hash(mock_df):
+    # Call function
+    result = row_hash(mock_df)
+    shuffled = row_hash(mock_df.iloc[::-1].reset_index(drop=True))
+
+    # Asserts
+    assert list(result.index) == list(mock_df.index)
+    assert result.str.fullmatch("[0-9a-f]{32}").all()
+    assert result.nunique() == 3
+    assert list(shuffled) == list(result[::-1])
+    assert row_hash(mock_df.assign(age=[25, 30, 36]))[2] != result[2]
+
+
+def test_row_hash_numeric_rows():
+    # Call function
+    result = row_hash(pd.DataFrame({"id": [1, 2], "fare": [5.5, 7.25]}))
+
+    # Asserts
+    assert all(digest[:16] != digest[16:] for digest in result)
+
+
+def test_row_hash_dtype_independent(mock_df):
+    # Mocks
+    typed = mock_df.astype({"name": "category", "age": "Int8"})
+
+    # Call function
+    result = row_hash(typed)
+
+    # Asserts
+    assert list(result) == list(row_hash(mock_df))
+    assert list(row_hash(mock_df.astype({"age": "float32"}))) == list(result)
+
+
+def test_promote_idempotent(mock_sqlite_schemas, mock_df):
+    # Mocks
+    with mock_sqlite_schemas.begin() as connection:
+        connection.execute(
+            sa.text(
+                "CREATE TABLE production.people "
+                "(id INT, name TEXT, age INT, date_of_birth TEXT, row_hash TEXT)"
+            )
+        )
+        connection.execute(
+            sa.text(
+                "CREATE UNIQUE INDEX production.people_row_hash ON people (row_hash)"
+            )
+        )
+    columns = [*mock_df.columns, "row_hash"]
+
+    # Call function
+    data_loader = DataLoader(iter([mock_df, mock_df.head(1)]))
+    data_loader.engine = mock_sqlite_schemas
+    data_loader.write_to_sql(
+        table_name="stg", schema="stage", index=False, hash_column="row_hash"
+    )
+    first = data_loader.promote(
+        source_table="stg",
+        source_schema="stage",
+        target_table="people",
+        target_schema="production",
+        columns=columns,
+        drop_source=False,
+        conflict_columns=["row_hash"],
+    )
+    first_skipped = data_loader.rows_skipped
+    second = data_loader.promote(
+        source_table="stg",
+        source_schema="stage",
+        target_table="people",
+        target_schema="production",
+        columns=columns,
+        conflict_columns=["row_hash"],
+    )
+
+    # Asserts
+    result = pd.read_sql_table("people", mock_sqlite_schemas, schema="production")
+    assert first == 3
+    assert first_skipped == 1
+    assert second == 0
+    assert data_loader.rows_skipped == 4
+    assert sorted(result["name"]) == ["Alice", "Bob", "Charlie"]
+    assert list(result["row_hash"]) == list(row_hash(mock_df))
+
+
+def test_write_to_sql_parallel(mock_sqlite_url, mock_df):
+    # Parameters
+    chunks = iter([mock_df.assign(id=mock_df["id"] + 3 * i) for i in range(5)])
+
+    # Call function
+    data_loader = DataLoader(chunks)
+    data_loader.write_to_sql(
+        table_name="mock_table_name", workers=3, if_exists="replace", index=False
+    )
+
+    # Asserts
+    result = pd.read_sql_table("mock_table_name", data_loader.engine)
+    assert sorted(result["id"]) == list(range(1, 16))
+    assert data_loader.rows_written == 15
+    assert data_loader.loaded_chunks == {0, 1, 2, 3, 4}
+    assert sum(report["rows"] for report in data_loader.worker_report.values()) == 15
+    assert all(
+        report["rows_per_second"] > 0 for report in data_loader.worker_report.values()
+    )
+
+
+@patch("src.utils.data_loader.BULK_CHUNK_SIZE", 1)
+def test_write_to_sql_parallel_splits_dataframe(mock_sqlite_url, mock_df):
+    # Call function
+    data_loader = DataLoader(mock_df)
+    data_loader.write_to_sql(table_name="mock_table_name", workers=2, index=False)
+
+    # Asserts
+    result = pd.read_sql_table("mock_table_name", data_loader.engine)
+    assert sorted(result["name"]) == ["Alice", "Bob", "Charlie"]
+    assert data_loader.loaded_chunks == {0, 1, 2}
+
+
+def test_write_to_sql_parallel_retries_chunk(mock_sqlite_url, mock_df):
+    # Mocks
+    original_to_sql = pd.DataFrame.to_sql
+    calls = []
+
+    def flaky_to_sql(self, *args, **kwargs):
+        calls.append(int(self["id"].iloc[0]))
+        if calls.count(4) == 1 and self["id"].iloc[0] == 4:
+            raise sa.exc.OperationalError("INSERT", {}, Exception("connection lost"))
+        return original_to_sql(self, *args, **kwargs)
+
+    chunks = iter([mock_df.assign(id=mock_df["id"] + 3 * i) for i in range(3)])
+
+    # Call function
+    with patch("pandas.DataFrame.to_sql", flaky_to_sql):
+        data_loader = DataLoader(chunks)
+        data_loader.write_to_sql(table_name="mock_table_name", workers=2, index=False)
+
+    # Asserts
+    result = pd.read_sql_table("mock_table_name", data_loader.engine)
+    assert sorted(result["id"]) == list(range(1, 10))
+    assert sorted(calls) == [1, 4, 4, 7]
+
+
+@patch("src.utils.data_loader.LOAD_RETRIES", 2)
+@patch("pandas.DataFrame.to_sql", side_effect=sa.exc.OperationalError("", {}, None))
+def test_write_to_sql_parallel_failure(mock_to_sql, mock_sqlite_url, mock_df):
+    # Call function
+    data_loader = DataLoader(iter([mock_df, mock_df]))
+    with pytest.raises(RuntimeError, match="Chunk 0 could not be written"):
+        data_loader.write_to_sql(table_name="mock_table_name", workers=2)
+
+    # Asserts
+    assert mock_to_sql.call_count == 2
+    assert data_loader.loaded_chunks == set()
+
+
+def test_write_to_sql_parallel_backpressure(mock_create_engine, mock_df):
+    # Mocks
+    pulled = []
+    release = threading.Event()
+
+    def chunks():
+        for i in range(20):
+            pulled.append(i)
+            yield mock_df
+
+    def blocked_write(self, position, chunk, table_name, **kwargs):
+        if position > 0:
+            release.wait()
+        return len(chunk)
+
+    # Call function
+    with patch.object(DataLoader, "_write_chunk", blocked_write):
+        data_loader = DataLoader(chunks())
+        writer = threading.Thread(
+            target=data_loader.write_to_sql,
+            args=("mock_table_name",),
+            kwargs={"workers": 2},
+        )
+        writer.start()
+        time.sleep(0.2)
+        pulled_while_blocked = len(pulled)
+        release.set()
+        writer.join()
+
+    # Asserts
+    assert pulled_while_blocked == 1 + 2 * 2 + 1
+    assert data_loader.rows_written == 60
+
+
+def test_write_to_sql_invalid_workers(mock_create_engine, mock_df):
+    # Call function
+    data_loader = DataLoader(mock_df)
+    with pytest.raises(ValueError, match="The number of workers must be positive"):
+        data_loader.write_to_sql(table_name="mock_table_name", workers=0)
+
+
+@pytest.fixture
+def mock_postgres_connection(mock_create_engine):
+    mock_engine = mock_create_engine.return_value
+    mock_engine.dialect.name = "postgresql"
+    mock_connection = mock_engine.begin.return_value.__enter__.return_value
+    statements = []
+
+    def execute(statement, params=None):
+        sql = str(statement)
+        statements.append(sql)
+        result = MagicMock(rowcount=2)
+        if sql.startswith("SELECT COUNT"):
+            result.scalar.return_value = 5
+        elif "date_trunc" in sql:
+            result.scalars.return_value.all.return_value = [
+                pd.Timestamp("2019-01-01"),
+                pd.Timestamp("2019-02-01"),
+            ]
+        elif "pg_inherits" in sql:
+            result.scalars.return_value.all.return_value = ["taxi_data_2019_01"]
+        return result
+
+    mock_connection.execute.side_effect = execute
+    yield statements
+
+
+def test_promote_partitioned(mock_postgres_connection, mock_df):
+    # Call function
+    data_loader = DataLoader(mock_df)
+    result = data_loader.promote_partitioned(
+        source_table="stg",
+        source_schema="stage",
+        target_table="taxi_data",
+        target_schema="production",
+        columns=["pickup_datetime", "row_hash"],
+        partition_column="pickup_datetime",
+        conflict_columns=["row_hash", "pickup_datetime"],
+    )
+
+    # Asserts
+    locks = [
+        position
+        for position, sql in enumerate(mock_postgres_connection)
+        if sql.startswith("SELECT pg_advisory_xact_lock")
+    ]
+    assert locks == [2, 5]
+    assert all("pg_inherits" in mock_postgres_connection[lock + 1] for lock in locks)
+    statements = [
+        sql
+        for sql in mock_postgres_connection[2:]
+        if "pg_advisory_xact_lock" not in sql and "pg_inherits" not in sql
+    ]
+    on_conflict = 'ON CONFLICT ("row_hash", "pickup_datetime") DO NOTHING'
+    assert statements[0].startswith('INSERT INTO "production"."taxi_data" (')
+    assert on_conflict in statements[0]
+    assert statements[1] == (
+        'CREATE TABLE "production"."taxi_data_2019_02" '
+        '(LIKE "production"."taxi_data" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    )
+    assert statements[2].startswith(
+        'CREATE UNIQUE INDEX ON "production"."taxi_data_2019_02"'
+    )
+    assert statements[3].startswith('INSERT INTO "production"."taxi_data_2019_02"')
+    assert on_conflict in statements[3]
+    assert "ADD CONSTRAINT" in statements[4]
+    assert statements[5] == (
+        'ALTER TABLE "production"."taxi_data" ATTACH PARTITION '
+        '"production"."taxi_data_2019_02" '
+        "FOR VALUES FROM ('2019-02-01 00:00:00') TO ('2019-03-01 00:00:00')"
+    )
+    assert "DROP CONSTRAINT" in statements[6]
+    assert statements[7] == 'DROP TABLE IF EXISTS "stage"."stg"'
+    assert result == 4
+    assert data_loader.rows_skipped == 1
+
+
+def test_promote_partitioned_requires_postgres(mock_sqlite_url, mock_df):
+    # Call function
+    data_loader = DataLoader(mock_df)
+
+    # Asserts
+    with pytest.raises(ValueError, match="Partitioned promotion requires PostgreSQL"):
+        data_loader.promote_partitioned(
+            source_table="stg",
+            target_table="taxi_data",
+            columns=["pickup_datetime"],
+            partition_column="pickup_datetime",
+        )
+
+
+def test_write_chunk(mock_sqlite_url, mock_df):
+    # Call function
+    data_loader = DataLoader(iter([]))
+    result = data_loader.write_chunk(
+        3, mock_df, "mock_table_name", bulk=True, hash_column="row_hash", index=False
+    )
+
+    # Asserts
+    table = pd.read_sql_table("mock_table_name", data_loader.engine)
+    assert result == 3
+    assert data_loader.loaded_chunks == {3}
+    assert list(table["row_hash"]) == list(row_hash(mock_df))
+
+
+@patch("src.utils.data_loader.LOAD_RETRIES", 1)
+def test_write_to_sql_resumes_from_manifest(mock_sqlite_url, mock_df):
+    # Mocks
+    original_to_sql = pd.DataFrame.to_sql
+    calls = []
+    crash = [True]
+
+    def crashing_to_sql(self, *args, **kwargs):
+        calls.append(int(self["id"].iloc[0]))
+        if crash[0] and self["id"].iloc[0] == 7:
+            raise sa.exc.OperationalError("INSERT", {}, Exception("worker killed"))
+        return original_to_sql(self, *args, **kwargs)
+
+    def input_chunks():
+        return iter([mock_df.assign(id=mock_df["id"] + 3 * i) for i in range(3)])
+
+    manifest = LoadManifest("mock_table_name", get_engine(mock_sqlite_url), schema=None)
+    with patch("pandas.DataFrame.to_sql", crashing_to_sql):
+        with pytest.raises(RuntimeError, match="Chunk 2 could not be written"):
+            DataLoader(input_chunks(), manifest).write_to_sql(
+                table_name="mock_table_name", index=False
+            )
+
+    # Call function
+    calls.clear()
+    crash[0] = False
+    data_loader = DataLoader(input_chunks(), manifest)
+    with patch("pandas.DataFrame.to_sql", crashing_to_sql):
+        data_loader.write_to_sql(
+            table_name="mock_table_name", if_exists="append", index=False
+        )
+
+    # Asserts
+    result = pd.read_sql_table("mock_table_name", data_loader.engine)
+    assert sorted(result["id"]) == list(range(1, 10))
+    assert data_loader.rows_written == 9
+    assert data_loader.rows_resumed == 6
+    assert data_loader.loaded_chunks == {0, 1, 2}
+    assert calls == [7]
+    assert {
+        position: chunk[:2] for position, chunk in manifest.committed().items()
+    } == {0: (0, 3), 1: (3, 3), 2: (6, 3)}
+    assert manifest.committed()[2][2] == chunk_fingerprint(list(input_chunks())[2])
+
+
+def test_write_to_sql_resume_changed_input(mock_sqlite_url, mock_df):
+    # Mocks
+    manifest = LoadManifest("mock_table_name", get_engine(mock_sqlite_url), schema=None)
+    DataLoader(mock_df, manifest).write_to_sql(table_name="mock_table_name")
+
+    # Call function
+    data_loader = DataLoader(mock_df.head(2), manifest)
+
+    # Asserts
+    with pytest.raises(RuntimeError, match="the input changed"):
+        data_loader.write_to_sql(table_name="mock_table_name", if_exists="append")
+
+
+def test_write_to_sql_resume_changed_rows(mock_sqlite_url, mock_df):
+    # Mocks
+    manifest = LoadManifest("mock_table_name", get_engine(mock_sqlite_url), schema=None)
+    DataLoader(mock_df, manifest).write_to_sql(table_name="mock_table_name")
+
+    # Call function
+    data_loader = DataLoader(mock_df.assign(age=[25, 30, 36]), manifest)
+
+    # Asserts
+    with pytest.raises(RuntimeError, match="Chunk 0 differs from the committed one"):
+        data_loader.write_to_sql(table_name="mock_table_name", if_exists="append")
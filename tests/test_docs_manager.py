@@ -0,0 +1,86 @@
+import pytest
+import threading
+
+from unittest.mock import MagicMock
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+)
+from src.great_expectations_checker.docs_manager import DataDocsManager
+
+
+@pytest.fixture
+def mock_context():
+    return MagicMock()
+
+
+def test_build_once(mock_context):
+    # Mocks
+    mock_result = MagicMock(run_results={"validation_id": MagicMock()})
+    docs = DataDocsManager(mock_context, background=False)
+
+    # Call function
+    docs.suite_changed("taxi_suite_checks")
+    docs.suite_changed("taxi_suite_checks")
+    docs.validated(mock_result)
+    first = docs.build(site_names=["taxi_site"])
+    second = docs.build(site_names=["taxi_site"])
+
+    # Asserts
+    assert first is None and second is None
+    mock_context.build_data_docs.assert_called_once_with(
+        site_names=["taxi_site"],
+        resource_identifiers=[
+            ExpectationSuiteIdentifier("taxi_suite_checks"),
+            "validation_id",
+        ],
+    )
+
+
+def test_build_nothing_changed(mock_context):
+    # Call function
+    result = DataDocsManager(mock_context, background=False).build()
+
+    # Asserts
+    assert result is None
+    mock_context.build_data_docs.assert_not_called()
+
+
+def test_build_background(mock_context):
+    # Mocks
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_build(**kwargs):
+        started.set()
+        release.wait(5)
+
+    mock_context.build_data_docs.side_effect = slow_build
+    docs = DataDocsManager(mock_context, background=True)
+    docs.suite_changed("taxi_suite_checks")
+
+    # Call function
+    future = docs.build(site_names=["taxi_site"])
+    started.wait(5)
+
+    # Asserts
+    assert not future.done()
+    release.set()
+    DataDocsManager.wait()
+    assert future.done()
+    assert future.exception() is None
+    mock_context.build_data_docs.assert_called_once()
+
+
+def test_build_background_failure(mock_context, caplog):
+    # Mocks
+    mock_context.build_data_docs.side_effect = OSError("disk full")
+    docs = DataDocsManager(mock_context, background=True)
+    docs.suite_changed("taxi_suite_checks")
+
+    # Call function
+    future = docs.build()
+    DataDocsManager.wait()
+
+    # Asserts
+    assert isinstance(future.exception(), OSError)
+    assert "Data docs build failed: disk full" in caplog.text
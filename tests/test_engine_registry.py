@@ -0,0 +1,114 @@
+import os
+import pytest
+import threading
+import sqlalchemy as sa
+
+from unittest.mock import patch
+from src.utils.engine_registry import EngineRegistry, PoolStats, get_engine
+
+
+@pytest.fixture
+def mock_sqlite_url(tmp_path):
+    yield f"sqlite:///{tmp_path / 'mock.db'}"
+    EngineRegistry.dispose_all()
+
+
+def test_get_engine_is_shared(mock_sqlite_url):
+    # Call function
+    with patch.dict(os.environ, {"CONNECTION_STRING": mock_sqlite_url}):
+        result = get_engine()
+
+    # Asserts
+    assert result is EngineRegistry.get_engine(mock_sqlite_url)
+    assert result.pool.size() == EngineRegistry.pool_options()["pool_size"]
+    assert result.pool._pre_ping is EngineRegistry.pool_options()["pool_pre_ping"]
+    assert result.pool._recycle == EngineRegistry.pool_options()["pool_recycle"]
+
+
+def test_get_engine_per_database(mock_sqlite_url, tmp_path):
+    # Call function
+    result = get_engine(mock_sqlite_url)
+    other = get_engine(f"sqlite:///{tmp_path / 'other.db'}")
+
+    # Asserts
+    assert result is not other
+    assert result.pool.stats is not other.pool.stats
+
+
+def test_stats(mock_sqlite_url):
+    # Mocks
+    engine = get_engine(mock_sqlite_url)
+
+    # Call function
+    with engine.connect() as first, engine.connect() as second:
+        first.execute(sa.text("SELECT 1"))
+        second.execute(sa.text("SELECT 1"))
+        during = EngineRegistry.stats(mock_sqlite_url)
+    after = EngineRegistry.stats(mock_sqlite_url)
+
+    # Asserts
+    capacity = sum(
+        EngineRegistry.pool_options()[key] for key in ("pool_size", "max_overflow")
+    )
+    assert during["checked_out"] == 2
+    assert during["saturation"] == 2 / capacity
+    assert after["acquisitions"] == 2
+    assert after["checked_out"] == 0
+    assert after["peak_checked_out"] == 2
+    assert after["peak_saturation"] == 2 / capacity
+    assert after["max_acquire_ms"] >= after["mean_acquire_ms"] >= 0
+
+
+def test_stats_unknown_engine(mock_sqlite_url):
+    # Call function
+    result = EngineRegistry.stats(mock_sqlite_url)
+
+    # Asserts
+    assert result == {}
+
+
+def test_stats_survive_dispose(mock_sqlite_url):
+    # Mocks
+    engine = get_engine(mock_sqlite_url)
+    with engine.connect():
+        pass
+
+    # Call function
+    engine.dispose()
+    with engine.connect():
+        pass
+
+    # Asserts
+    assert EngineRegistry.stats(mock_sqlite_url)["acquisitions"] == 2
+
+
+def test_get_engine_concurrent(mock_sqlite_url):
+    # Mocks
+    results = []
+
+    def acquire():
+        results.append(get_engine(mock_sqlite_url))
+
+    # Call function
+    threads = [threading.Thread(target=acquire) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Asserts
+    assert len({id(engine) for engine in results}) == 1
+
+
+def test_pool_stats_timeout():
+    # Mocks
+    stats = PoolStats(capacity=2)
+
+    # Call function
+    stats.record_timeout()
+    stats.record_acquire(0.5, 2)
+
+    # Asserts
+    assert stats.as_dict()["timeouts"] == 1
+    assert stats.as_dict()["saturation"] == 1.0
+    assert stats.as_dict()["mean_acquire_ms"] == 500.0
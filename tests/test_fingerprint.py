@@ -0,0 +1,67 @@
+import pytest
+import great_expectations as gx
+import great_expectations.expectations as gxe
+
+from src.great_expectations_checker.fingerprint import (
+    fingerprint,
+    expectations_fingerprint,
+    model_fingerprint,
+)
+
+
+@pytest.fixture
+def mock_context():
+    return gx.get_context(mode="ephemeral")
+
+
+def test_fingerprint_canonical():
+    # Call function
+    result = fingerprint({"b": [1, 2], "a": {"y": 1, "x": None}})
+    other = fingerprint({"a": {"x": None, "y": 1}, "b": [1, 2]})
+
+    # Asserts
+    assert result == other
+    assert result != fingerprint({"a": {"x": None, "y": 1}, "b": [2, 1]})
+    assert len(result) == 64
+
+
+def test_expectations_fingerprint_ignores_ids(mock_context):
+    # Mocks
+    suite = mock_context.suites.add(gx.ExpectationSuite(name="mock_suite"))
+    suite.add_expectation(gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"))
+
+    # Call function
+    result = expectations_fingerprint(suite.expectations)
+
+    # Asserts
+    assert suite.expectations[0].id is not None
+    assert result == expectations_fingerprint(
+        [gxe.ExpectColumnValuesToNotBeNull(column="vendor_id")]
+    )
+    assert result != expectations_fingerprint(
+        [gxe.ExpectColumnValuesToNotBeNull(column="passenger_count")]
+    )
+
+
+def test_model_fingerprint_ignores_id(mock_context):
+    # Mocks
+    suite = mock_context.suites.add(gx.ExpectationSuite(name="mock_suite"))
+    asset = mock_context.data_sources.add_pandas("mock_source").add_dataframe_asset(
+        "mock_asset"
+    )
+    batch_definition = asset.add_batch_definition_whole_dataframe("mock_batch")
+    stored = mock_context.validation_definitions.add(
+        gx.ValidationDefinition(name="mock_vd", data=batch_definition, suite=suite)
+    )
+
+    # Call function
+    result = model_fingerprint(
+        gx.ValidationDefinition(name="mock_vd", data=batch_definition, suite=suite)
+    )
+
+    # Asserts
+    assert stored.id is not None
+    assert result == model_fingerprint(stored)
+    assert result != model_fingerprint(
+        gx.ValidationDefinition(name="other_vd", data=batch_definition, suite=suite)
+    )
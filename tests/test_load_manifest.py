@@ -0,0 +1,107 @@
+import pytest
+import pandas as pd
+import sqlalchemy as sa
+
+from src.utils.load_manifest import LoadManifest, chunk_fingerprint
+
+
+@pytest.fixture
+def mock_engine(tmp_path):
+    return sa.create_engine(f"sqlite:///{tmp_path / 'mock.db'}")
+
+
+@pytest.fixture
+def mock_manifest(mock_engine):
+    return LoadManifest("stg_taxi_data_run", mock_engine, schema=None)
+
+
+def test_qualified_name(mock_engine):
+    # Call function
+    result = LoadManifest("stg_taxi_data_run", mock_engine)
+
+    # Asserts
+    assert result.qualified_name == '"stage"."load_manifest"'
+
+
+def test_committed_empty(mock_manifest):
+    # Call function
+    result = mock_manifest.committed()
+
+    # Asserts
+    assert result == {}
+
+
+def test_record(mock_manifest, mock_engine):
+    # Mocks
+    other = LoadManifest("stg_taxi_data_other", mock_engine, schema=None)
+
+    # Call function
+    with mock_engine.begin() as connection:
+        mock_manifest.record(connection, 0, 0, 100, "hash_0")
+        mock_manifest.record(connection, 1, 100, 50, "hash_1")
+    with mock_engine.begin() as connection:
+        other.record(connection, 0, 0, 10, "hash_other")
+
+    # Asserts
+    assert mock_manifest.committed() == {0: (0, 100, "hash_0"), 1: (100, 50, "hash_1")}
+    assert other.committed() == {0: (0, 10, "hash_other")}
+
+
+def test_record_rolled_back(mock_manifest, mock_engine):
+    # Call function
+    with pytest.raises(RuntimeError):
+        with mock_engine.begin() as connection:
+            mock_manifest.record(connection, 0, 0, 100, "hash_0")
+            raise RuntimeError("Chunk 0 could not be written")
+
+    # Asserts
+    assert mock_manifest.committed() == {}
+
+
+def test_clear(mock_manifest, mock_engine):
+    # Mocks
+    other = LoadManifest("stg_taxi_data_other", mock_engine, schema=None)
+    with mock_engine.begin() as connection:
+        mock_manifest.record(connection, 0, 0, 100, "hash_0")
+        other.record(connection, 0, 0, 10, "hash_other")
+
+    # Call function
+    mock_manifest.clear()
+
+    # Asserts
+    assert mock_manifest.committed() == {}
+    assert other.committed() == {0: (0, 10, "hash_other")}
+
+
+def test_committed_adds_chunk_hash(mock_manifest, mock_engine):
+    # Mocks
+    with mock_engine.begin() as connection:
+        connection.execute(
+            sa.text(
+                "CREATE TABLE load_manifest (target VARCHAR(128), position INT, "
+                "row_offset BIGINT, row_count BIGINT)"
+            )
+        )
+        connection.execute(
+            sa.text("INSERT INTO load_manifest VALUES ('stg_taxi_data_run', 0, 0, 10)")
+        )
+
+    # Call function
+    result = mock_manifest.committed()
+
+    # Asserts
+    assert result == {0: (0, 10, None)}
+
+
+def test_chunk_fingerprint():
+    # Mocks
+    chunk = pd.DataFrame({"id": [1, 2], "name": ["Alice", "Bob"]})
+
+    # Call function
+    result = chunk_fingerprint(chunk)
+
+    # Asserts
+    assert len(result) == 32
+    assert chunk_fingerprint(chunk.set_index(pd.Index([5, 6]))) == result
+    assert chunk_fingerprint(chunk.assign(name=["Alice", "Eve"])) != result
+    assert chunk_fingerprint(chunk.rename(columns={"name": "first_name"})) != result
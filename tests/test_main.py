@@ -1,16 +1,28 @@
+import asyncio
 import pytest
 import logging
 import os
 import pandas as pd
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock
 
 from main import (
     load_taxi_data,
     load_data_to_sql,
+    load_data_to_sql_async,
+    precheck_chunk,
+    streaming_expectations,
     run_expectations,
     validate_expectations,
     main,
 )
+from src.great_expectations_checker.streaming_validator import StreamingValidator
+from src.config.config import (
+    CHUNK_SIZE,
+    TAXI_SCHEMA,
+    LOAD_WORKERS,
+    ROW_HASH_COLUMN,
+    PARTITION_COLUMN,
+)
 
 
 @pytest.fixture
@@ -27,8 +39,10 @@ def mock_df():
     )
 
 
+@patch("main.RangedDownloader")
+@patch("main.ParquetDataCache")
 @patch("main.TaxiDataExtractor")
-def test_load_taxi_data(mock_extractor, mock_df):
+def test_load_taxi_data(mock_extractor, mock_cache, mock_downloader, mock_df):
     # Mocks
     mock_instance = mock_extractor.return_value
     mock_instance.get_data.return_value = mock_df
@@ -39,30 +53,151 @@ def test_load_taxi_data(mock_extractor, mock_df):
     # Asserts
     assert isinstance(df, pd.DataFrame)
     assert not df.empty
-    mock_extractor.assert_called_once_with("mock_url")
+    mock_extractor.assert_called_once_with(
+        "mock_url",
+        cache=mock_cache.return_value,
+        schema=TAXI_SCHEMA,
+        downloader=mock_downloader.return_value,
+        watermark=None,
+    )
     mock_instance.load_data.assert_called_once()
     mock_instance.get_data.assert_called_once()
 
 
+@patch("main.RangedDownloader")
+@patch("main.ParquetDataCache")
+@patch("main.TaxiDataExtractor")
+def test_load_taxi_data_chunked(mock_extractor, mock_cache, mock_downloader, mock_df):
+    # Mocks
+    mock_instance = mock_extractor.return_value
+    mock_instance.iter_chunks.return_value = iter([mock_df])
+
+    # Call function
+    chunks = load_taxi_data("mock_url", chunksize=1000)
+
+    # Asserts
+    assert list(chunks) == [mock_df]
+    mock_instance.iter_chunks.assert_called_once_with(chunksize=1000)
+    mock_instance.load_data.assert_not_called()
+
+
 @patch("main.DataLoader")
 def test_load_data_to_sql(mock_data_loader, mock_df):
     # Mocks
     mock_instance = mock_data_loader.return_value
 
     # Call function
-    data_loader = load_data_to_sql(mock_df)
+    data_loader = load_data_to_sql(mock_df, "stg_taxi_data_run")
 
     # Asserts
     assert isinstance(data_loader, MagicMock)
-    mock_data_loader.assert_called_once_with(mock_df)
+    assert data_loader.df is None
+    mock_data_loader.assert_called_once_with(mock_df, None)
     mock_instance.write_to_sql.assert_called_once_with(
-        table_name="stg_taxi_data",
+        table_name="stg_taxi_data_run",
+        schema="stage",
+        if_exists="append",
+        index=False,
+        bulk=True,
+        workers=LOAD_WORKERS,
+        hash_column=ROW_HASH_COLUMN,
+    )
+
+
+@pytest.fixture
+def mock_taxi_chunk():
+    return pd.DataFrame({column: [1, None] for column in TAXI_SCHEMA})
+
+
+def test_precheck_chunk(mock_taxi_chunk, mock_df):
+    # Call function
+    result = precheck_chunk(mock_taxi_chunk)
+
+    # Asserts
+    assert result == {column: 1 for column in TAXI_SCHEMA}
+    with pytest.raises(ValueError, match="Chunk is missing columns: rate_code_id"):
+        precheck_chunk(mock_df)
+
+
+def test_streaming_expectations(mock_taxi_chunk):
+    # Mocks
+    typed_chunk = mock_taxi_chunk.astype(TAXI_SCHEMA)
+
+    # Call function
+    result = streaming_expectations()
+
+    # Asserts
+    assert result[0].column_list == list(TAXI_SCHEMA)
+    assert result[-1].column == "vendor_id"
+    assert [
+        e._validate_pandas(typed_chunk[e.column].dtype, e.type_)["success"]
+        for e in result[1:-1]
+    ] == [True] * len(TAXI_SCHEMA)
+
+
+def test_streaming_expectations_typed_chunks(mock_taxi_chunk):
+    # Mocks
+    chunks = [
+        mock_taxi_chunk.assign(vendor_id=[1, 2], store_and_fwd_flag=flags).astype(
+            TAXI_SCHEMA
+        )
+        for flags in (["N", "Y"], ["Y", None])
+    ]
+    validator = StreamingValidator(streaming_expectations())
+
+    # Call function
+    result = list(validator.iter_validated(iter(chunks)))
+
+    # Asserts
+    assert len(result) == 2
+    assert validator.result().success
+
+
+@patch("main.DataLoader")
+def test_load_data_to_sql_async(mock_data_loader, mock_taxi_chunk):
+    # Mocks
+    mock_instance = mock_data_loader.return_value
+    mock_instance.write_chunk.side_effect = lambda position, chunk, *_, **__: len(chunk)
+    chunks = iter([mock_taxi_chunk] * 5)
+
+    # Call function
+    data_loader = asyncio.run(load_data_to_sql_async(chunks, "stg_taxi_data_run"))
+
+    # Asserts
+    assert data_loader is mock_instance
+    assert data_loader.rows_written == 10
+    assert data_loader.df is None
+    assert sorted(
+        call.args[0] for call in mock_instance.write_chunk.call_args_list
+    ) == list(range(5))
+    assert [
+        call.kwargs["row_offset"] for call in mock_instance.write_chunk.call_args_list
+    ] == [0, 2, 4, 6, 8]
+    mock_instance.write_chunk.assert_called_with(
+        ANY,
+        ANY,
+        "stg_taxi_data_run",
+        row_offset=ANY,
         schema="stage",
         if_exists="append",
         index=False,
+        bulk=True,
+        hash_column=ROW_HASH_COLUMN,
     )
 
 
+@patch("main.DataLoader")
+def test_load_data_to_sql_async_failure(mock_data_loader, mock_taxi_chunk):
+    # Mocks
+    mock_instance = mock_data_loader.return_value
+    mock_instance.write_chunk.side_effect = RuntimeError("Chunk 0 could not be written")
+    chunks = iter([mock_taxi_chunk] * 20)
+
+    # Asserts
+    with pytest.raises(RuntimeError, match="Chunk 0 could not be written"):
+        asyncio.run(load_data_to_sql_async(chunks, "stg_taxi_data_run"))
+
+
 @patch("main.GreatExpectationsPostgresChecker")
 @patch("os.getenv")
 def test_run_expectations(mock_getenv, mock_ge_checker):
@@ -72,7 +207,7 @@ def test_run_expectations(mock_getenv, mock_ge_checker):
     mock_checker_instance.run_checkpoint.return_value.success = True
 
     # Call function
-    result = run_expectations()
+    result = run_expectations("stg_taxi_data_run")
 
     # Asserts
     assert result is True
@@ -89,6 +224,7 @@ def test_run_expectations(mock_getenv, mock_ge_checker):
         "create_expectations",
         "run_checkpoint",
         "generate_data_docs",
+        "drop_data_asset",
     ]
 
     for method in expected_calls:
@@ -96,6 +232,69 @@ def test_run_expectations(mock_getenv, mock_ge_checker):
         method_mock.assert_called_once()
 
     mock_checker_instance.run_checkpoint.assert_called_once()
+    mock_checker_instance.set_data_asset.assert_called_once_with(
+        "postgres_stg_taxi_data", "stg_taxi_data_run", "stage"
+    )
+
+
+@patch("main.SQL_PUSHDOWN", True)
+@patch("main.GreatExpectationsPostgresChecker")
+@patch("os.getenv")
+def test_run_expectations_pushdown(mock_getenv, mock_ge_checker):
+    # Mocks
+    mock_getenv.return_value = "mock_connection_string"
+    mock_checker_instance = mock_ge_checker.return_value
+    mock_checker_instance.run_pushdown.return_value.success = False
+
+    # Call function
+    result = run_expectations("stg_taxi_data_run")
+
+    # Asserts
+    assert result is False
+    mock_checker_instance.run_pushdown.assert_called_once_with()
+    mock_checker_instance.run_checkpoint.assert_not_called()
+    mock_checker_instance.generate_data_docs.assert_called_once()
+
+
+@patch("main.SAMPLING", True)
+@patch("os.getenv")
+@patch("main.GreatExpectationsPostgresChecker")
+def test_run_expectations_sampling(mock_ge_checker, mock_getenv):
+    # Mocks
+    mock_getenv.return_value = "mock_connection_string"
+    mock_checker_instance = mock_ge_checker.return_value
+    mock_checker_instance.run_sampled.return_value.success = True
+
+    # Call function
+    result = run_expectations("stg_taxi_data_run")
+
+    # Asserts
+    assert result is True
+    mock_checker_instance.run_sampled.assert_called_once_with()
+    mock_checker_instance.run_pushdown.assert_not_called()
+    mock_checker_instance.run_checkpoint.assert_not_called()
+
+
+@patch("main.VALIDATION_PARTITION", "daily")
+@patch("os.getenv")
+@patch("main.GreatExpectationsPostgresChecker")
+def test_run_expectations_partitioned(mock_ge_checker, mock_getenv):
+    # Mocks
+    mock_getenv.return_value = "mock_connection_string"
+    mock_checker_instance = mock_ge_checker.return_value
+    mock_checker_instance.run_partitioned.return_value.success = False
+
+    # Call function
+    result = run_expectations("stg_taxi_data_run")
+
+    # Asserts
+    assert result is False
+    mock_checker_instance.set_partitioned_batch_definition.assert_called_once_with(
+        "taxi_batch_definition_daily", "daily"
+    )
+    mock_checker_instance.set_batch_definition.assert_not_called()
+    mock_checker_instance.run_partitioned.assert_called_once_with("taxi_site")
+    mock_checker_instance.run_checkpoint.assert_not_called()
 
 
 @patch("os.getenv")
@@ -112,7 +311,7 @@ def test_run_expectations_logs_warning_on_failure(mock_ge_checker, mock_getenv,
 
     # Call function
     with caplog.at_level("WARNING"):
-        result = run_expectations()
+        result = run_expectations("stg_taxi_data_run")
 
     # Asserts
     assert result is False
@@ -126,34 +325,256 @@ def test_validate_expectations_fail(mock_ge_checker):
 
     # Asserts
     with pytest.raises(ValueError, match="Data validation failed!"):
-        validate_expectations(mock_data_loader, False)
+        validate_expectations(mock_data_loader, False, "stg_taxi_data_run")
     mock_ge_checker.return_value.open_report.assert_called_once()
 
 
+def test_validate_expectations_success():
+    # Mocks
+    mock_data_loader = MagicMock()
+
+    # Call function
+    validate_expectations(mock_data_loader, True, "stg_taxi_data_run")
+
+    # Asserts
+    mock_data_loader.promote.assert_called_once_with(
+        source_table="stg_taxi_data_run",
+        source_schema="stage",
+        target_table="taxi_data",
+        target_schema="production",
+        columns=[*TAXI_SCHEMA, ROW_HASH_COLUMN],
+        conflict_columns=[ROW_HASH_COLUMN, PARTITION_COLUMN],
+    )
+    mock_data_loader.promote_partitioned.assert_not_called()
+    mock_data_loader.write_to_sql.assert_not_called()
+
+
+@patch("main.PARTITIONED_PROMOTION", True)
+@patch("main.IDEMPOTENT_PROMOTION", False)
+def test_validate_expectations_success_partitioned():
+    # Mocks
+    mock_data_loader = MagicMock()
+
+    # Call function
+    validate_expectations(mock_data_loader, True, "stg_taxi_data_run")
+
+    # Asserts
+    mock_data_loader.promote_partitioned.assert_called_once_with(
+        partition_column=PARTITION_COLUMN,
+        source_table="stg_taxi_data_run",
+        source_schema="stage",
+        target_table="taxi_data",
+        target_schema="production",
+        columns=[*TAXI_SCHEMA, ROW_HASH_COLUMN],
+        conflict_columns=None,
+    )
+    mock_data_loader.promote.assert_not_called()
+
+
+@patch("main.StagingTableManager")
+@patch("main.LoadManifest")
 @patch("main.load_taxi_data")
 @patch("main.load_data_to_sql")
 @patch("main.run_expectations")
 @patch("main.validate_expectations")
-def test_main(mock_validate, mock_run_expectations, mock_load_sql, mock_load_data):
+def test_main(
+    mock_validate,
+    mock_run_expectations,
+    mock_load_sql,
+    mock_load_data,
+    mock_manifest,
+    mock_staging,
+):
     # Mocks
     mock_df = MagicMock()
     mock_loader = MagicMock()
     mock_load_data.return_value = mock_df
     mock_load_sql.return_value = mock_loader
     mock_run_expectations.return_value = True
+    mock_stage_table = mock_staging.return_value.create.return_value
+
+    # Call function
+    main("mock_run_id")
+
+    # Asserts
+    mock_staging.return_value.cleanup_orphans.assert_called_once()
+    mock_staging.return_value.create.assert_called_once_with("mock_run_id")
+    mock_load_data.assert_called_once_with(ANY, CHUNK_SIZE, watermark=None)
+    mock_manifest.assert_called_once_with(mock_stage_table)
+    mock_load_sql.assert_called_once_with(
+        mock_df, mock_stage_table, mock_manifest.return_value
+    )
+    mock_run_expectations.assert_called_once_with(mock_stage_table)
+    mock_validate.assert_called_once_with(mock_loader, True, mock_stage_table)
+    mock_manifest.return_value.clear.assert_called_once()
+
+
+@patch("main.STREAMING_VALIDATION", True)
+@patch("main.StagingTableManager")
+@patch("main.LoadManifest")
+@patch("main.load_taxi_data")
+@patch("main.load_data_to_sql")
+@patch("main.run_expectations")
+@patch("main.validate_expectations")
+def test_main_streaming_hard_failure(
+    mock_validate,
+    mock_run_expectations,
+    mock_load_sql,
+    mock_load_data,
+    mock_manifest,
+    mock_staging,
+    mock_taxi_chunk,
+):
+    # Mocks
+    loaded = []
+    chunks = [mock_taxi_chunk.astype(TAXI_SCHEMA).iloc[:1]] * 2 + [
+        mock_taxi_chunk.astype(TAXI_SCHEMA)
+    ] * 2
+    mock_load_data.return_value = iter(chunks)
+    mock_load_sql.side_effect = lambda df, *args: loaded.extend(df)
+
+    # Call function
+    with pytest.raises(ValueError, match="Hard failure in chunk 2"):
+        main("mock_run_id")
+
+    # Asserts
+    assert len(loaded) == 2
+    mock_run_expectations.assert_not_called()
+    mock_manifest.return_value.clear.assert_not_called()
+
+
+@patch("main.StagingTableManager")
+@patch("main.LoadManifest")
+@patch("main.load_taxi_data")
+@patch("main.load_data_to_sql")
+@patch("main.run_expectations")
+@patch("main.validate_expectations")
+def test_main_keeps_manifest_on_failure(
+    mock_validate,
+    mock_run_expectations,
+    mock_load_sql,
+    mock_load_data,
+    mock_manifest,
+    mock_staging,
+):
+    # Mocks
+    mock_load_sql.side_effect = RuntimeError("Chunk 3 could not be written")
+
+    # Call function
+    with pytest.raises(RuntimeError, match="Chunk 3 could not be written"):
+        main("mock_run_id")
+
+    # Asserts
+    mock_manifest.return_value.clear.assert_not_called()
+    mock_run_expectations.assert_not_called()
+
+
+@patch("main.ASYNC_PIPELINE", True)
+@patch("main.StagingTableManager")
+@patch("main.LoadManifest")
+@patch("main.load_taxi_data")
+@patch("main.load_data_to_sql_async")
+@patch("main.load_data_to_sql")
+@patch("main.run_expectations")
+@patch("main.validate_expectations")
+def test_main_async(
+    mock_validate,
+    mock_run_expectations,
+    mock_load_sql,
+    mock_load_sql_async,
+    mock_load_data,
+    mock_manifest,
+    mock_staging,
+):
+    # Mocks
+    mock_loader = MagicMock()
+
+    async def load(df, table_name, manifest):
+        return mock_loader
+
+    mock_load_sql_async.side_effect = load
+    mock_run_expectations.return_value = True
+    mock_stage_table = mock_staging.return_value.create.return_value
 
     # Call function
     main()
 
     # Asserts
-    mock_load_data.assert_called_once()
-    mock_load_sql.assert_called_once_with(mock_df)
-    mock_run_expectations.assert_called_once()
-    mock_validate.assert_called_once_with(mock_loader, True)
+    mock_load_sql.assert_not_called()
+    mock_load_sql_async.assert_called_once_with(
+        mock_load_data.return_value, mock_stage_table, mock_manifest.return_value
+    )
+    mock_validate.assert_called_once_with(mock_loader, True, mock_stage_table)
+
+
+@patch("main.INCREMENTAL", True)
+@patch("main.StagingTableManager")
+@patch("main.LoadManifest")
+@patch("main.WatermarkStore")
+@patch("main.load_taxi_data")
+@patch("main.load_data_to_sql")
+@patch("main.run_expectations")
+@patch("main.validate_expectations")
+def test_main_incremental(
+    mock_validate,
+    mock_run_expectations,
+    mock_load_sql,
+    mock_load_data,
+    mock_store,
+    mock_manifest,
+    mock_staging,
+):
+    # Mocks
+    mock_watermark = pd.Timestamp("2019-01-31 23:59:59")
+    mock_store.return_value.get.return_value = mock_watermark
+    mock_load_sql.return_value.rows_written = 10
+    mock_run_expectations.return_value = True
+
+    # Call function
+    main()
+
+    # Asserts
+    mock_load_data.assert_called_once_with(ANY, CHUNK_SIZE, watermark=mock_watermark)
+    mock_validate.assert_called_once_with(
+        mock_load_sql.return_value, True, mock_staging.return_value.create.return_value
+    )
+    mock_store.return_value.refresh.assert_called_once()
+
+
+@patch("main.INCREMENTAL", True)
+@patch("main.StagingTableManager")
+@patch("main.LoadManifest")
+@patch("main.WatermarkStore")
+@patch("main.load_taxi_data")
+@patch("main.load_data_to_sql")
+@patch("main.run_expectations")
+def test_main_incremental_nothing_new(
+    mock_run_expectations,
+    mock_load_sql,
+    mock_load_data,
+    mock_store,
+    mock_manifest,
+    mock_staging,
+):
+    # Mocks
+    mock_load_sql.return_value.rows_written = 0
+
+    # Call function
+    main()
+
+    # Asserts
+    mock_run_expectations.assert_not_called()
+    mock_store.return_value.refresh.assert_not_called()
+    mock_staging.return_value.drop.assert_called_once_with(
+        mock_staging.return_value.create.return_value
+    )
+    mock_manifest.return_value.clear.assert_called_once()
 
 
+@patch("main.StagingTableManager")
+@patch("main.LoadManifest")
 @patch("main.load_taxi_data", side_effect=Exception("Test Error"))
-def test_main_exception(mock_load_data, caplog):
+def test_main_exception(mock_load_data, mock_manifest, mock_staging, caplog):
     # Parameters
     caplog.set_level(logging.ERROR)
 
@@ -0,0 +1,185 @@
+import io
+import time
+import pytest
+import threading
+import pandas as pd
+
+from unittest.mock import MagicMock, patch
+from concurrent.futures import CancelledError
+from src.utils.multi_file_extractor import MultiFileTaxiDataExtractor, _ByteBudget
+
+
+@pytest.fixture
+def mock_csv_data():
+    data = {
+        "vendor_id": [1, 2],
+        "pickup_datetime": ["2025-01-01 08:00:00", "2025-01-01 09:00:00"],
+        "dropoff_datetime": ["2025-01-01 08:30:00", "2025-01-01 09:30:00"],
+    }
+    return pd.DataFrame(data)
+
+
+@pytest.fixture
+def mock_monthly_files(tmp_path, mock_csv_data):
+    paths = []
+    for month in ["01", "02", "03"]:
+        path = tmp_path / f"yellow_tripdata_2019-{month}.csv"
+        mock_csv_data.to_csv(path, index=False)
+        paths.append(str(path))
+    return paths
+
+
+def test_resolve_sources_glob(tmp_path, mock_monthly_files):
+    # Call function
+    result = MultiFileTaxiDataExtractor(str(tmp_path / "yellow_tripdata_*.csv"))
+
+    # Asserts
+    assert result.sources == mock_monthly_files
+
+
+def test_resolve_sources_list():
+    # Parameters
+    sources = ["https://mock.test/a.csv", "https://mock.test/b.csv"]
+
+    # Call function
+    result = MultiFileTaxiDataExtractor(sources)
+
+    # Asserts
+    assert result.sources == sources
+
+
+def test_not_initilized_no_sources(tmp_path):
+    # Call function
+    with pytest.raises(ValueError, match="No source files to extract"):
+        MultiFileTaxiDataExtractor(str(tmp_path / "missing_*.csv"))
+
+
+@pytest.mark.parametrize(
+    "limits",
+    [
+        {"download_workers": 0},
+        {"parse_workers": 0},
+        {"max_bytes_in_flight": -1},
+    ],
+)
+def test_not_initilized_invalid_limits(limits):
+    # Call function
+    with pytest.raises(ValueError, match="Worker and byte limits must be positive"):
+        MultiFileTaxiDataExtractor(["mock.csv"], **limits)
+
+
+def test_iter_results(mock_monthly_files):
+    # Call function
+    extractor = MultiFileTaxiDataExtractor(
+        mock_monthly_files, download_workers=2, parse_workers=2
+    )
+    results = dict(extractor.iter_results())
+
+    # Asserts
+    assert sorted(results) == mock_monthly_files
+    for df in results.values():
+        assert len(df) == 2
+        assert pd.api.types.is_datetime64_any_dtype(df["pickup_datetime"])
+
+
+@patch("src.utils.multi_file_extractor.urllib.request.urlopen")
+def test_iter_results_remote(mock_urlopen, mock_csv_data):
+    # Mocks
+    content = mock_csv_data.to_csv(index=False).encode()
+
+    def mock_open(request):
+        response = MagicMock()
+        response.headers = {"Content-Length": str(len(content))}
+        response.read = io.BytesIO(content).read
+        response.__enter__.return_value = response
+        return response
+
+    mock_urlopen.side_effect = mock_open
+
+    # Call function
+    extractor = MultiFileTaxiDataExtractor(["https://mock.test/2019-01.csv"])
+    results = list(extractor.iter_results())
+
+    # Asserts
+    assert len(results) == 1
+    assert results[0][0] == "https://mock.test/2019-01.csv"
+    assert len(results[0][1]) == 2
+
+
+def test_iter_results_parse_error(tmp_path):
+    # Mock value
+    path = tmp_path / "broken.csv"
+    path.write_text("vendor_id\n1\n")
+
+    # Call function
+    extractor = MultiFileTaxiDataExtractor([str(path)])
+    with pytest.raises(KeyError, match="pickup_datetime"):
+        list(extractor.iter_results())
+
+
+@patch("src.utils.multi_file_extractor.urllib.request.urlopen")
+def test_iter_results_remote_without_size(mock_urlopen, mock_csv_data):
+    # Mocks
+    content = mock_csv_data.to_csv(index=False).encode()
+
+    def mock_open(request):
+        response = MagicMock()
+        response.headers = {}
+        response.read = io.BytesIO(content).read
+        response.__enter__.return_value = response
+        return response
+
+    mock_urlopen.side_effect = mock_open
+
+    # Call function
+    extractor = MultiFileTaxiDataExtractor(["https://mock.test/2019-01.csv"])
+    with patch.object(
+        _ByteBudget, "acquire", autospec=True, side_effect=_ByteBudget.acquire
+    ) as mock_acquire:
+        results = list(extractor.iter_results())
+
+    # Asserts
+    assert len(results[0][1]) == 2
+    assert [call.args[1] for call in mock_acquire.call_args_list] == [len(content)]
+
+
+def test_byte_budget_blocks_until_release():
+    # Parameters
+    budget = _ByteBudget(max_bytes=10)
+    budget.acquire(8)
+    acquired = threading.Event()
+
+    # Call function
+    thread = threading.Thread(target=lambda: (budget.acquire(5), acquired.set()))
+    thread.start()
+    time.sleep(0.05)
+    blocked = not acquired.is_set()
+    budget.release(8)
+    thread.join(timeout=1)
+
+    # Asserts
+    assert blocked
+    assert acquired.is_set()
+    assert budget.in_flight == 5
+
+
+def test_byte_budget_admits_oversized_when_empty():
+    # Call function
+    budget = _ByteBudget(max_bytes=10)
+    budget.acquire(100)
+
+    # Asserts
+    assert budget.in_flight == 100
+
+
+def test_byte_budget_cancel():
+    # Parameters
+    budget = _ByteBudget(max_bytes=10)
+    budget.acquire(10)
+
+    # Call function
+    budget.cancel()
+
+    # Asserts
+    with pytest.raises(CancelledError):
+        budget.acquire(1)
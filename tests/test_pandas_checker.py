@@ -1,10 +1,18 @@
 import pytest
+import numpy as np
 import pandas as pd
+import great_expectations as gx
+import great_expectations.expectations as gxe
 
 from enum import Enum
 from typing import Dict
 from unittest.mock import patch, MagicMock
-from src.great_expectations_checker.pandas_checker import GreatExpectationsPandasChecker
+from great_expectations.core import ExpectationValidationResult
+from src.great_expectations_checker.pandas_checker import (
+    GreatExpectationsPandasChecker,
+    VectorizedValidator,
+)
+from src.great_expectations_checker.context_cache import ContextCache
 
 
 class MockConfig(Enum):
@@ -17,6 +25,12 @@ class MockConfig(Enum):
     SUITE_NAME: str = "mock_suite"
 
 
+@pytest.fixture(autouse=True)
+def reset_context_cache():
+    yield
+    ContextCache.clear()
+
+
 @pytest.fixture
 def mock_config():
     return MockConfig
@@ -182,6 +196,7 @@ def test_create_expectations(
 def test_update_suite(mock_get_context, mock_df, mock_config):
     # Mocks
     mock_suite = MagicMock()
+    mock_suite.name = mock_config.SUITE_NAME.value
     mock_context_instance = MagicMock()
     mock_get_context.return_value = mock_context_instance
 
@@ -194,7 +209,259 @@ def test_update_suite(mock_get_context, mock_df, mock_config):
     # Asserts
     mock_context_instance.suites.add_or_update.assert_called_once_with(mock_suite)
     mock_context_instance.suites.save.assert_called_once_with(mock_suite)
-    mock_context_instance.build_data_docs.assert_called_once()
     mock_context_instance.suites.add_or_update.assert_called_once()
     mock_context_instance.suites.save.assert_called_once()
-    mock_context_instance.build_data_docs.assert_called_once()
+    mock_context_instance.build_data_docs.assert_not_called()
+    assert [page.name for page in result.docs.resource_identifiers] == [
+        mock_config.SUITE_NAME.value
+    ]
+
+
+@pytest.fixture
+def mock_dirty_df():
+    return pd.DataFrame(
+        {
+            "vendor_id": pd.array([1, None, 2, 1, 0, 2], dtype="Int8"),
+            "store_and_fwd_flag": pd.Categorical(["Y", "N", None, "X", "Y", "Z"]),
+            "payment_type": ["1", "2", None, "2", "5", "1"],
+            "total_amount": [20.3, np.nan, -1.0, 25.3, 0.0, 5.5],
+        }
+    )
+
+
+@pytest.fixture
+def mock_dirty_expectations():
+    return [
+        gxe.ExpectTableColumnsToMatchOrderedList(
+            column_list=["vendor_id", "payment_type", "store_and_fwd_flag"]
+        ),
+        gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"),
+        gxe.ExpectColumnValuesToNotBeNull(column="payment_type", mostly=0.8),
+        gxe.ExpectColumnValuesToBeBetween(column="vendor_id", min_value=1),
+        gxe.ExpectColumnValuesToBeBetween(
+            column="total_amount", min_value=0, max_value=25.3, strict_min=True
+        ),
+        gxe.ExpectColumnValuesToBeInSet(
+            column="store_and_fwd_flag", value_set=["Y", "N"], mostly=0.5
+        ),
+        gxe.ExpectColumnValuesToBeInSet(column="payment_type", value_set=["1", "2"]),
+        gxe.ExpectColumnMinToBeBetween(column="vendor_id", min_value=1),
+        gxe.ExpectColumnMaxToBeBetween(column="total_amount", max_value=30),
+        gxe.ExpectTableRowCountToBeBetween(min_value=1, max_value=10),
+        gxe.ExpectColumnValuesToBeOfType(column="vendor_id", type_="int8"),
+        gxe.ExpectColumnValuesToBeOfType(column="total_amount", type_="int"),
+    ]
+
+
+@pytest.mark.parametrize("parallel_rows", [1_000, 1])
+def test_vectorized_validator_matches_gx(
+    mock_dirty_df, mock_dirty_expectations, parallel_rows
+):
+    # Mocks
+    context = gx.get_context(mode="ephemeral")
+    suite = context.suites.add(
+        gx.ExpectationSuite(name="mock_suite", expectations=mock_dirty_expectations)
+    )
+    batch = (
+        context.data_sources.add_pandas("mock_source")
+        .add_dataframe_asset("mock_asset")
+        .add_batch_definition_whole_dataframe("mock_definition")
+        .get_batch(batch_parameters={"dataframe": mock_dirty_df})
+    )
+    expected = {
+        result.expectation_config.id: result for result in batch.validate(suite).results
+    }
+
+    # Call function
+    validator = VectorizedValidator(
+        mock_dirty_df, workers=2, parallel_rows=parallel_rows
+    )
+    results = validator.validate(suite.expectations)
+
+    # Asserts
+    assert all(validator.supports(e) for e in suite.expectations)
+    for result in results:
+        gx_result = expected[result.expectation_config.id]
+        assert result.success == gx_result.success
+        assert result.result == gx_result.result
+
+
+def test_vectorized_validator_supports(mock_dirty_df):
+    # Call function
+    validator = VectorizedValidator(mock_dirty_df)
+
+    # Asserts
+    assert validator.supports(gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"))
+    assert not validator.supports(gxe.ExpectColumnValuesToNotBeNull(column="missing"))
+    assert not validator.supports(gxe.ExpectColumnValuesToBeUnique(column="vendor_id"))
+    assert not validator.supports(
+        gxe.ExpectColumnValuesToBeBetween(column="payment_type", min_value="1")
+    )
+    assert not validator.supports(
+        gxe.ExpectColumnValuesToBeOfType(column="payment_type", type_="int")
+    )
+    assert not VectorizedValidator(
+        pd.DataFrame({"flag": pd.Series(["Y", "N"], dtype="string")})
+    ).supports(gxe.ExpectColumnValuesToBeOfType(column="flag", type_="str"))
+    assert not validator.supports(
+        gxe.ExpectColumnValuesToNotBeNull(
+            column="vendor_id",
+            row_condition='payment_type=="1"',
+            condition_parser="pandas",
+        )
+    )
+
+
+def test_run_fast_path(mock_get_context, mock_dirty_df, mock_config):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    unique = gxe.ExpectColumnValuesToBeUnique(column="vendor_id")
+    fallback_result = ExpectationValidationResult(
+        success=False, expectation_config=unique.configuration
+    )
+
+    # Call function
+    result = GreatExpectationsPandasChecker(mock_dirty_df, mock_config.CONTEXT_MODE)
+    result.data_source = MagicMock()
+    result.data_source.name = "mock_source"
+    result.data_asset = MagicMock()
+    result.data_asset.name = "mock_asset"
+    result.batch_definition = MagicMock()
+    result.batch_definition.name = "mock_definition"
+    result.batch_definition.get_batch.return_value.validate.return_value = (
+        fallback_result
+    )
+    result.suite = MagicMock()
+    result.suite.name = "mock_suite"
+    result.suite.expectations = [
+        unique,
+        gxe.ExpectTableRowCountToBeBetween(min_value=1, max_value=10),
+    ]
+    suite_result = result.run_fast_path()
+
+    # Asserts
+    assert suite_result.success is False
+    assert suite_result.results[0] is fallback_result
+    assert suite_result.results[1].success is True
+    assert suite_result.statistics["successful_expectations"] == 1
+    result.batch_definition.get_batch.assert_called_once_with(
+        batch_parameters={"dataframe": mock_dirty_df}
+    )
+    mock_context.validation_results_store.set.assert_called_once()
+    assert len(result.docs.resource_identifiers) == 1
+
+
+def test_run_sampled(mock_get_context, mock_dirty_df, mock_config):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    expectations = [
+        gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"),
+        gxe.ExpectColumnValuesToBeBetween(
+            column="total_amount", min_value=-5, mostly=0.1
+        ),
+        gxe.ExpectColumnValuesToBeInSet(
+            column="payment_type", value_set=["1", "2"], mostly=0.5
+        ),
+        gxe.ExpectTableRowCountToBeBetween(min_value=1, max_value=10),
+    ]
+
+    # Call function
+    result = GreatExpectationsPandasChecker(mock_dirty_df, mock_config.CONTEXT_MODE)
+    result.data_source = MagicMock()
+    result.data_source.name = "mock_source"
+    result.data_asset = MagicMock()
+    result.data_asset.name = "mock_asset"
+    result.batch_definition = MagicMock()
+    result.batch_definition.name = "mock_definition"
+    result.suite = MagicMock()
+    result.suite.name = "mock_suite"
+    result.suite.expectations = expectations
+    suite_result = result.run_sampled(percent=100, method="BERNOULLI", seed=1)
+
+    # Asserts
+    results = suite_result.results
+    assert [r.success for r in results] == [False, True, True, True]
+    assert results[0].result["details"]["sampled"] is True
+    assert results[1].result["details"]["sampled"] is True
+    assert results[2].result["details"]["escalated"] is True
+    assert "details" not in results[3].result
+    assert suite_result.meta["sampling"]["escalated"] == 1
+    result.batch_definition.get_batch.assert_not_called()
+    mock_context.validation_results_store.set.assert_called_once()
+
+
+def test_run_fast_path_result_format(mock_get_context, mock_dirty_df, mock_config):
+    # Mocks
+    expectations = [
+        gxe.ExpectColumnValuesToBeBetween(
+            column="total_amount", min_value=0, max_value=25.3, strict_min=True
+        ),
+        gxe.ExpectColumnValuesToBeBetween(
+            column="total_amount",
+            min_value=0,
+            max_value=25.3,
+            strict_min=True,
+            result_format={"result_format": "COMPLETE", "partial_unexpected_count": 1},
+        ),
+    ]
+
+    # Call function
+    result = GreatExpectationsPandasChecker(mock_dirty_df, mock_config.CONTEXT_MODE)
+    result.data_source = MagicMock()
+    result.data_source.name = "mock_source"
+    result.data_asset = MagicMock()
+    result.data_asset.name = "mock_asset"
+    result.batch_definition = MagicMock()
+    result.batch_definition.name = "mock_definition"
+    result.suite = MagicMock()
+    result.suite.name = "mock_suite"
+    result.suite.expectations = expectations
+    suite_result = result.run_fast_path(result_format="BOOLEAN_ONLY")
+
+    # Asserts
+    boolean_only, summary = suite_result.results
+    assert boolean_only.success is False
+    assert boolean_only.result == {}
+    assert summary.result["unexpected_count"] == 2
+    assert summary.result["partial_unexpected_list"] == [-1.0]
+    assert summary.result["partial_unexpected_index_list"] == [2]
+    assert summary.result["partial_unexpected_counts"] == [{"value": -1.0, "count": 1}]
+
+
+def test_unexpected_rows(mock_get_context, mock_dirty_df, mock_config):
+    # Mocks
+    expectation = gxe.ExpectColumnValuesToBeInSet(
+        column="store_and_fwd_flag", value_set=["Y", "N"]
+    )
+
+    # Call function
+    result = GreatExpectationsPandasChecker(mock_dirty_df, mock_config.CONTEXT_MODE)
+    first, after = result.unexpected_rows(expectation, limit=1)
+    second, last = result.unexpected_rows(expectation, after=after, limit=1)
+    by_amount, _ = result.unexpected_rows(expectation, key="total_amount")
+
+    # Asserts
+    assert first.index.tolist() == [3]
+    assert after == 3
+    assert second.index.tolist() == [5]
+    assert last is None
+    assert by_amount.index.tolist() == [5, 3]
+    with pytest.raises(ValueError):
+        result.unexpected_rows(gxe.ExpectTableRowCountToBeBetween(min_value=1))
+
+
+@patch("src.great_expectations_checker.pandas_checker.SAMPLE_BLOCK_ROWS", 10)
+def test_sample(mock_get_context, mock_config):
+    # Mocks
+    df = pd.DataFrame({"vendor_id": range(1000)})
+
+    # Call function
+    result = GreatExpectationsPandasChecker(df, mock_config.CONTEXT_MODE)
+    bernoulli = result._sample(50, "BERNOULLI", seed=1)
+    system = result._sample(50, "SYSTEM", seed=1)
+
+    # Asserts
+    assert 400 < len(bernoulli) < 600
+    assert 300 < len(system) < 700
+    assert (system["vendor_id"].groupby(system["vendor_id"] // 10).size() == 10).all()
+    assert result._sample(50, "BERNOULLI", seed=1).equals(bernoulli)
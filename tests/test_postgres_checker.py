@@ -1,13 +1,20 @@
 import pytest
 import pandas as pd
+import sqlalchemy as sa
 
 from enum import Enum
 from typing import Dict
 from unittest.mock import patch, MagicMock
 import great_expectations.expectations as gxe
+from sqlalchemy.dialects import postgresql
+from great_expectations.core import ExpectationValidationResult
+from great_expectations.exceptions import DataContextError
 from src.great_expectations_checker.postgres_checker import (
     GreatExpectationsPostgresChecker,
+    SqlPushdownCompiler,
 )
+from src.utils.engine_registry import EngineRegistry
+from src.great_expectations_checker.context_cache import ContextCache
 
 
 class MockConfig(Enum):
@@ -23,6 +30,12 @@ class MockConfig(Enum):
     SCHEMA: str = "mock_schema"
 
 
+@pytest.fixture(autouse=True)
+def reset_context_cache():
+    yield
+    ContextCache.clear()
+
+
 @pytest.fixture
 def mock_config():
     return MockConfig
@@ -48,13 +61,18 @@ def test_init(mock_get_context, mock_config):
     assert result.context == mock_get_context.return_value
 
 
-def test_set_data_source(mock_get_context, mock_config):
+@patch("src.great_expectations_checker.postgres_checker.SqlAlchemyExecutionEngine")
+@patch("src.great_expectations_checker.postgres_checker.EngineRegistry.get_engine")
+def test_set_data_source(
+    mock_registry_get_engine, mock_execution_engine, mock_get_context, mock_config
+):
     # Mocks
     mock_context = mock_get_context.return_value
     mock_context.data_sources = MagicMock()
 
     expected_value = MagicMock()
     mock_context.data_sources.add_or_update_postgres.return_value = expected_value
+    mock_engine = mock_registry_get_engine.return_value
 
     # Call function
     result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
@@ -63,31 +81,140 @@ def test_set_data_source(mock_get_context, mock_config):
     # Asserts
     assert result.context == mock_context
     mock_context.data_sources.add_or_update_postgres.assert_called_once_with(
-        name=mock_config.DATA_SOURCE, connection_string=mock_config.CONNECTION_STRING
+        name=mock_config.DATA_SOURCE,
+        connection_string=mock_config.CONNECTION_STRING,
+        kwargs=EngineRegistry.pool_options(),
     )
     assert result.data_source == expected_value
+    mock_registry_get_engine.assert_called_once_with(mock_config.CONNECTION_STRING)
+    mock_execution_engine.assert_called_once_with(
+        engine=mock_engine, data_context=mock_context
+    )
+    assert expected_value._engine is mock_engine
+    assert expected_value._execution_engine is mock_execution_engine.return_value
+
+
+@patch("src.great_expectations_checker.postgres_checker.SqlAlchemyExecutionEngine")
+@patch("src.great_expectations_checker.postgres_checker.EngineRegistry.get_engine")
+def test_set_data_source_stored(
+    mock_registry_get_engine, mock_execution_engine, mock_get_context, mock_config
+):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    stored = MagicMock(
+        connection_string=mock_config.CONNECTION_STRING.value,
+        kwargs=EngineRegistry.pool_options(),
+    )
+    mock_context.data_sources.get.return_value = stored
+
+    # Call function
+    result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
+    result.set_data_source(
+        mock_config.DATA_SOURCE.value, mock_config.CONNECTION_STRING.value
+    )
+
+    # Asserts
+    mock_context.data_sources.get.assert_called_once_with(mock_config.DATA_SOURCE.value)
+    mock_context.data_sources.add_or_update_postgres.assert_not_called()
+    assert result.data_source is stored
+    assert stored._engine is mock_registry_get_engine.return_value
+
+
+def test_share_engine(tmp_path):
+    # Mocks
+    connection_string = f"sqlite:///{tmp_path / 'stage.db'}"
+    engine = EngineRegistry.get_engine(connection_string)
+    with engine.begin() as conn:
+        conn.execute(sa.text("CREATE TABLE stg_taxi_data (vendor_id INTEGER)"))
+
+    # Call function
+    result = GreatExpectationsPostgresChecker("ephemeral")
+    result.data_source = result.context.data_sources.add_sqlite(
+        name="taxi", connection_string=connection_string
+    )
+    result._share_engine(engine)
+    before = EngineRegistry.stats(connection_string)["acquisitions"]
+    result.data_source.add_table_asset(
+        name="stg_taxi_data", table_name="stg_taxi_data"
+    ).add_batch_definition_whole_table("whole_table").get_batch().head()
+
+    # Asserts
+    assert result.data_source.get_engine() is engine
+    assert result.data_source.get_execution_engine().engine is engine
+    assert EngineRegistry.stats(connection_string)["acquisitions"] > before
+    EngineRegistry.dispose_all()
 
 
 def test_set_data_asset(mock_get_context, mock_config):
     # Mocks
     mock_data_source = MagicMock()
-    mock_data_source.add_or_update_postgres = MagicMock()
-    mock_get_context.data_sources.add_table_asset.return_value = mock_data_source
+    mock_data_source.get_asset_names.return_value = set()
 
     # Call function
     result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
     result.data_source = mock_data_source
     result.set_data_asset(
-        mock_config.DATA_ASSET, mock_config.TABLE_NAME, mock_config.SCHEMA
+        mock_config.DATA_ASSET.value,
+        mock_config.TABLE_NAME.value,
+        mock_config.SCHEMA.value,
     )
 
     # Asserts
     mock_data_source.add_table_asset.assert_called_once_with(
-        name=mock_config.DATA_ASSET,
-        table_name=mock_config.TABLE_NAME,
-        schema_name=mock_config.SCHEMA,
+        name="mock_data_asset_mock_table",
+        table_name=mock_config.TABLE_NAME.value,
+        schema_name=mock_config.SCHEMA.value,
     )
     assert result.data_asset == mock_data_source.add_table_asset.return_value
+    assert result.validation_definition_name == (
+        "mock_data_asset_mock_table validation definition"
+    )
+    assert result.checkpoint_name == "mock_data_asset_mock_table checkpoint"
+
+
+def test_set_data_asset_existing(mock_get_context, mock_config):
+    # Mocks
+    mock_data_source = MagicMock()
+    mock_data_source.get_asset_names.return_value = {"mock_data_asset_mock_table"}
+
+    # Call function
+    result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
+    result.data_source = mock_data_source
+    result.set_data_asset(
+        mock_config.DATA_ASSET.value,
+        mock_config.TABLE_NAME.value,
+        mock_config.SCHEMA.value,
+    )
+
+    # Asserts
+    mock_data_source.get_asset.assert_called_once_with("mock_data_asset_mock_table")
+    mock_data_source.add_table_asset.assert_not_called()
+    assert result.data_asset is mock_data_source.get_asset.return_value
+
+
+def test_drop_data_asset(mock_get_context, mock_config):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    mock_context.checkpoints.delete.side_effect = DataContextError("missing")
+
+    # Call function
+    result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
+    result.context = mock_context
+    result.data_source = MagicMock()
+    result.data_asset = MagicMock()
+    result.data_asset.name = "mock_data_asset_mock_table"
+    result.checkpoint_name = "mock checkpoint"
+    result.validation_definition_name = "mock validation definition"
+    result.drop_data_asset()
+
+    # Asserts
+    mock_context.checkpoints.delete.assert_called_once_with("mock checkpoint")
+    mock_context.validation_definitions.delete.assert_called_once_with(
+        "mock validation definition"
+    )
+    result.data_source.delete_asset.assert_called_once_with(
+        "mock_data_asset_mock_table"
+    )
 
 
 def test_set_batch_definition(mock_get_context, mock_config):
@@ -109,6 +236,28 @@ def test_set_batch_definition(mock_get_context, mock_config):
     )
 
 
+def test_set_partitioned_batch_definition(mock_get_context, mock_config):
+    # Mocks
+    mock_data_asset = MagicMock()
+    mock_data_asset.batch_definitions = []
+
+    # Call function
+    result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
+    result.data_asset = mock_data_asset
+    result.set_partitioned_batch_definition("mock_definition_monthly", "monthly")
+
+    # Asserts
+    mock_data_asset.add_batch_definition_monthly.assert_called_once_with(
+        "mock_definition_monthly", "pickup_datetime"
+    )
+    assert (
+        result.batch_definition
+        == mock_data_asset.add_batch_definition_monthly.return_value
+    )
+    with pytest.raises(ValueError):
+        result.set_partitioned_batch_definition("mock_definition", "hourly")
+
+
 def test_create_expectations(mock_get_context, mock_config):
     # Mocks
     mock_context = mock_get_context.return_value
@@ -133,6 +282,7 @@ def test_create_expectations(mock_get_context, mock_config):
 def test_update_suite(mock_get_context, mock_config):
     # Mocks
     mock_suite = MagicMock()
+    mock_suite.name = mock_config.SUITE_NAME.value
     mock_context_instance = MagicMock()
     mock_get_context.return_value = mock_context_instance
 
@@ -145,4 +295,360 @@ def test_update_suite(mock_get_context, mock_config):
     # Asserts
     mock_context_instance.suites.add_or_update.assert_called_once_with(mock_suite)
     mock_suite.save.assert_called_once()
-    mock_context_instance.build_data_docs.assert_called_once()
+    mock_context_instance.build_data_docs.assert_not_called()
+    assert [page.name for page in result.docs.resource_identifiers] == [
+        mock_config.SUITE_NAME.value
+    ]
+
+
+@patch("src.great_expectations_checker.postgres_checker.SqlAlchemyExecutionEngine")
+@patch("src.great_expectations_checker.postgres_checker.EngineRegistry.get_engine")
+def test_set_data_source_cached(
+    mock_registry_get_engine, mock_execution_engine, mock_get_context, mock_config
+):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    first = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
+    first.set_data_source(mock_config.DATA_SOURCE, mock_config.CONNECTION_STRING)
+
+    # Call function
+    result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
+    result.set_data_source(mock_config.DATA_SOURCE, mock_config.CONNECTION_STRING)
+
+    # Asserts
+    assert result.context is first.context
+    assert result.data_source is first.data_source
+    mock_get_context.assert_called_once()
+    mock_context.data_sources.add_or_update_postgres.assert_called_once()
+    mock_registry_get_engine.assert_called_once()
+
+
+def test_set_batch_definition_existing(mock_get_context, mock_config):
+    # Mocks
+    mock_definition = MagicMock()
+    mock_definition.name = mock_config.BATCH_DEFINITION
+
+    # Call function
+    result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
+    result.data_asset = MagicMock(batch_definitions=[mock_definition])
+    result.set_batch_definition(mock_config.BATCH_DEFINITION)
+
+    # Asserts
+    result.data_asset.add_batch_definition_whole_table.assert_not_called()
+    result.data_asset.get_batch_definition.assert_called_once_with(
+        mock_config.BATCH_DEFINITION
+    )
+
+
+@pytest.fixture
+def mock_taxi_table(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'mock.db'}")
+    pd.DataFrame(
+        {
+            "vendor_id": [1, 2, None, 2, 7],
+            "passenger_count": [1, 0, 3, None, 6],
+            "store_and_fwd_flag": ["Y", "N", "X", None, "Y"],
+        }
+    ).to_sql("stg_taxi_data", engine, index=False)
+    return engine
+
+
+def test_sql_pushdown_compiler(mock_taxi_table):
+    # Mocks
+    table = sa.Table("stg_taxi_data", sa.MetaData(), autoload_with=mock_taxi_table)
+    compiler = SqlPushdownCompiler(table, "sqlite")
+    expectations = [
+        gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"),
+        gxe.ExpectColumnValuesToBeBetween(
+            column="passenger_count", min_value=1, max_value=5
+        ),
+        gxe.ExpectColumnValuesToBeBetween(
+            column="passenger_count", min_value=1, strict_min=True, mostly=0.2
+        ),
+        gxe.ExpectColumnValuesToBeInSet(
+            column="store_and_fwd_flag", value_set=["Y", "N"]
+        ),
+        gxe.ExpectColumnValuesToBeOfType(column="vendor_id", type_="FLOAT"),
+        gxe.ExpectColumnValuesToBeOfType(column="store_and_fwd_flag", type_="Integer"),
+        gxe.ExpectColumnMaxToBeBetween(column="passenger_count", max_value=5),
+        gxe.ExpectColumnMinToBeBetween(column="passenger_count", min_value=0),
+        gxe.ExpectTableRowCountToBeBetween(min_value=1, max_value=10),
+    ]
+
+    # Call function
+    with mock_taxi_table.connect() as connection:
+        row = connection.execute(compiler.compile(expectations)).mappings().one()
+    results = compiler.evaluate(expectations, row)
+
+    # Asserts
+    assert [result.success for result in results] == [
+        False,
+        False,
+        True,
+        False,
+        True,
+        False,
+        False,
+        True,
+        True,
+    ]
+    assert results[0].result["unexpected_count"] == 1
+    assert results[1].result["unexpected_count"] == 2
+    assert results[1].result["missing_count"] == 1
+    assert results[1].result["unexpected_percent"] == 50.0
+    assert results[3].result["unexpected_count"] == 1
+    assert results[4].result["observed_value"] == "FLOAT"
+    assert results[6].result["observed_value"] == 6.0
+    assert results[8].result["observed_value"] == 5
+
+
+def test_sql_pushdown_compiler_supports(mock_taxi_table):
+    # Mocks
+    table = sa.Table("stg_taxi_data", sa.MetaData(), autoload_with=mock_taxi_table)
+    compiler = SqlPushdownCompiler(table, "sqlite")
+
+    # Asserts
+    assert compiler.supports(gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"))
+    assert not compiler.supports(gxe.ExpectColumnValuesToNotBeNull(column="missing"))
+    assert not compiler.supports(gxe.ExpectColumnValuesToBeUnique(column="vendor_id"))
+    assert not compiler.supports(
+        gxe.ExpectColumnValuesToNotBeNull(
+            column="vendor_id",
+            row_condition='col("passenger_count") > 1',
+            condition_parser="great_expectations",
+        )
+    )
+
+
+def test_run_pushdown(mock_get_context, mock_config, mock_taxi_table):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    unique = gxe.ExpectColumnValuesToBeUnique(column="vendor_id")
+    fallback_result = ExpectationValidationResult(
+        success=False, expectation_config=unique.configuration
+    )
+
+    # Call function
+    result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
+    result.data_source = MagicMock()
+    result.data_source.name = "mock_source"
+    result.data_source.get_engine.return_value = mock_taxi_table
+    result.data_asset = MagicMock(table_name="stg_taxi_data", schema_name=None)
+    result.data_asset.name = "mock_asset"
+    result.batch_definition = MagicMock()
+    result.batch_definition.name = "mock_definition"
+    result.batch_definition.get_batch.return_value.validate.return_value = (
+        fallback_result
+    )
+    result.suite = MagicMock()
+    result.suite.name = "mock_suite"
+    result.suite.expectations = [
+        unique,
+        gxe.ExpectTableRowCountToBeBetween(min_value=1, max_value=10),
+    ]
+    suite_result = result.run_pushdown()
+
+    # Asserts
+    assert suite_result.success is False
+    assert suite_result.results[0] is fallback_result
+    assert suite_result.results[1].success is True
+    assert suite_result.statistics["successful_expectations"] == 1
+    assert suite_result.meta["batch_spec"]["table_name"] == "stg_taxi_data"
+    result.batch_definition.get_batch.return_value.validate.assert_called_once_with(
+        unique,
+        result_format={"result_format": "SUMMARY", "partial_unexpected_count": 20},
+    )
+    mock_context.validation_results_store.set.assert_called_once()
+    assert len(result.docs.resource_identifiers) == 1
+
+
+def test_sql_pushdown_compiler_sample(mock_taxi_table):
+    # Mocks
+    table = sa.Table("stg_taxi_data", sa.MetaData(), autoload_with=mock_taxi_table)
+    compiler = SqlPushdownCompiler(table, "postgresql")
+    expectations = [gxe.ExpectColumnValuesToNotBeNull(column="vendor_id")]
+
+    # Call function
+    query = compiler.compile(expectations, compiler.sample("BERNOULLI", 2.5, seed=7))
+    sql = str(
+        query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    # Asserts
+    assert (
+        "FROM stg_taxi_data AS sample TABLESAMPLE bernoulli(2.5) REPEATABLE (7)" in sql
+    )
+    assert "count(sample.vendor_id)" in sql
+
+
+def test_run_sampled(mock_get_context, mock_config, mock_taxi_table, caplog):
+    # Mocks
+    mock_context = mock_get_context.return_value
+    expectations = [
+        gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"),
+        gxe.ExpectColumnValuesToBeBetween(
+            column="passenger_count", min_value=0, max_value=10, mostly=0.1
+        ),
+        gxe.ExpectColumnValuesToBeInSet(
+            column="store_and_fwd_flag", value_set=["Y", "N"], mostly=0.5
+        ),
+        gxe.ExpectTableRowCountToBeBetween(min_value=1, max_value=10),
+    ]
+
+    # Call function
+    result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
+    result.data_source = MagicMock()
+    result.data_source.name = "mock_source"
+    result.data_source.get_engine.return_value = mock_taxi_table
+    result.data_asset = MagicMock(table_name="stg_taxi_data", schema_name=None)
+    result.data_asset.name = "mock_asset"
+    result.batch_definition = MagicMock()
+    result.batch_definition.name = "mock_definition"
+    result.suite = MagicMock()
+    result.suite.name = "mock_suite"
+    result.suite.expectations = expectations
+    # SQLite has no TABLESAMPLE: the "sample" is the whole table.
+    with patch.object(SqlPushdownCompiler, "sample", lambda self, *args: self.table):
+        suite_result = result.run_sampled(percent=10, method="SYSTEM")
+
+    # Asserts
+    results = suite_result.results
+    assert [r.success for r in results] == [False, True, True, True]
+    assert results[0].result["details"]["sampled"] is True
+    assert results[1].result["details"]["method"] == "SYSTEM"
+    assert results[2].result["details"]["escalated"] is True
+    assert "details" not in results[3].result
+    assert suite_result.meta["sampling"]["escalated"] == 1
+    assert suite_result.meta["run_id"]["run_name"] == "sql_sampled"
+    assert "intervals are too narrow" in caplog.text
+    mock_context.validation_results_store.set.assert_called_once()
+
+
+def test_sql_pushdown_compiler_unexpected_rows(mock_taxi_table):
+    # Mocks
+    table = sa.Table("stg_taxi_data", sa.MetaData(), autoload_with=mock_taxi_table)
+    compiler = SqlPushdownCompiler(table, "postgresql")
+
+    # Call function
+    query = compiler.unexpected_rows(
+        gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"),
+        "passenger_count",
+        after=(3, "(0,5)"),
+        limit=50,
+    )
+    sql = str(
+        query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    # Asserts
+    assert "WHERE stg_taxi_data.vendor_id IS NULL" in sql
+    assert "AND (stg_taxi_data.passenger_count, ctid) > (3, '(0,5)')" in sql
+    assert "ctid AS _row_id" in sql
+    assert "ORDER BY stg_taxi_data.passenger_count, ctid" in sql
+    assert "LIMIT 51" in sql
+    with pytest.raises(ValueError):
+        compiler.unexpected_rows(
+            gxe.ExpectTableRowCountToBeBetween(min_value=1), "passenger_count"
+        )
+    with pytest.raises(ValueError):
+        compiler.unexpected_rows(
+            gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"), "missing"
+        )
+    with pytest.raises(ValueError):
+        SqlPushdownCompiler(table, "mssql").unexpected_rows(
+            gxe.ExpectColumnValuesToNotBeNull(column="vendor_id"), "passenger_count"
+        )
+
+
+def test_unexpected_rows(mock_get_context, mock_config, mock_taxi_table):
+    # Mocks
+    expectation = gxe.ExpectColumnValuesToBeBetween(
+        column="passenger_count", min_value=1, max_value=5
+    )
+
+    # Call function
+    result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
+    result.data_source = MagicMock()
+    result.data_source.get_engine.return_value = mock_taxi_table
+    result.data_asset = MagicMock(table_name="stg_taxi_data", schema_name=None)
+    first, after = result.unexpected_rows(expectation, "passenger_count", limit=1)
+    second, last = result.unexpected_rows(
+        expectation, "passenger_count", after=after, limit=1
+    )
+
+    # Asserts
+    assert first == [{"vendor_id": 2, "passenger_count": 0, "store_and_fwd_flag": "N"}]
+    assert after == (0, 2)
+    assert [row["passenger_count"] for row in second] == [6]
+    assert last is None
+
+
+def test_unexpected_rows_repeated_key(mock_get_context, mock_config, mock_taxi_table):
+    # Mocks
+    expectation = gxe.ExpectColumnValuesToBeInSet(
+        column="store_and_fwd_flag", value_set=["N"]
+    )
+
+    # Call function
+    result = GreatExpectationsPostgresChecker(mock_config.CONTEXT_MODE)
+    result.data_source = MagicMock()
+    result.data_source.get_engine.return_value = mock_taxi_table
+    result.data_asset = MagicMock(table_name="stg_taxi_data", schema_name=None)
+    pages, after = [], None
+    while True:
+        rows, after = result.unexpected_rows(
+            expectation, "store_and_fwd_flag", after=after, limit=1
+        )
+        pages.append(rows)
+        if after is None:
+            break
+
+    # Asserts
+    assert [[row["vendor_id"] for row in rows] for rows in pages] == [
+        [None],
+        [1],
+        [7],
+    ]
+
+
+def test_overlapping_runs_validate_own_tables(tmp_path, monkeypatch):
+    # Mocks
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(ContextCache, "config_dir", tmp_path / "gx")
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'stage.db'}")
+    with engine.begin() as conn:
+        for table_name in ("stg_1", "stg_2"):
+            conn.execute(sa.text(f"CREATE TABLE {table_name} (vendor_id INTEGER)"))
+    context = ContextCache.get_context("file")
+    context.data_sources.add_sqlite(
+        name="taxi", connection_string=f"sqlite:///{tmp_path / 'stage.db'}"
+    )
+
+    def prepare(table_name: str) -> GreatExpectationsPostgresChecker:
+        checker = GreatExpectationsPostgresChecker("file")
+        checker.data_source = checker.context.data_sources.get("taxi")
+        checker.set_data_asset("stg_taxi_data", table_name, None)
+        checker.set_batch_definition("whole_table")
+        checker.set_suite("taxi_suite")
+        checker.create_expectations()
+        return checker
+
+    # Call function
+    checkers = [prepare("stg_1"), prepare("stg_2")]
+    results = [checker.run_checkpoint("local_site") for checker in checkers]
+    for checker in checkers:
+        checker.drop_data_asset()
+
+    # Asserts
+    validated = [
+        next(iter(result.run_results.values())).meta["batch_spec"]["table_name"]
+        for result in results
+    ]
+    assert validated == ["stg_1", "stg_2"]
+    assert context.data_sources.get("taxi").get_asset_names() == set()
+    assert context.checkpoints.all() == []
+    assert context.validation_definitions.all() == []
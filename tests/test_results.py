@@ -0,0 +1,233 @@
+import pytest
+import great_expectations.expectations as gxe
+
+from great_expectations.core import ExpectationValidationResult
+from src.great_expectations_checker.results import (
+    PartialMetrics,
+    bound_result,
+    bounded_result_format,
+    decide_sampled,
+    map_result,
+    mostly_success,
+    suite_result,
+    widest_result_format,
+    wilson_interval,
+    within_bounds,
+)
+
+
+def _sample_result(expectation, element_count, nonnull_count, unexpected_count):
+    return ExpectationValidationResult(
+        success=True,
+        expectation_config=expectation.configuration,
+        result=map_result(element_count, nonnull_count, unexpected_count),
+    )
+
+
+def test_wilson_interval():
+    # Call function
+    low, high = wilson_interval(50, 1000, 0.95)
+    small_low, small_high = wilson_interval(5, 100, 0.95)
+
+    # Asserts
+    assert low < 0.05 < high
+    assert small_low < low and high < small_high
+    assert wilson_interval(0, 1000, 0.95)[0] == 0.0
+    assert wilson_interval(1000, 1000, 0.95)[1] == 1.0
+    assert wilson_interval(0, 0, 0.95) == (0.0, 1.0)
+
+
+def test_decide_sampled():
+    # Mocks
+    mostly = gxe.ExpectColumnValuesToBeInSet(
+        column="store_and_fwd_flag", value_set=["Y", "N"], mostly=0.9
+    )
+    strict = gxe.ExpectColumnValuesToNotBeNull(column="vendor_id")
+    sampling = {"method": "BERNOULLI", "percent": 1.0}
+
+    # Call function
+    passed, details = decide_sampled(
+        _sample_result(mostly, 1000, 1000, 10), 0.95, sampling
+    )
+    failed, _ = decide_sampled(_sample_result(strict, 1000, 999, 1), 0.95, sampling)
+    close, close_details = decide_sampled(
+        _sample_result(mostly, 1000, 1000, 95), 0.95, sampling
+    )
+    unproven, _ = decide_sampled(_sample_result(strict, 1000, 1000, 0), 0.95, sampling)
+
+    # Asserts
+    assert passed.success is True
+    assert passed.result["details"]["sampled"] is True
+    assert passed.result["details"]["method"] == "BERNOULLI"
+    assert details["unexpected_rate_interval"][1] < 0.1
+    assert failed.success is False
+    assert close is None
+    assert close_details["unexpected_rate_interval"][0] < 0.1
+    assert unproven is None
+
+
+def test_map_result():
+    # Call function
+    result = map_result(10, 8, 2, ["X", "X"], partial_unexpected_index_list=[3, 7])
+    not_null = map_result(10, 10, 2, [None, None], nulls_are_unexpected=True)
+
+    # Asserts
+    assert result["unexpected_percent"] == 25.0
+    assert result["missing_count"] == 2
+    assert result["unexpected_percent_total"] == 20.0
+    assert result["partial_unexpected_counts"] == [{"value": "X", "count": 2}]
+    assert not_null["unexpected_percent"] == 20.0
+    assert "missing_count" not in not_null
+
+
+@pytest.mark.parametrize(
+    "observed, kwargs, expected",
+    [
+        (5, {"min_value": 5}, True),
+        (5, {"min_value": 5, "strict_min": True}, False),
+        (11, {"max_value": 10}, False),
+        (None, {"min_value": 0}, False),
+    ],
+)
+def test_within_bounds(observed, kwargs, expected):
+    # Asserts
+    assert within_bounds(observed, kwargs) is expected
+
+
+def test_mostly_success():
+    # Asserts
+    assert mostly_success(1, 10, {"mostly": 0.9}) is True
+    assert mostly_success(1, 10, {}) is False
+    assert mostly_success(0, 0, {}) is True
+
+
+def test_partial_metrics_merge():
+    # Mocks
+    first = PartialMetrics(3, 2, 1, 1.0, 5.0, ["int8"], ["X"], [2])
+    second = PartialMetrics(2, 2, 1, -1.0, 4.0, ["int8", "float32"], ["Z"], [4])
+
+    # Call function
+    result = first.merge(second)
+
+    # Asserts
+    assert (result.element_count, result.nonnull_count) == (5, 4)
+    assert result.unexpected_count == 2
+    assert (result.minimum, result.maximum) == (-1.0, 5.0)
+    assert result.observed == ["int8", "float32"]
+    assert result.partial_unexpected_list == ["X", "Z"]
+    assert result.partial_unexpected_index_list == [2, 4]
+
+
+def test_suite_result():
+    # Mocks
+    expectation = gxe.ExpectColumnValuesToNotBeNull(column="vendor_id")
+    results = [
+        ExpectationValidationResult(
+            success=success, expectation_config=expectation.configuration
+        )
+        for success in (True, False)
+    ]
+
+    # Call function
+    result = suite_result(results, "mock_suite", meta={"mock_key": "mock_value"})
+
+    # Asserts
+    assert result.success is False
+    assert result.statistics["success_percent"] == 50.0
+    assert result.meta["mock_key"] == "mock_value"
+
+
+def test_bounded_result_format():
+    # Call function
+    complete = bounded_result_format(
+        {
+            "result_format": "COMPLETE",
+            "partial_unexpected_count": 1000,
+            "include_unexpected_rows": True,
+            "unexpected_index_column_names": ["vendor_id"],
+        }
+    )
+
+    # Asserts
+    assert complete == {
+        "result_format": "SUMMARY",
+        "partial_unexpected_count": 20,
+        "unexpected_index_column_names": ["vendor_id"],
+    }
+    assert bounded_result_format() == {
+        "result_format": "SUMMARY",
+        "partial_unexpected_count": 20,
+    }
+    assert bounded_result_format("basic")["result_format"] == "BASIC"
+    with pytest.raises(ValueError):
+        bounded_result_format("VERBOSE")
+
+
+def test_widest_result_format():
+    # Mocks
+    run_format = bounded_result_format("BOOLEAN_ONLY")
+    configurations = [
+        gxe.ExpectColumnValuesToNotBeNull(column="vendor_id").configuration,
+        gxe.ExpectColumnValuesToNotBeNull(
+            column="vendor_id",
+            result_format={"result_format": "BASIC", "partial_unexpected_count": 5},
+        ).configuration,
+    ]
+
+    # Call function
+    widest = widest_result_format(run_format, configurations)
+
+    # Asserts
+    assert widest == {"result_format": "BASIC", "partial_unexpected_count": 20}
+
+
+def test_bound_result():
+    # Mocks
+    expectation = gxe.ExpectColumnValuesToBeBetween(column="fare_amount", min_value=0)
+    details = {
+        **map_result(
+            10, 10, 3, [-1.0, -2.0, -1.0], partial_unexpected_index_list=[0, 4, 7]
+        ),
+        "unexpected_list": [-1.0, -2.0, -1.0],
+        "unexpected_index_list": [0, 4, 7],
+    }
+    summary = ExpectationValidationResult(
+        success=False,
+        expectation_config=expectation.configuration,
+        result=dict(details),
+    )
+    basic = ExpectationValidationResult(
+        success=False,
+        expectation_config=expectation.configuration,
+        result=dict(details),
+    )
+    boolean_only = ExpectationValidationResult(
+        success=False,
+        expectation_config=expectation.configuration,
+        result=dict(details),
+    )
+
+    # Call function
+    trimmed = bound_result(
+        summary, {"result_format": "SUMMARY", "partial_unexpected_count": 2}
+    )
+    bound_result(basic, {"result_format": "BASIC", "partial_unexpected_count": 20})
+    bound_result(
+        boolean_only, {"result_format": "BOOLEAN_ONLY", "partial_unexpected_count": 20}
+    )
+
+    # Asserts
+    assert trimmed is True
+    assert summary.result["partial_unexpected_list"] == [-1.0, -2.0]
+    assert summary.result["partial_unexpected_index_list"] == [0, 4]
+    assert summary.result["partial_unexpected_counts"] == [
+        {"value": -2.0, "count": 1},
+        {"value": -1.0, "count": 1},
+    ]
+    assert "unexpected_list" not in summary.result
+    assert "partial_unexpected_counts" not in basic.result
+    assert basic.result["unexpected_count"] == 3
+    assert boolean_only.result == {}
+    assert not bound_result(
+        summary, {"result_format": "SUMMARY", "partial_unexpected_count": 2}
+    )
@@ -0,0 +1,145 @@
+import pytest
+import sqlalchemy as sa
+
+from datetime import datetime, timedelta, timezone
+from src.utils.load_manifest import LoadManifest
+from src.utils.staging_table import StagingTableManager
+
+
+@pytest.fixture
+def mock_engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'mock.db'}")
+
+    @sa.event.listens_for(engine, "connect")
+    def attach_schema(dbapi_connection, connection_record):
+        dbapi_connection.execute(f"ATTACH DATABASE '{tmp_path / 'stage'}.db' AS stage")
+
+    return engine
+
+
+@pytest.fixture
+def mock_staging(mock_engine):
+    return StagingTableManager(
+        mock_engine, ddl_path="scripts/create_stage_taxi_data_table.sql"
+    )
+
+
+def table_names(engine):
+    return sa.inspect(engine).get_table_names(schema="stage")
+
+
+def test_table_name(mock_staging):
+    # Parameters
+    created_at = datetime(2024, 1, 1, 6, 30, tzinfo=timezone.utc)
+
+    # Call function
+    result = mock_staging.table_name(
+        "scheduled__2024-01-01T00:00:00+00:00" * 3, created_at
+    )
+
+    # Asserts
+    assert result.startswith("stg_taxi_data_20240101063000_scheduled__2024_01_01t00")
+    assert len(result) == 63
+
+
+def test_new_run_id():
+    # Call function
+    result = {StagingTableManager.new_run_id() for _ in range(10)}
+
+    # Asserts
+    assert len(result) == 10
+    assert all(len(run_id) == 8 for run_id in result)
+
+
+def test_create_uses_ddl_columns(mock_staging, mock_engine):
+    # Call function
+    result = mock_staging.create("run1")
+
+    # Asserts
+    assert result in table_names(mock_engine)
+    columns = sa.inspect(mock_engine).get_columns(result, schema="stage")
+    assert [column["name"] for column in columns][:3] == [
+        "vendor_id",
+        "pickup_datetime",
+        "dropoff_datetime",
+    ]
+    assert len(columns) == 19
+    assert not columns[0]["nullable"]
+
+
+def test_create_runs_do_not_collide(mock_staging, mock_engine):
+    # Call function
+    first = mock_staging.create("run1")
+    second = mock_staging.create("run2")
+
+    # Asserts
+    assert first != second
+    assert {first, second} <= set(table_names(mock_engine))
+
+
+def test_create_resumes_run(mock_staging, mock_engine):
+    # Mocks
+    earlier = mock_staging.table_name(
+        "run1", datetime.now(timezone.utc) - timedelta(hours=1)
+    )
+    with mock_engine.begin() as connection:
+        connection.execute(sa.text(f'CREATE TABLE stage."{earlier}" (a INT)'))
+    other = mock_staging.create("run10")
+
+    # Call function
+    result = mock_staging.create("run1")
+
+    # Asserts
+    assert result == earlier
+    assert mock_staging.find("run10") == other
+    assert mock_staging.find("run2") is None
+
+
+def test_create_missing_ddl(mock_engine, tmp_path):
+    # Mocks
+    ddl_path = tmp_path / "empty.sql"
+    ddl_path.write_text("CREATE SCHEMA stage;")
+    staging = StagingTableManager(mock_engine, ddl_path=str(ddl_path))
+
+    # Asserts
+    with pytest.raises(ValueError, match="No CREATE TABLE statement"):
+        staging.create("run1")
+
+
+def test_drop(mock_staging, mock_engine):
+    # Mocks
+    table_name = mock_staging.create("run1")
+
+    # Call function
+    mock_staging.drop(table_name)
+
+    # Asserts
+    assert table_name not in table_names(mock_engine)
+
+
+def test_cleanup_orphans(mock_staging, mock_engine):
+    # Mocks
+    old = mock_staging.table_name("old", datetime.now(timezone.utc) - timedelta(days=2))
+    with mock_engine.begin() as connection:
+        connection.execute(sa.text(f'CREATE TABLE stage."{old}" (a INT)'))
+        connection.execute(sa.text("CREATE TABLE stage.unrelated_table (a INT)"))
+    current = mock_staging.create("current")
+    manifests = [LoadManifest(table, mock_engine) for table in (old, current)]
+    with mock_engine.begin() as connection:
+        for manifest in manifests:
+            manifest.record(connection, 0, 0, 10, "hash_0")
+
+    # Call function
+    result = mock_staging.cleanup_orphans()
+
+    # Asserts
+    assert result == [old]
+    assert set(table_names(mock_engine)) == {
+        current,
+        "unrelated_table",
+        "load_manifest",
+    }
+    assert [manifest.committed() for manifest in manifests] == [
+        {},
+        {0: (0, 10, "hash_0")},
+    ]
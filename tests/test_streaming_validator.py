@@ -0,0 +1,117 @@
+import pytest
+import numpy as np
+import pandas as pd
+import great_expectations.expectations as gxe
+
+from src.great_expectations_checker.pandas_checker import VectorizedValidator
+from src.great_expectations_checker.streaming_validator import StreamingValidator
+
+
+@pytest.fixture
+def mock_chunks():
+    df = pd.DataFrame(
+        {
+            "vendor_id": pd.array([1, 2, 1, 0, 2, None, 1], dtype="Int8"),
+            "store_and_fwd_flag": pd.Categorical(["Y", "N", "X", "Y", None, "N", "Y"]),
+            "total_amount": [20.3, np.nan, -1.0, 25.3, 0.0, 5.5, 3.0],
+        }
+    )
+    return [df.iloc[:3], df.iloc[3:5], df.iloc[5:]]
+
+
+@pytest.fixture
+def mock_expectations():
+    return [
+        gxe.ExpectTableColumnsToMatchOrderedList(
+            column_list=["vendor_id", "store_and_fwd_flag", "total_amount"]
+        ),
+        gxe.ExpectColumnValuesToBeOfType(column="vendor_id", type_="int8"),
+        gxe.ExpectColumnValuesToNotBeNull(column="vendor_id", severity="warning"),
+        gxe.ExpectColumnValuesToBeInSet(
+            column="store_and_fwd_flag", value_set=["Y", "N"], mostly=0.5
+        ),
+        gxe.ExpectColumnValuesToBeBetween(
+            column="total_amount", min_value=0, severity="warning"
+        ),
+        gxe.ExpectColumnMinToBeBetween(
+            column="vendor_id", min_value=1, severity="warning"
+        ),
+        gxe.ExpectColumnMaxToBeBetween(column="total_amount", max_value=30),
+        gxe.ExpectTableRowCountToBeBetween(min_value=1, max_value=10),
+    ]
+
+
+def test_streaming_validator_merges_chunks(mock_chunks, mock_expectations):
+    # Mocks
+    expected = VectorizedValidator(pd.concat(mock_chunks)).validate(mock_expectations)
+
+    # Call function
+    validator = StreamingValidator(mock_expectations, suite_name="mock_suite")
+    chunks = list(validator.iter_validated(iter(mock_chunks)))
+    result = validator.result()
+
+    # Asserts
+    assert len(chunks) == 3
+    assert result.suite_name == "mock_suite"
+    assert result.meta["chunks"] == 3
+    assert result.success is False
+    for streamed, whole in zip(result.results, expected):
+        assert streamed.success == whole.success
+        assert streamed.result == whole.result
+
+
+def test_streaming_validator_hard_failure(mock_chunks):
+    # Mocks
+    loaded = []
+
+    # Call function
+    validator = StreamingValidator(
+        [gxe.ExpectColumnValuesToNotBeNull(column="vendor_id")]
+    )
+    with pytest.raises(ValueError, match="Hard failure in chunk 2"):
+        for chunk in validator.iter_validated(iter(mock_chunks)):
+            loaded.append(chunk)
+
+    # Asserts
+    assert len(loaded) == 2
+
+
+def test_streaming_validator_schema_mismatch(mock_chunks):
+    # Mocks
+    chunks = [mock_chunks[0], mock_chunks[1].rename(columns={"total_amount": "fare"})]
+
+    # Call function
+    validator = StreamingValidator(
+        [
+            gxe.ExpectTableColumnsToMatchOrderedList(
+                column_list=["vendor_id", "store_and_fwd_flag", "total_amount"]
+            )
+        ]
+    )
+
+    # Asserts
+    with pytest.raises(ValueError, match="Hard failure in chunk 1"):
+        list(validator.iter_validated(iter(chunks)))
+
+
+def test_streaming_validator_row_count_exceeded(mock_chunks):
+    # Call function
+    validator = StreamingValidator(
+        [gxe.ExpectTableRowCountToBeBetween(min_value=1, max_value=4)]
+    )
+    validator.update(mock_chunks[0])
+
+    # Asserts
+    with pytest.raises(ValueError, match="expect_table_row_count_to_be_between"):
+        validator.update(mock_chunks[1])
+
+
+def test_streaming_validator_unsupported(mock_chunks):
+    # Call function
+    validator = StreamingValidator(
+        [gxe.ExpectColumnValuesToBeUnique(column="vendor_id")]
+    )
+
+    # Asserts
+    with pytest.raises(ValueError, match="cannot be validated by streaming"):
+        validator.update(mock_chunks[0])
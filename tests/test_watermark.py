@@ -0,0 +1,63 @@
+import json
+import pytest
+import pandas as pd
+import sqlalchemy as sa
+
+from src.utils.watermark import WatermarkStore
+
+
+@pytest.fixture
+def mock_store(tmp_path):
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text("CREATE TABLE taxi_data (pickup_datetime TIMESTAMP)")
+        )
+    return WatermarkStore(engine, path=str(tmp_path / "watermark.json"), schema="main")
+
+
+def insert(store, *values):
+    with store.engine.begin() as connection:
+        for value in values:
+            connection.execute(
+                sa.text("INSERT INTO taxi_data VALUES (:value)"), {"value": value}
+            )
+
+
+def test_get_empty_table(mock_store):
+    # Call function
+    result = mock_store.get()
+
+    # Asserts
+    assert result is None
+    assert json.loads(mock_store.path.read_text()) == {
+        "main.taxi_data.pickup_datetime": None
+    }
+
+
+def test_get_queries_then_caches(mock_store):
+    # Mocks
+    insert(mock_store, "2019-01-05 06:36:51", "2019-01-31 23:59:59")
+
+    # Call function
+    first = mock_store.get()
+    insert(mock_store, "2019-02-01 00:00:00")
+    second = mock_store.get()
+
+    # Asserts
+    assert first == pd.Timestamp("2019-01-31 23:59:59")
+    assert second == first
+
+
+def test_refresh(mock_store):
+    # Mocks
+    insert(mock_store, "2019-01-05 06:36:51")
+    mock_store.get()
+    insert(mock_store, "2019-02-01 00:00:00")
+
+    # Call function
+    result = mock_store.refresh()
+
+    # Asserts
+    assert result == pd.Timestamp("2019-02-01 00:00:00")
+    assert mock_store.get() == result